@@ -1,5 +1,6 @@
 """Statistics Orphan Finder integration."""
 import logging
+from datetime import timedelta
 from pathlib import Path
 
 from homeassistant.config_entries import ConfigEntry
@@ -7,6 +8,9 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.components import frontend
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.json import json_bytes
 from aiohttp import web
 
 from .const import (
@@ -19,11 +23,34 @@ from .const import (
     ERROR_MESSAGES,
 )
 from .coordinator import StatisticsOrphanCoordinator
+from .services.session_manager import SESSION_CLEANUP_INTERVAL
+from .services.entity_page_index import (
+    DEFAULT_PAGE_LIMIT,
+    FILTER_FIELDS,
+    MAX_PAGE_LIMIT,
+    SORT_DIRECTIONS,
+    EntityPageIndex,
+)
+from .services.message_histogram import MAX_HISTOGRAM_HOURS, validate_histogram_request
+from .services.sql_generator import MAX_BULK_SQL_ENTITIES
+from .services.noisy_entities import (
+    DEFAULT_NOISY_LIMIT,
+    DEFAULT_NOISY_WINDOW,
+    MAX_NOISY_LIMIT,
+    NOISY_RANK_KEYS,
+    NOISY_WINDOWS,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS = []
 
+# Number of entities serialized per chunk when streaming NDJSON responses
+NDJSON_BATCH_SIZE = 500
+
+# Response formats supported by entity_storage_overview_step
+RESPONSE_FORMATS = {"json", "ndjson"}
+
 
 def categorize_error(exception: Exception) -> tuple[str, str]:
     """Categorize an exception and return (category, user_message).
@@ -65,6 +92,93 @@ def categorize_error(exception: Exception) -> tuple[str, str]:
     return (ERROR_CATEGORY_UNKNOWN, ERROR_MESSAGES[ERROR_CATEGORY_UNKNOWN])
 
 
+async def stream_ndjson_overview(request, result: dict) -> web.StreamResponse:
+    """Stream a finalized overview as newline-delimited JSON.
+
+    The first line holds everything except the entity list (summary, cache
+    info) plus the entity count. Each following line is one entity. Entities
+    are serialized and written in batches of NDJSON_BATCH_SIZE so only one
+    batch of encoded output is held in memory and the client can render rows
+    before the last one is written.
+
+    Args:
+        request: aiohttp request being answered
+        result: Step 8 result with 'entities' and 'summary'
+
+    Returns:
+        The completed stream response
+    """
+    entities = result.get('entities', [])
+    header = {key: value for key, value in result.items() if key != 'entities'}
+    header['total_entities'] = len(entities)
+
+    response = web.StreamResponse(status=200)
+    response.content_type = "application/x-ndjson"
+    await response.prepare(request)
+
+    await response.write(json_bytes(header) + b"\n")
+    for start in range(0, len(entities), NDJSON_BATCH_SIZE):
+        batch = entities[start:start + NDJSON_BATCH_SIZE]
+        await response.write(b"".join(json_bytes(entity) + b"\n" for entity in batch))
+
+    await response.write_eof()
+    return response
+
+
+async def stream_overview_events(request, events) -> web.StreamResponse:
+    """Stream overview progress and the final result as server-sent events.
+
+    Emits one "progress" event per completed step, then a single "result"
+    event with the finalized overview. Errors raised while the pipeline runs
+    are sent as an "error" event because the status line is already out.
+    A client that disconnects ends the stream quietly; the events generator
+    is always closed so its cleanup runs right away.
+
+    Args:
+        request: aiohttp request being answered
+        events: Async iterator of (event_name, payload) from the coordinator
+
+    Returns:
+        The completed stream response
+    """
+    response = web.StreamResponse(status=200)
+    response.content_type = "text/event-stream"
+    response.headers["Cache-Control"] = "no-cache"
+    await response.prepare(request)
+
+    try:
+        while True:
+            try:
+                event, payload = await anext(events)
+            except StopAsyncIteration:
+                break
+            except Exception as err:
+                _LOGGER.error("Error streaming entity storage overview: %s", err, exc_info=True)
+                error_category, error_message = categorize_error(err)
+                await _write_event(response, "error", {"error": error_message, "error_category": error_category})
+                break
+            await _write_event(response, event, payload)
+
+        await response.write_eof()
+    except ConnectionResetError:
+        # aiohttp raises this (ClientConnectionResetError on newer releases) on
+        # writes after the browser went away; there is nobody left to tell
+        _LOGGER.debug("Client disconnected from entity storage overview stream")
+    finally:
+        await events.aclose()
+
+    return response
+
+
+async def _write_event(response: web.StreamResponse, event: str, payload: dict) -> None:
+    """Write one server-sent event.
+
+    Raises:
+        ConnectionResetError: If the client has disconnected
+    """
+    await response.write(b"event: " + event.encode() + b"\ndata: " + json_bytes(payload) + b"\n\n")
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Statistics Orphan Finder component."""
     hass.data.setdefault(DOMAIN, {})
@@ -90,6 +204,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         "view": view,
     }
 
+    # Invalidate cached overview when entities are added/removed/renamed
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            coordinator.async_handle_entity_registry_updated,
+        )
+    )
+
+    # Expire abandoned sessions and enforce the session memory budget
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            coordinator.async_cleanup_sessions,
+            timedelta(seconds=SESSION_CLEANUP_INTERVAL),
+        )
+    )
+
+    # Reload when options change so the coordinator picks up new settings
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
     # Copy frontend files to www synchronously
     def copy_frontend_file():
         www_path = Path(hass.config.path("www/community/statistics_orphan_finder"))
@@ -157,6 +291,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload config entry after options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info("Unloading Statistics Orphan Finder integration")
@@ -225,8 +364,8 @@ class StatisticsOrphanView(HomeAssistantView):
             return entry_data.get("coordinator")
         return None
 
-    async def get(self, request):
-        """Handle GET request."""
+    def _check_request(self, request) -> StatisticsOrphanCoordinator | web.Response:
+        """Return the coordinator, or an error response if the request can't be served."""
         # Verify admin access (critical security check)
         if not request["hass_user"].is_admin:
             return web.json_response({"error": "Admin access required"}, status=403)
@@ -248,20 +387,93 @@ class StatisticsOrphanView(HomeAssistantView):
                 status=503
             )
 
+        return coordinator
+
+    async def post(self, request):
+        """Handle POST request (actions whose input is too large for a query string)."""
+        coordinator = self._check_request(request)
+        if isinstance(coordinator, web.Response):
+            return coordinator
+
+        action = request.query.get("action")
+
+        if action == "generate_bulk_delete_sql":
+            try:
+                body = await request.json()
+            except ValueError:
+                return web.json_response({"error": "Request body must be JSON"}, status=400)
+
+            entity_ids = body.get("entity_ids") if isinstance(body, dict) else None
+            if (
+                not isinstance(entity_ids, list)
+                or not entity_ids
+                or not all(isinstance(entity_id, str) for entity_id in entity_ids)
+            ):
+                return web.json_response({"error": "entity_ids must be a non-empty list"}, status=400)
+            if len(entity_ids) > MAX_BULK_SQL_ENTITIES:
+                return web.json_response(
+                    {"error": f"At most {MAX_BULK_SQL_ENTITIES} entity_ids per request"},
+                    status=400
+                )
+
+            # Validate entity_id format (domain.entity)
+            invalid = [entity_id for entity_id in entity_ids if len(entity_id.split(".")) != 2]
+            if invalid:
+                return web.json_response(
+                    {"error": f"Invalid entity_id format (must be domain.entity): {invalid[0]}"},
+                    status=400
+                )
+
+            try:
+                result = await coordinator.async_generate_bulk_delete_sql(entity_ids)
+                return web.json_response(result)
+            except Exception as err:
+                # Categorize error and provide actionable message
+                _LOGGER.error("Error generating bulk SQL for %d entities: %s", len(entity_ids), err, exc_info=True)
+                error_category, error_message = categorize_error(err)
+                return web.json_response({
+                    "error": error_message,
+                    "error_category": error_category
+                }, status=500)
+
+        return web.json_response({"error": "Invalid action"}, status=400)
+
+    async def get(self, request):
+        """Handle GET request."""
+        coordinator = self._check_request(request)
+        if isinstance(coordinator, web.Response):
+            return coordinator
+
         action = request.query.get("action")
 
         if action == "database_size":
-            db_size = await coordinator.async_get_database_size()
+            # Row counts come from engine statistics unless exact=true
+            exact = request.query.get("exact", "false").lower() == "true"
+            db_size = await coordinator.async_get_database_size(exact=exact)
             return web.json_response(db_size)
 
+        elif action == "entity_storage_overview":
+            # Whole pipeline in one request, progress pushed as server-sent events
+            force_refresh = request.query.get("force_refresh", "false").lower() == "true"
+            return await stream_overview_events(
+                request, coordinator.async_stream_overview(force_refresh=force_refresh)
+            )
+
         elif action == "entity_storage_overview_step":
             # New action for step-by-step fetching with session isolation
             step_param = request.query.get("step")
             session_id = request.query.get("session_id")  # Optional for step 0, required for 1-8
+            response_format = request.query.get("format", "json")
 
             if not step_param:
                 return web.json_response({"error": "Missing step parameter"}, status=400)
 
+            if response_format not in RESPONSE_FORMATS:
+                return web.json_response(
+                    {"error": f"Invalid format. Must be one of: {', '.join(sorted(RESPONSE_FORMATS))}"},
+                    status=400
+                )
+
             try:
                 step = int(step_param)
                 # Validate step range (0-8 as per architecture)
@@ -278,8 +490,18 @@ class StatisticsOrphanView(HomeAssistantView):
                         status=400
                     )
 
-                result = await coordinator.async_execute_overview_step(step, session_id)
-                return web.json_response(result)
+                # Bypass the cached overview (only meaningful for step 0)
+                force_refresh = request.query.get("force_refresh", "false").lower() == "true"
+
+                # Run steps 1-5 concurrently (only meaningful for step 1)
+                parallel = request.query.get("parallel", "false").lower() == "true"
+
+                if step == 1 and parallel:
+                    result = await coordinator.async_execute_parallel_steps(session_id)
+                else:
+                    result = await coordinator.async_execute_overview_step(
+                        step, session_id, force_refresh=force_refresh
+                    )
             except ValueError as err:
                 # Sanitize error message for client (log full error server-side)
                 _LOGGER.warning("Invalid parameter in step %s: %s", step_param, err)
@@ -294,6 +516,69 @@ class StatisticsOrphanView(HomeAssistantView):
                     "error_category": error_category
                 }, status=500)
 
+            # Stream the (large) final entity list when requested
+            if response_format == "ndjson" and 'entities' in result:
+                return await stream_ndjson_overview(request, result)
+
+            return web.json_response(result)
+
+        elif action == "entities_page":
+            # Paged, sorted and filtered slice of the last finalized overview
+            try:
+                offset = int(request.query.get("offset", "0"))
+                limit = int(request.query.get("limit", str(DEFAULT_PAGE_LIMIT)))
+            except ValueError:
+                return web.json_response({"error": "offset and limit must be integers"}, status=400)
+
+            if offset < 0 or not 1 <= limit <= MAX_PAGE_LIMIT:
+                return web.json_response(
+                    {"error": f"offset must be >= 0 and limit between 1 and {MAX_PAGE_LIMIT}"},
+                    status=400
+                )
+
+            direction = request.query.get("direction", "asc")
+            if direction not in SORT_DIRECTIONS:
+                return web.json_response(
+                    {"error": f"Invalid direction. Must be one of: {', '.join(SORT_DIRECTIONS)}"},
+                    status=400
+                )
+
+            try:
+                sort_key = EntityPageIndex.normalize_sort_key(request.query.get("sort", "entity_id"))
+            except ValueError:
+                return web.json_response({"error": "Invalid sort key"}, status=400)
+
+            filters = {
+                field: request.query[field]
+                for field in FILTER_FIELDS
+                if request.query.get(field)
+            }
+
+            try:
+                page = await coordinator.async_get_entities_page(
+                    offset, limit, sort_key, direction, filters, request.query.get("search")
+                )
+            except ValueError as err:
+                # Sanitize error message for client
+                _LOGGER.warning("Invalid parameters for entities page: %s", err)
+                return web.json_response({"error": "Invalid parameters provided"}, status=400)
+            except Exception as err:
+                # Categorize error and provide actionable message
+                _LOGGER.error("Error building entities page: %s", err, exc_info=True)
+                error_category, error_message = categorize_error(err)
+                return web.json_response({
+                    "error": error_message,
+                    "error_category": error_category
+                }, status=500)
+
+            if page is None:
+                return web.json_response(
+                    {"error": "No overview available yet. Run entity_storage_overview_step first."},
+                    status=404
+                )
+
+            return web.json_response(page)
+
         elif action == "entity_message_histogram":
             entity_id = request.query.get("entity_id")
             hours = request.query.get("hours", "24")
@@ -326,6 +611,75 @@ class StatisticsOrphanView(HomeAssistantView):
                     "error_category": error_category
                 }, status=500)
 
+        elif action == "entity_message_histograms":
+            # Batched histograms, e.g. for every row of a visible table page
+            entity_ids = [
+                entity_id.strip()
+                for entity_id in request.query.get("entity_ids", "").split(",")
+                if entity_id.strip()
+            ]
+
+            try:
+                bucket_seconds = int(request.query.get("bucket", "3600"))
+                hours = int(request.query.get("hours", "24"))
+            except ValueError:
+                return web.json_response({"error": "bucket and hours must be integers"}, status=400)
+
+            try:
+                validate_histogram_request(entity_ids, bucket_seconds, hours)
+            except ValueError as err:
+                return web.json_response({"error": str(err), "max_hours": MAX_HISTOGRAM_HOURS}, status=400)
+
+            try:
+                histograms = await coordinator.async_get_message_histograms(entity_ids, bucket_seconds, hours)
+                return web.json_response(histograms)
+            except Exception as err:
+                # Categorize error and provide actionable message
+                _LOGGER.error("Error fetching message histograms: %s", err, exc_info=True)
+                error_category, error_message = categorize_error(err)
+                return web.json_response({
+                    "error": error_message,
+                    "error_category": error_category
+                }, status=500)
+
+        elif action == "noisy_entities":
+            # Top-K entities by write rate or bytes written
+            window = request.query.get("window", DEFAULT_NOISY_WINDOW)
+            if window not in NOISY_WINDOWS:
+                return web.json_response(
+                    {"error": f"Invalid window. Must be one of: {', '.join(NOISY_WINDOWS)}"},
+                    status=400
+                )
+
+            rank_by = request.query.get("rank_by", "writes")
+            if rank_by not in NOISY_RANK_KEYS:
+                return web.json_response(
+                    {"error": f"Invalid rank_by. Must be one of: {', '.join(NOISY_RANK_KEYS)}"},
+                    status=400
+                )
+
+            try:
+                limit = int(request.query.get("limit", str(DEFAULT_NOISY_LIMIT)))
+            except ValueError:
+                return web.json_response({"error": "limit must be an integer"}, status=400)
+            if not 1 <= limit <= MAX_NOISY_LIMIT:
+                return web.json_response(
+                    {"error": f"limit must be between 1 and {MAX_NOISY_LIMIT}"},
+                    status=400
+                )
+
+            try:
+                ranking = await coordinator.async_get_noisy_entities(window, limit, rank_by)
+                return web.json_response(ranking)
+            except Exception as err:
+                # Categorize error and provide actionable message
+                _LOGGER.error("Error ranking noisy entities: %s", err, exc_info=True)
+                error_category, error_message = categorize_error(err)
+                return web.json_response({
+                    "error": error_message,
+                    "error_category": error_category
+                }, status=500)
+
         elif action == "generate_delete_sql":
             origin = request.query.get("origin")
             entity_id = request.query.get("entity_id")
@@ -348,24 +702,17 @@ class StatisticsOrphanView(HomeAssistantView):
             try:
                 in_states_meta = request.query.get("in_states_meta", "false").lower() == "true"
                 in_statistics_meta = request.query.get("in_statistics_meta", "false").lower() == "true"
+                # Attribute states bytes from real column lengths (sampled)
+                precise = request.query.get("precise", "false").lower() == "true"
 
-                sql = coordinator.generate_delete_sql(
+                result = await coordinator.async_generate_delete_sql(
                     entity_id=entity_id,
                     origin=origin,
                     in_states_meta=in_states_meta,
-                    in_statistics_meta=in_statistics_meta
+                    in_statistics_meta=in_statistics_meta,
+                    precise=precise
                 )
-                storage_saved = coordinator._calculate_entity_storage(
-                    entity_id=entity_id,
-                    origin=origin,
-                    in_states_meta=in_states_meta,
-                    in_statistics_meta=in_statistics_meta
-                )
-
-                return web.json_response({
-                    "sql": sql,
-                    "storage_saved": storage_saved
-                })
+                return web.json_response(result)
             except ValueError as err:
                 # Sanitize error message for client
                 _LOGGER.warning("Invalid parameters for SQL generation: %s", err)
@@ -4,11 +4,22 @@ import voluptuous as vol
 from typing import Any
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 import homeassistant.helpers.config_validation as cv
 
-from .const import DOMAIN, CONF_DB_URL, CONF_USERNAME, CONF_PASSWORD
+from .const import (
+    DOMAIN,
+    CONF_DB_URL,
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    CONF_OVERVIEW_CACHE_TTL,
+    CONF_SESSION_MEMORY_BUDGET,
+    CONF_SESSION_SPILL_TO_DISK,
+    DEFAULT_OVERVIEW_CACHE_TTL,
+    DEFAULT_SESSION_MEMORY_BUDGET,
+    DEFAULT_SESSION_SPILL_TO_DISK,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,6 +66,14 @@ class StatisticsOrphanFinderConfigFlow(config_entries.ConfigFlow, domain=DOMAIN)
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return StatisticsOrphanFinderOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -85,3 +104,36 @@ class StatisticsOrphanFinderConfigFlow(config_entries.ConfigFlow, domain=DOMAIN)
             data_schema=data_schema,
             errors=errors,
         )
+
+
+class StatisticsOrphanFinderOptionsFlow(config_entries.OptionsFlow):
+    """Handle options for Statistics Orphan Finder."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._entry.options
+        data_schema = vol.Schema({
+            vol.Optional(
+                CONF_OVERVIEW_CACHE_TTL,
+                default=options.get(CONF_OVERVIEW_CACHE_TTL, DEFAULT_OVERVIEW_CACHE_TTL),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+            vol.Optional(
+                CONF_SESSION_MEMORY_BUDGET,
+                default=options.get(CONF_SESSION_MEMORY_BUDGET, DEFAULT_SESSION_MEMORY_BUDGET),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=4096)),
+            vol.Optional(
+                CONF_SESSION_SPILL_TO_DISK,
+                default=options.get(CONF_SESSION_SPILL_TO_DISK, DEFAULT_SESSION_SPILL_TO_DISK),
+            ): bool,
+        })
+
+        return self.async_show_form(step_id="init", data_schema=data_schema)
@@ -6,6 +6,29 @@ CONF_DB_URL = "db_url"
 CONF_USERNAME = "username"
 CONF_PASSWORD = "password"
 
+# Options
+CONF_OVERVIEW_CACHE_TTL = "overview_cache_ttl"
+
+CONF_SESSION_MEMORY_BUDGET = "session_memory_budget"
+CONF_SESSION_SPILL_TO_DISK = "session_spill_to_disk"
+
+# Seconds a finalized overview is served from cache (0 disables caching)
+DEFAULT_OVERVIEW_CACHE_TTL = 300
+
+# Megabytes of step data kept in memory across sessions (0 disables the budget).
+# A 30,000-entity session holds about 50 MB after step 6, so two concurrent
+# sessions of a large installation fit with headroom.
+DEFAULT_SESSION_MEMORY_BUDGET = 128
+
+# Spill idle sessions over the budget to a temporary file instead of dropping
+# them, so a further tab slows the evicted session down instead of failing it
+DEFAULT_SESSION_SPILL_TO_DISK = True
+
+# Pooled connections to a remote recorder database. The parallel overview
+# steps run at most this many reads at once across all sessions, so they
+# never queue on the pool timeout.
+DB_POOL_SIZE = 5
+
 # Error categories for actionable error messages
 ERROR_CATEGORY_DB_CONNECTION = "DB_CONNECTION"
 ERROR_CATEGORY_DB_PERMISSION = "DB_PERMISSION"
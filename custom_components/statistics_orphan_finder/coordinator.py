@@ -1,19 +1,48 @@
 """DataUpdateCoordinator for Statistics Orphan Finder."""
+import asyncio
+import hashlib
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any
+from functools import partial
+from typing import Any, AsyncIterator, Callable
 
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
-from .const import DOMAIN
+from .const import (
+    CONF_DB_URL,
+    CONF_OVERVIEW_CACHE_TTL,
+    CONF_SESSION_MEMORY_BUDGET,
+    CONF_SESSION_SPILL_TO_DISK,
+    DB_POOL_SIZE,
+    DEFAULT_OVERVIEW_CACHE_TTL,
+    DEFAULT_SESSION_MEMORY_BUDGET,
+    DEFAULT_SESSION_SPILL_TO_DISK,
+    DOMAIN,
+)
 from .services import DatabaseService, StorageCalculator, SqlGenerator, SessionManager, EntityRepository, RegistryAdapter
 from .services.entity_analyzer import EntityAnalyzer
+from .services.entity_page_index import EntityPageIndex
+from .services.histogram_cache import HistogramCache
+from .services.message_histogram import get_message_histograms
+from .services.noisy_entities import rank_noisy_entities
+from .services.registry_adapter import RegistrySnapshot
+from .services.single_flight import SingleFlight
+from .services.overview_snapshot import (
+    OverviewSnapshot,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Overview steps whose database reads are independent and can run concurrently
+PARALLEL_STEPS = (1, 2, 3, 4, 5)
+
 
 class StatisticsOrphanCoordinator(DataUpdateCoordinator):
     """Coordinator to fetch orphaned statistics entities."""
@@ -31,11 +60,45 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
         # Initialize service modules
         self.db_service = DatabaseService(hass, entry)
         self.storage_calculator = StorageCalculator(entry)
-        self.sql_generator = SqlGenerator(entry)
-        self.session_manager = SessionManager()
+        self.sql_generator = SqlGenerator(entry, on_delete_generated=self._invalidate_deleted_metadata)
+        self.session_manager = SessionManager(
+            memory_budget=entry.options.get(
+                CONF_SESSION_MEMORY_BUDGET, DEFAULT_SESSION_MEMORY_BUDGET
+            ) * 1024 * 1024,
+            spill_to_disk=entry.options.get(
+                CONF_SESSION_SPILL_TO_DISK, DEFAULT_SESSION_SPILL_TO_DISK
+            ),
+        )
         self.entity_repository = EntityRepository()
         self.registry_adapter = RegistryAdapter(hass)
 
+        # Concurrent sessions share in-flight database reads of steps 1-5
+        self._single_flight = SingleFlight()
+
+        # Parallel step reads of all sessions together stay within the pool
+        self._parallel_query_slots = asyncio.Semaphore(DB_POOL_SIZE)
+
+        # Closed message histogram buckets, so repeated hovers only count new ones
+        self.histogram_cache = HistogramCache()
+
+        # Persistent incremental snapshot of per-entity aggregates (steps 2, 4, 5)
+        db_source = hashlib.sha256(entry.data[CONF_DB_URL].encode()).hexdigest()[:16]
+        self.overview_snapshot = OverviewSnapshot(db_source)
+        self._snapshot_store: Store = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.overview_snapshot"
+        )
+        self._snapshot_loaded = False
+
+        # Cache of the last finalized overview (step 8 result)
+        self._overview_cache_ttl: int = entry.options.get(
+            CONF_OVERVIEW_CACHE_TTL, DEFAULT_OVERVIEW_CACHE_TTL
+        )
+        self._overview_cache: dict[str, Any] | None = None
+        self._overview_cache_time: float = 0.0
+
+        # Paged view over the last finalized entity list (entities_page action)
+        self._entity_page_index: EntityPageIndex | None = None
+
         # Shutdown flag to prevent processing requests during unload
         self._is_shutting_down = False
 
@@ -54,17 +117,71 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
             hours: Time range in hours (24, 48, or 168)
 
         Returns:
-            Dictionary with hourly_counts, total_messages, and time_range_hours
+            Dictionary with hourly_counts, total_messages, time_range_hours
+            and cache_stats of the histogram cache
+        """
+        def _fetch():
+            engine = self._get_engine()
+            histogram = EntityAnalyzer.get_hourly_message_counts(
+                engine, entity_id, hours, self.histogram_cache
+            )
+            histogram['cache_stats'] = self.histogram_cache.stats()
+            return histogram
+
+        return await self.hass.async_add_executor_job(_fetch)
+
+    async def async_get_message_histograms(
+        self, entity_ids: list[str], bucket_seconds: int, hours: int
+    ) -> dict[str, Any]:
+        """Get message counts per bucket for several entities in one query.
+
+        Args:
+            entity_ids: Entity IDs to analyze
+            bucket_seconds: Bucket size in seconds (see HISTOGRAM_BUCKET_SIZES)
+            hours: Time range in hours
+
+        Returns:
+            Dictionary with per-entity histograms, the covered range and
+            cache_stats of the histogram cache
         """
         def _fetch():
             engine = self._get_engine()
-            return EntityAnalyzer.get_hourly_message_counts(engine, entity_id, hours)
+            histograms = get_message_histograms(
+                engine, entity_ids, bucket_seconds, hours, cache=self.histogram_cache
+            )
+            histograms['cache_stats'] = self.histogram_cache.stats()
+            return histograms
 
         return await self.hass.async_add_executor_job(_fetch)
 
-    async def async_get_database_size(self) -> dict[str, Any]:
-        """Get database size information."""
-        result = await self.db_service.async_get_database_size()
+    async def async_get_noisy_entities(self, window: str, limit: int, rank_by: str) -> dict[str, Any]:
+        """Rank the entities writing the most states over a recent window.
+
+        Identical requests arriving while one is running share its scan.
+
+        Args:
+            window: Window name (see NOISY_WINDOWS)
+            limit: Number of entities to return
+            rank_by: "writes" or "bytes"
+
+        Returns:
+            Dictionary with the top entities, projected growth and window totals
+        """
+        def _fetch():
+            return self._single_flight.do(
+                ('noisy_entities', window, limit, rank_by),
+                rank_noisy_entities, self._get_engine(), window, limit, rank_by
+            )
+
+        return await self.hass.async_add_executor_job(_fetch)
+
+    async def async_get_database_size(self, exact: bool = False) -> dict[str, Any]:
+        """Get database size information.
+
+        Args:
+            exact: Count rows exactly instead of using engine estimates.
+        """
+        result = await self.db_service.async_get_database_size(exact)
 
         # Add cached version (read once during __init__)
         result["version"] = self._version
@@ -77,7 +194,8 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
         origin: str,
         in_states_meta: bool = False,
         in_statistics_meta: bool = False,
-        metadata_id_statistics: int | None = None
+        metadata_id_statistics: int | None = None,
+        precise: bool = False
     ) -> int:
         """Calculate estimated storage size for an entity's data.
 
@@ -87,10 +205,12 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
             in_states_meta: Whether entity is in states_meta table
             in_statistics_meta: Whether entity is in statistics_meta table
             metadata_id_statistics: Optional metadata_id for statistics (if known)
+            precise: Measure states bytes from column lengths (sampled)
         """
         engine = self._get_engine()
         return self.storage_calculator.calculate_entity_storage(
-            engine, entity_id, origin, in_states_meta, in_statistics_meta, metadata_id_statistics
+            engine, entity_id, origin, in_states_meta, in_statistics_meta, metadata_id_statistics,
+            precise=precise
         )
 
     def generate_delete_sql(
@@ -115,14 +235,95 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
             engine, entity_id, origin, in_states_meta, in_statistics_meta, metadata_id_statistics
         )
 
-    def _init_step_data(self, session_id: str | None = None):
+    async def async_generate_delete_sql(
+        self,
+        entity_id: str,
+        origin: str,
+        in_states_meta: bool = False,
+        in_statistics_meta: bool = False,
+        precise: bool = False
+    ) -> dict[str, Any]:
+        """Generate delete SQL and the storage it frees in the executor.
+
+        The storage estimate reads the states table (sampled per entity when
+        precise), so neither query may run on the event loop.
+
+        Args:
+            entity_id: The entity_id to delete
+            origin: Origin indicator (States, Short-term, Long-term, Both, States+Statistics)
+            in_states_meta: Whether entity is in states_meta table
+            in_statistics_meta: Whether entity is in statistics_meta table
+            precise: Measure states bytes from column lengths (sampled)
+
+        Returns:
+            Dictionary with sql and storage_saved
+        """
+        def _generate():
+            return {
+                'sql': self.generate_delete_sql(
+                    entity_id=entity_id,
+                    origin=origin,
+                    in_states_meta=in_states_meta,
+                    in_statistics_meta=in_statistics_meta
+                ),
+                'storage_saved': self._calculate_entity_storage(
+                    entity_id=entity_id,
+                    origin=origin,
+                    in_states_meta=in_states_meta,
+                    in_statistics_meta=in_statistics_meta,
+                    precise=precise
+                ),
+            }
+
+        return await self.hass.async_add_executor_job(_generate)
+
+    async def async_generate_bulk_delete_sql(self, entity_ids: list[str]) -> dict[str, Any]:
+        """Generate batched set-based DELETE statements for many entities.
+
+        Args:
+            entity_ids: Entity IDs to delete
+
+        Returns:
+            Dictionary with the batched SQL, batch counts and missing entity_ids
+        """
+        return await self.hass.async_add_executor_job(
+            self.sql_generator.generate_bulk_delete_sql, self._get_engine(), entity_ids
+        )
+
+    def _invalidate_deleted_metadata(self, states_ids: list[int], statistics_ids: list[int]) -> None:
+        """Stop trusting cached aggregates of metadata_ids that delete SQL was generated for.
+
+        Runs in the executor thread that generated the SQL. The snapshot
+        recounts these ids exactly for a while and the histogram cache stops
+        caching their buckets, since the SQL is executed by hand at some
+        later point; the snapshot save is scheduled on the loop so the
+        marks survive a restart made to run it (see
+        _async_save_invalidated_snapshot).
+
+        Args:
+            states_ids: states_meta metadata_ids
+            statistics_ids: statistics_meta ids
+        """
+        self.overview_snapshot.invalidate('states', states_ids)
+        self.overview_snapshot.invalidate('statistics', statistics_ids)
+        self.overview_snapshot.invalidate('statistics_short_term', statistics_ids)
+        self.histogram_cache.invalidate(states_ids)
+        self.hass.add_job(self._async_save_invalidated_snapshot)
+
+    def _init_step_data(self, session_id: str | None = None, force_refresh: bool = False):
         """Initialize step data for step-by-step fetching.
 
+        If a finalized overview is cached and still fresh, the new session is
+        bound to it: steps 1-7 return immediately and step 8 returns the
+        cached result. Clients can skip straight to step 8 when the response
+        reports cached=True.
+
         Args:
             session_id: Optional session ID. If None, creates a new session.
+            force_refresh: Ignore and drop the cached overview.
 
         Returns:
-            Dictionary with status, total_steps, and session_id
+            Dictionary with status, total_steps, session_id and cache info
         """
         # Create new session (auto-cleans stale sessions)
         if session_id is None:
@@ -132,15 +333,73 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
             if not self.session_manager.validate_session(session_id):
                 session_id = self.session_manager.create_session()
 
-        return {'status': 'initialized', 'total_steps': 8, 'session_id': session_id}
+        if force_refresh:
+            self.invalidate_overview_cache()
+
+        cached = self._get_cached_overview()
+        if cached is None:
+            return {'status': 'initialized', 'total_steps': 8, 'session_id': session_id, 'cached': False}
+
+        result, cached_at = cached
+        self.session_manager.get_session_data(session_id)['cached_overview'] = (result, cached_at)
+        return {
+            'status': 'initialized',
+            'total_steps': 8,
+            'session_id': session_id,
+            'cached': True,
+            'cache_age_seconds': int(time.time() - cached_at),
+        }
+
+    def _get_cached_overview(self) -> tuple[dict[str, Any], float] | None:
+        """Return (result, cached_at) if a fresh finalized overview is cached."""
+        if self._overview_cache is None or self._overview_cache_ttl <= 0:
+            return None
+        if time.time() - self._overview_cache_time > self._overview_cache_ttl:
+            self._overview_cache = None
+            return None
+        return self._overview_cache, self._overview_cache_time
+
+    def invalidate_overview_cache(self) -> None:
+        """Drop the cached finalized overview and the page index built from it."""
+        if self._overview_cache is not None:
+            _LOGGER.debug("Invalidating cached overview")
+        self._overview_cache = None
+        self._entity_page_index = None
+
+    @callback
+    def async_handle_entity_registry_updated(self, event: Event) -> None:
+        """Invalidate the cached overview when the entity registry changes."""
+        self.invalidate_overview_cache()
+
+    def _serve_cached_step(self, step: int, session_id: str) -> dict[str, Any]:
+        """Answer a step for a session bound to the cached overview.
+
+        Args:
+            step: Step number (1-8)
+            session_id: Session bound to a cached overview in step 0
+
+        Returns:
+            Step result; step 8 returns the cached overview with its age
+        """
+        result, cached_at = self.session_manager.get_session_data(session_id)['cached_overview']
+        if step < 8:
+            self.session_manager.update_timestamp(session_id)
+            return {'status': 'complete', 'cached': True}
+
+        self.session_manager.delete_session(session_id)
+        return {**result, 'cached': True, 'cache_age_seconds': int(time.time() - cached_at)}
 
     def _fetch_step_1_states_meta(self, session_id: str) -> dict[str, Any]:
         """Step 1: Fetch states_meta entities."""
         engine = self._get_engine()
-        step_data = self.session_manager.get_session_data(session_id)
 
         # Fetch entity IDs from repository
-        entity_ids = self.entity_repository.fetch_states_meta(engine)
+        entity_ids = self._parallel_step_queries(engine)[1]()
+        return self._merge_step_1_states_meta(session_id, entity_ids)
+
+    def _merge_step_1_states_meta(self, session_id: str, entity_ids: set[str]) -> dict[str, Any]:
+        """Merge step 1 results into the session entity_map."""
+        step_data = self.session_manager.get_session_data(session_id)
 
         # Update session data
         for entity_id in entity_ids:
@@ -153,10 +412,17 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
     def _fetch_step_2_states(self, session_id: str) -> dict[str, Any]:
         """Step 2: Fetch states with counts and update frequencies (batched for performance)."""
         engine = self._get_engine()
-        step_data = self.session_manager.get_session_data(session_id)
 
         # Fetch states data and frequency data from repository
-        states_data, frequency_data = self.entity_repository.fetch_states_with_counts(engine)
+        states_result = self._parallel_step_queries(engine)[2]()
+        return self._merge_step_2_states(session_id, states_result)
+
+    def _merge_step_2_states(
+        self, session_id: str, states_result: tuple[dict[str, Any], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Merge step 2 results (states_data, frequency_data) into the session entity_map."""
+        step_data = self.session_manager.get_session_data(session_id)
+        states_data, frequency_data = states_result
 
         # Update session data with states info
         for entity_id, data in states_data.items():
@@ -176,10 +442,14 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
     def _fetch_step_3_statistics_meta(self, session_id: str) -> dict[str, Any]:
         """Step 3: Fetch statistics_meta entities with metadata_id."""
         engine = self._get_engine()
-        step_data = self.session_manager.get_session_data(session_id)
 
         # Fetch statistics metadata from repository
-        metadata_map = self.entity_repository.fetch_statistics_meta(engine)
+        metadata_map = self._parallel_step_queries(engine)[3]()
+        return self._merge_step_3_statistics_meta(session_id, metadata_map)
+
+    def _merge_step_3_statistics_meta(self, session_id: str, metadata_map: dict[str, int]) -> dict[str, Any]:
+        """Merge step 3 results into the session entity_map."""
+        step_data = self.session_manager.get_session_data(session_id)
 
         # Update session data
         for entity_id, metadata_id in metadata_map.items():
@@ -193,10 +463,14 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
     def _fetch_step_4_statistics_short_term(self, session_id: str) -> dict[str, Any]:
         """Step 4: Fetch statistics_short_term with counts."""
         engine = self._get_engine()
-        step_data = self.session_manager.get_session_data(session_id)
 
         # Fetch short-term statistics from repository (handles missing table gracefully)
-        stats_data = self.entity_repository.fetch_statistics_short_term(engine)
+        stats_data = self._parallel_step_queries(engine)[4]()
+        return self._merge_step_4_statistics_short_term(session_id, stats_data)
+
+    def _merge_step_4_statistics_short_term(self, session_id: str, stats_data: dict[str, Any]) -> dict[str, Any]:
+        """Merge step 4 results into the session entity_map."""
+        step_data = self.session_manager.get_session_data(session_id)
 
         # Update session data
         for entity_id, data in stats_data.items():
@@ -215,10 +489,14 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
     def _fetch_step_5_statistics_long_term(self, session_id: str) -> dict[str, Any]:
         """Step 5: Fetch statistics (long-term) with counts."""
         engine = self._get_engine()
-        step_data = self.session_manager.get_session_data(session_id)
 
         # Fetch long-term statistics from repository
-        stats_data = self.entity_repository.fetch_statistics_long_term(engine)
+        stats_data = self._parallel_step_queries(engine)[5]()
+        return self._merge_step_5_statistics_long_term(session_id, stats_data)
+
+    def _merge_step_5_statistics_long_term(self, session_id: str, stats_data: dict[str, Any]) -> dict[str, Any]:
+        """Merge step 5 results into the session entity_map."""
+        step_data = self.session_manager.get_session_data(session_id)
 
         # Update session data
         for entity_id, data in stats_data.items():
@@ -234,12 +512,59 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
         self.session_manager.update_timestamp(session_id)
         return {'status': 'complete', 'entities_found': entity_count}
 
-    def _fetch_step_6_enrich_with_registry(self, session_id: str) -> dict[str, Any]:
-        """Step 6: Enrich with entity registry and state machine info."""
+    def _parallel_step_queries(self, engine) -> dict[int, Callable[[], Any]]:
+        """Database reads of steps 1-5, which do not depend on each other.
+
+        Each repository call opens its own connection, so running them in
+        separate executor jobs uses separate pooled connections. The reads do
+        not depend on the session, so each one is coalesced: a session
+        requesting a step while another session runs the same read waits for
+        it and merges the shared (read-only) result.
+        """
+        queries = {
+            1: partial(self.entity_repository.fetch_states_meta, engine),
+            2: partial(self.entity_repository.fetch_states_with_counts, engine, snapshot=self.overview_snapshot),
+            3: partial(self.entity_repository.fetch_statistics_meta, engine),
+            4: partial(self.entity_repository.fetch_statistics_short_term, engine, snapshot=self.overview_snapshot),
+            5: partial(self.entity_repository.fetch_statistics_long_term, engine, snapshot=self.overview_snapshot),
+        }
+        return {
+            step: partial(self._single_flight.do, ('overview_step', step), query)
+            for step, query in queries.items()
+        }
+
+    def _merge_parallel_results(self, session_id: str, raw_results: dict[int, Any]) -> dict[int, dict[str, Any]]:
+        """Merge the results of steps 1-5 into the session in step order.
+
+        The per-step results are kept in the session so that later requests
+        for steps 1-5 (from clients unaware of parallel mode) are answered
+        without running the queries again.
+        """
+        merges = {
+            1: self._merge_step_1_states_meta,
+            2: self._merge_step_2_states,
+            3: self._merge_step_3_statistics_meta,
+            4: self._merge_step_4_statistics_short_term,
+            5: self._merge_step_5_statistics_long_term,
+        }
+        step_results = {step: merges[step](session_id, raw_results[step]) for step in PARALLEL_STEPS}
+        self.session_manager.get_session_data(session_id)['completed_steps'] = step_results
+        return step_results
+
+    def _fetch_step_6_enrich_with_registry(
+        self, session_id: str, registry_snapshot: RegistrySnapshot | None = None
+    ) -> dict[str, Any]:
+        """Step 6: Enrich with entity registry and state machine info.
+
+        Args:
+            session_id: Session holding the entity_map of steps 1-5
+            registry_snapshot: Registry indexes taken on the event loop. Without
+                one the registries are read here, which is only safe on the loop.
+        """
         step_data = self.session_manager.get_session_data(session_id)
 
         # Delegate enrichment to RegistryAdapter
-        entities_list = self.registry_adapter.enrich_entities(step_data['entity_map'])
+        entities_list = self.registry_adapter.enrich_entities(step_data['entity_map'], registry_snapshot)
 
         step_data['entities_list'] = entities_list
         self.session_manager.update_timestamp(session_id)
@@ -294,11 +619,14 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
                     'origin': origin,
                     'in_states_meta': entity['in_states_meta'],
                     'in_statistics_meta': entity['in_statistics_meta'],
-                    'metadata_id_statistics': metadata_id
+                    'metadata_id_statistics': metadata_id,
+                    'states_count': entity.get('states_count', 0),
+                    'stats_short_count': entity.get('stats_short_count', 0),
+                    'stats_long_count': entity.get('stats_long_count', 0),
                 })
 
-        # Batch calculate storage for all deleted entities
-        storage_map = self.storage_calculator.calculate_batch_storage(engine, deleted_entities)
+        # Estimate storage from the counts gathered in steps 2, 4 and 5 (no fact-table scans)
+        storage_map = self.storage_calculator.calculate_storage_from_counts(engine, deleted_entities)
         deleted_storage_bytes = sum(storage_map.values())
 
         step_data['deleted_storage_bytes'] = deleted_storage_bytes
@@ -327,15 +655,27 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
                     'origin': origin,
                     'in_states_meta': entity['in_states_meta'],
                     'in_statistics_meta': entity['in_statistics_meta'],
-                    'metadata_id_statistics': metadata_id
+                    'metadata_id_statistics': metadata_id,
+                    'states_count': entity.get('states_count', 0),
+                    'stats_short_count': entity.get('stats_short_count', 0),
+                    'stats_long_count': entity.get('stats_long_count', 0),
                 })
 
-        # Batch calculate storage for all disabled entities
-        storage_map = self.storage_calculator.calculate_batch_storage(engine, disabled_entities)
+        # Estimate storage from the counts gathered in steps 2, 4 and 5 (no fact-table scans)
+        storage_map = self.storage_calculator.calculate_storage_from_counts(engine, disabled_entities)
         disabled_storage_bytes = sum(storage_map.values())
 
-        # Generate summary statistics
+        # Per-entity storage estimate for every entity, in one pass over the counts
         entities_list = step_data['entities_list']
+        breakdown = self.storage_calculator.calculate_breakdown_from_counts(engine, entities_list)
+        for entity in entities_list:
+            states_bytes, short_bytes, long_bytes = breakdown[entity['entity_id']]
+            entity['estimated_states_bytes'] = states_bytes
+            entity['estimated_short_term_bytes'] = short_bytes
+            entity['estimated_long_term_bytes'] = long_bytes
+            entity['estimated_bytes'] = states_bytes + short_bytes + long_bytes
+
+        # Generate summary statistics
         summary = {
             'total_entities': len(step_data['entity_map']),
             'in_entity_registry': sum(1 for e in entities_list if e['in_entity_registry']),
@@ -364,17 +704,34 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
             'summary': summary
         }
 
+        # Cache finalized overview so panel reloads skip the database
+        finalized_at = time.time()
+        if self._overview_cache_ttl > 0:
+            self._overview_cache = result
+            self._overview_cache_time = finalized_at
+
+        # Serve entities_page requests from the same list
+        self._entity_page_index = EntityPageIndex(entities_list, finalized_at)
+
         # Clean up session data now that we're done
         self.session_manager.delete_session(session_id)
 
-        return result
+        return {**result, 'cached': False, 'cache_age_seconds': 0}
 
-    def _execute_overview_step(self, step: int, session_id: str | None = None) -> dict[str, Any]:
+    def _execute_overview_step(
+        self,
+        step: int,
+        session_id: str | None = None,
+        force_refresh: bool = False,
+        registry_snapshot: RegistrySnapshot | None = None,
+    ) -> dict[str, Any]:
         """Execute a specific step of the overview process.
 
         Args:
             step: Step number (0-8)
             session_id: Session ID for steps 1-8. For step 0, can be None (creates new session).
+            force_refresh: For step 0, bypass the cached overview.
+            registry_snapshot: For step 6, registry indexes taken on the event loop.
 
         Returns:
             Step result dictionary with status and data
@@ -384,8 +741,20 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
             raise RuntimeError("Coordinator is shutting down, cannot process step requests")
 
         if step == 0:
-            return self._init_step_data(session_id)
-        elif step == 1:
+            return self._init_step_data(session_id, force_refresh)
+
+        # Sessions bound to the cached overview never touch the database
+        if (1 <= step <= 8 and session_id and self.session_manager.validate_session(session_id)
+                and 'cached_overview' in self.session_manager.get_session_data(session_id)):
+            return self._serve_cached_step(step, session_id)
+
+        # Steps already run by async_execute_parallel_steps return their stored result
+        if (step in PARALLEL_STEPS and session_id and self.session_manager.validate_session(session_id)
+                and step in self.session_manager.get_session_data(session_id).get('completed_steps', {})):
+            self.session_manager.update_timestamp(session_id)
+            return self.session_manager.get_session_data(session_id)['completed_steps'][step]
+
+        if step == 1:
             if not session_id or not self.session_manager.validate_session(session_id):
                 raise ValueError("Invalid or missing session_id for step 1")
             return self._fetch_step_1_states_meta(session_id)
@@ -408,7 +777,7 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
         elif step == 6:
             if not session_id or not self.session_manager.validate_session(session_id):
                 raise ValueError("Invalid or missing session_id for step 6")
-            return self._fetch_step_6_enrich_with_registry(session_id)
+            return self._fetch_step_6_enrich_with_registry(session_id, registry_snapshot)
         elif step == 7:
             if not session_id or not self.session_manager.validate_session(session_id):
                 raise ValueError("Invalid or missing session_id for step 7")
@@ -420,12 +789,15 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
         else:
             raise ValueError(f"Invalid step: {step}")
 
-    async def async_execute_overview_step(self, step: int, session_id: str | None = None) -> dict[str, Any]:
+    async def async_execute_overview_step(
+        self, step: int, session_id: str | None = None, force_refresh: bool = False
+    ) -> dict[str, Any]:
         """Execute a specific step of the overview process (async wrapper).
 
         Args:
             step: Step number (0-8)
             session_id: Session ID for steps 1-8. For step 0, can be None.
+            force_refresh: For step 0, bypass the cached overview.
 
         Returns:
             Step result dictionary
@@ -436,15 +808,326 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
                 lock = self.session_manager.get_lock(session_id)
                 async with lock:
                     _LOGGER.debug("Acquired lock for session %s step %d", session_id[:8], step)
-                    return await self.hass.async_add_executor_job(self._execute_overview_step, step, session_id)
+                    if step == 6:
+                        # Registries are loop-only: snapshot them here, merge in the executor
+                        registry_snapshot = await self.registry_adapter.async_build_snapshot()
+                        result = await self.hass.async_add_executor_job(
+                            self._execute_overview_step, step, session_id, False, registry_snapshot
+                        )
+                    else:
+                        result = await self.hass.async_add_executor_job(self._execute_overview_step, step, session_id)
+                if step in (2, 4, 5):
+                    self._async_schedule_snapshot_save()
+                return result
             else:
                 # Step 0 doesn't need a lock (creates new session)
+                if step == 0:
+                    await self._async_load_snapshot()
+                    return await self.hass.async_add_executor_job(
+                        self._execute_overview_step, step, session_id, force_refresh
+                    )
                 return await self.hass.async_add_executor_job(self._execute_overview_step, step, session_id)
         except Exception as err:
             _LOGGER.error("Error executing overview step %d (session %s): %s",
                          step, session_id[:8] if session_id else "None", err)
             raise
 
+    def _run_overview_pipeline(
+        self,
+        session_id: str,
+        report: Callable[[dict[str, Any]], None],
+        registry_snapshot: RegistrySnapshot | None = None,
+    ) -> dict[str, Any]:
+        """Run steps 1-8 back to back in one executor job.
+
+        The session was created by the caller, which holds its lock for the
+        whole run so the memory budget cannot evict it; it is only used as
+        storage for the intermediate entity_map.
+
+        Args:
+            session_id: Session holding the intermediate data
+            report: Called after each step with a progress dictionary
+            registry_snapshot: Registry indexes taken on the event loop for step 6
+
+        Returns:
+            Step 8 result (entities, summary and cache info)
+        """
+        steps = {
+            1: self._fetch_step_1_states_meta,
+            2: self._fetch_step_2_states,
+            3: self._fetch_step_3_statistics_meta,
+            4: self._fetch_step_4_statistics_short_term,
+            5: self._fetch_step_5_statistics_long_term,
+            6: partial(self._fetch_step_6_enrich_with_registry, registry_snapshot=registry_snapshot),
+            7: self._fetch_step_7_calculate_deleted_storage,
+            8: self._fetch_step_8_finalize,
+        }
+        start = time.monotonic()
+        result: dict[str, Any] = {}
+        for step, fetch in steps.items():
+            if self._is_shutting_down:
+                raise RuntimeError("Coordinator is shutting down, cannot process step requests")
+
+            step_start = time.monotonic()
+            result = fetch(session_id)
+            progress = {
+                'step': step,
+                'total_steps': len(steps),
+                'step_ms': int((time.monotonic() - step_start) * 1000),
+                'elapsed_ms': int((time.monotonic() - start) * 1000),
+            }
+            if step == 8:
+                progress.update(status='complete', total_entities=len(result['entities']))
+            else:
+                progress.update(result)
+            report(progress)
+
+        return result
+
+    async def async_stream_overview(
+        self, force_refresh: bool = False
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Run the whole overview server-side, yielding progress and the result.
+
+        Replaces the 9 request round trips of the step protocol with one
+        request and one executor job. Progress reported from the executor
+        thread is handed to the event loop through a queue.
+
+        Args:
+            force_refresh: Ignore and drop the cached overview
+
+        Yields:
+            ("progress", {...}) after each step, then ("result", step 8 result)
+        """
+        if self._is_shutting_down:
+            raise RuntimeError("Coordinator is shutting down, cannot process step requests")
+
+        if force_refresh:
+            self.invalidate_overview_cache()
+
+        cached = self._get_cached_overview()
+        if cached is not None:
+            result, cached_at = cached
+            yield 'result', {**result, 'cached': True, 'cache_age_seconds': int(time.time() - cached_at)}
+            return
+
+        await self._async_load_snapshot()
+        registry_snapshot = await self.registry_adapter.async_build_snapshot()
+
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        session_id = self.session_manager.create_session()
+        # Held for the whole run: the memory budget never evicts locked sessions
+        lock = self.session_manager.get_lock(session_id)
+        await lock.acquire()
+
+        def report(progress: dict[str, Any]) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, progress)
+
+        def cleanup(future: asyncio.Future) -> None:
+            # Retrieve the exception so an abandoned run does not log "never retrieved"
+            if not future.cancelled() and future.exception() is not None:
+                _LOGGER.debug("Overview run failed: %s", future.exception())
+            lock.release()
+            if self.session_manager.validate_session(session_id):
+                self.session_manager.delete_session(session_id)
+
+        job = asyncio.ensure_future(
+            self.hass.async_add_executor_job(
+                self._run_overview_pipeline, session_id, report, registry_snapshot
+            )
+        )
+        try:
+            while not job.done():
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait({getter, job}, return_when=asyncio.FIRST_COMPLETED)
+                if getter.done():
+                    yield 'progress', getter.result()
+                else:
+                    getter.cancel()
+
+            while not queue.empty():
+                yield 'progress', queue.get_nowait()
+
+            result = job.result()
+        finally:
+            # If the client went away mid-run, let the job finish (it still fills the cache)
+            if job.done():
+                cleanup(job)
+            else:
+                job.add_done_callback(cleanup)
+
+        self._async_schedule_snapshot_save()
+        yield 'result', result
+
+    async def _async_run_parallel_query(self, query: Callable[[], Any]) -> Any:
+        """Run one parallel step read in the executor once a pool slot is free.
+
+        Args:
+            query: Blocking read returned by _parallel_step_queries
+
+        Returns:
+            The read's result
+        """
+        async with self._parallel_query_slots:
+            return await self.hass.async_add_executor_job(query)
+
+    async def async_execute_parallel_steps(self, session_id: str) -> dict[str, Any]:
+        """Run steps 1-5 concurrently and merge them into the session.
+
+        The five reads run as separate executor jobs on separate pooled
+        connections, so on a remote database the wall time is roughly that
+        of the slowest query. At most DB_POOL_SIZE of these reads run at
+        once across all sessions, so they never wait on the pool. SQLite runs them one after another in a single
+        job: the file serializes readers anyway and an in-memory database
+        shares one connection between threads. Merging happens under the
+        session lock, in step order.
+
+        Args:
+            session_id: Session ID created by step 0
+
+        Returns:
+            Dictionary with status, the completed steps and each step's result
+
+        Raises:
+            ValueError: If the session is invalid or expired
+        """
+        if self._is_shutting_down:
+            raise RuntimeError("Coordinator is shutting down, cannot process step requests")
+
+        if not session_id or not self.session_manager.validate_session(session_id):
+            raise ValueError("Invalid or missing session_id for parallel steps")
+
+        lock = self.session_manager.get_lock(session_id)
+        try:
+            async with lock:
+                # Session access may load or spill session data, so keep it off the loop
+                step_data = await self.hass.async_add_executor_job(
+                    self.session_manager.get_session_data, session_id
+                )
+                if 'cached_overview' in step_data:
+                    await self.hass.async_add_executor_job(
+                        self.session_manager.update_timestamp, session_id
+                    )
+                    return {'status': 'complete', 'cached': True, 'completed_steps': list(PARALLEL_STEPS)}
+
+                engine = await self.hass.async_add_executor_job(self._get_engine)
+                queries = self._parallel_step_queries(engine)
+
+                start = time.monotonic()
+                if engine.dialect.name == 'sqlite':
+                    raw_results = await self.hass.async_add_executor_job(
+                        lambda: {step: query() for step, query in queries.items()}
+                    )
+                else:
+                    values = await asyncio.gather(
+                        *(self._async_run_parallel_query(query) for query in queries.values())
+                    )
+                    raw_results = dict(zip(queries, values))
+                _LOGGER.debug(
+                    "Parallel steps 1-5 fetched in %.2fs (session %s)",
+                    time.monotonic() - start, session_id[:8]
+                )
+
+                step_results = await self.hass.async_add_executor_job(
+                    self._merge_parallel_results, session_id, raw_results
+                )
+        except Exception as err:
+            _LOGGER.error("Error executing parallel overview steps (session %s): %s", session_id[:8], err)
+            raise
+
+        self._async_schedule_snapshot_save()
+        return {
+            'status': 'complete',
+            'cached': False,
+            'completed_steps': list(PARALLEL_STEPS),
+            'steps': step_results,
+        }
+
+    async def async_get_entities_page(
+        self,
+        offset: int,
+        limit: int,
+        sort_key: str,
+        direction: str,
+        filters: dict[str, str],
+        search: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Get one page of the last finalized overview's entities.
+
+        Args:
+            offset: Index of the first entity in the filtered result
+            limit: Maximum number of entities to return
+            sort_key: Sort key or frontend column id
+            direction: "asc" or "desc"
+            filters: Exact-match filters (registry_status, state_status, origin, domain)
+            search: Case-insensitive entity_id substring
+
+        Returns:
+            Page dictionary, or None if no overview has been finalized yet
+
+        Raises:
+            ValueError: If a paging, sort or filter parameter is invalid
+        """
+        index = self._entity_page_index
+        if index is None:
+            return None
+        return await self.hass.async_add_executor_job(
+            index.get_page, offset, limit, sort_key, direction, filters, search
+        )
+
+    async def async_cleanup_sessions(self, now: datetime | None = None) -> None:
+        """Expire idle sessions and enforce the session memory budget.
+
+        Runs every SESSION_CLEANUP_INTERVAL seconds (registered in
+        async_setup_entry). Spill files are removed in the executor.
+
+        Args:
+            now: Time of the timer tick (unused)
+        """
+        if self._is_shutting_down:
+            return
+        await self.hass.async_add_executor_job(self.session_manager.cleanup_stale_sessions)
+
+    async def _async_load_snapshot(self) -> None:
+        """Load the persisted overview snapshot once per coordinator lifetime.
+
+        Persistence is best-effort: if loading fails the next overview simply
+        runs full scans and rebuilds the snapshot.
+        """
+        if self._snapshot_loaded:
+            return
+        self._snapshot_loaded = True
+
+        try:
+            data = await self._snapshot_store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Could not load overview snapshot: %s", err)
+            return
+
+        if data:
+            self.overview_snapshot.load(data)
+            _LOGGER.debug("Loaded persisted overview snapshot")
+
+    @callback
+    def _async_schedule_snapshot_save(self) -> None:
+        """Schedule a delayed write of the overview snapshot."""
+        try:
+            self._snapshot_store.async_delay_save(self.overview_snapshot.as_dict, SNAPSHOT_SAVE_DELAY)
+        except Exception as err:
+            _LOGGER.warning("Could not schedule overview snapshot save: %s", err)
+
+    async def _async_save_invalidated_snapshot(self) -> None:
+        """Persist recount marks, loading the stored snapshot first.
+
+        Delete SQL can be generated before any overview loaded the snapshot,
+        e.g. from a panel left open across a restart. Loading first merges
+        the new marks into the persisted snapshot instead of saving an empty
+        one over it.
+        """
+        await self._async_load_snapshot()
+        self._async_schedule_snapshot_save()
+
     # Note: Monolithic _fetch_entity_storage_overview method was removed.
     # The step-by-step API (_fetch_step_1 through _fetch_step_8) provides
     # better UX with progress feedback and is exclusively used by the frontend.
@@ -456,8 +1139,9 @@ class StatisticsOrphanCoordinator(DataUpdateCoordinator):
         # Set shutdown flag to prevent new requests
         self._is_shutting_down = True
 
-        # Clean up any in-progress step sessions
-        self.session_manager.clear_all_sessions()
+        # Clean up any in-progress step sessions and cached results
+        await self.hass.async_add_executor_job(self.session_manager.clear_all_sessions)
+        self.invalidate_overview_cache()
 
         # Close database connection
         if self.db_service:
@@ -6,6 +6,10 @@ from .sql_generator import SqlGenerator
 from .session_manager import SessionManager
 from .entity_repository import EntityRepository
 from .registry_adapter import RegistryAdapter
+from .overview_snapshot import OverviewSnapshot
+from .entity_page_index import EntityPageIndex
+from .single_flight import SingleFlight
+from .histogram_cache import HistogramCache
 
 __all__ = [
     "DatabaseService",
@@ -15,4 +19,8 @@ __all__ = [
     "SessionManager",
     "EntityRepository",
     "RegistryAdapter",
+    "OverviewSnapshot",
+    "EntityPageIndex",
+    "SingleFlight",
+    "HistogramCache",
 ]
@@ -0,0 +1,83 @@
+"""Chunked execution of queries with large expanding IN lists."""
+import logging
+from typing import Any, Iterable, Iterator
+
+from sqlalchemy.sql.elements import TextClause
+
+_LOGGER = logging.getLogger(__name__)
+
+# Values bound per IN list, by SQLAlchemy dialect name. SQLite builds older
+# than 3.32 accept at most 999 host parameters per statement (32766 after),
+# so SQLite stays below the old limit leaving room for other parameters.
+# MySQL and PostgreSQL have no practical limit, but planning time and packet
+# size grow with the list, so they are split at a moderate size too.
+IN_CHUNK_SIZES = {
+    'sqlite': 900,
+    'mysql': 1000,
+    'postgresql': 1000,
+}
+
+# Chunk size for unknown dialects
+DEFAULT_IN_CHUNK_SIZE = 500
+
+
+def in_chunk_size(conn) -> int:
+    """Return the IN list chunk size for a connection's dialect.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        int: Maximum number of values bound per IN list
+    """
+    dialect = getattr(getattr(conn, 'dialect', None), 'name', None)
+    return IN_CHUNK_SIZES.get(dialect, DEFAULT_IN_CHUNK_SIZE)
+
+
+def execute_chunked_in(
+    conn,
+    query: TextClause,
+    param_name: str,
+    values: Iterable[Any],
+    params: dict[str, Any] | None = None,
+    chunk_size: int | None = None,
+) -> Iterator[Any]:
+    """Execute a query once per chunk of an expanding IN parameter.
+
+    The query must bind param_name with expanding=True. Values are
+    de-duplicated (keeping order) before splitting, so every value is sent
+    exactly once. Rows from all chunks are yielded in chunk order.
+
+    Only use this for queries whose result rows depend on a single IN value
+    each, e.g. lookups or aggregates grouped by the IN column; aggregates
+    across the whole list would be split into per-chunk partials.
+
+    Args:
+        conn: Database connection
+        query: Text query with an expanding bindparam named param_name
+        param_name: Name of the expanding bindparam
+        values: Values for the IN list
+        params: Other bound parameters, passed unchanged to every chunk
+        chunk_size: Values per chunk (defaults to in_chunk_size(conn))
+
+    Yields:
+        Result rows of every chunk
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+    size = chunk_size if chunk_size is not None else in_chunk_size(conn)
+    if size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    unique_values = list(dict.fromkeys(values))
+    if len(unique_values) > size:
+        _LOGGER.debug(
+            "Splitting IN list of %d values into chunks of %d",
+            len(unique_values), size
+        )
+
+    for start in range(0, len(unique_values), size):
+        bound = dict(params or {})
+        bound[param_name] = unique_values[start:start + size]
+        yield from conn.execute(query, bound).fetchall()
@@ -10,11 +10,14 @@ from sqlalchemy.engine import Engine
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from ..const import CONF_DB_URL, CONF_USERNAME, CONF_PASSWORD
+from ..const import CONF_DB_URL, CONF_USERNAME, CONF_PASSWORD, DB_POOL_SIZE
 from .storage_constants import MYSQL_COMPRESSION_FACTOR
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fact tables whose row counts are reported by database_size
+COUNTED_TABLES = ('states', 'statistics', 'statistics_short_term')
+
 
 def get_database_type(entry: ConfigEntry) -> tuple[bool, bool, bool]:
     """Determine database type from connection URL.
@@ -32,6 +35,68 @@ def get_database_type(entry: ConfigEntry) -> tuple[bool, bool, bool]:
     return (is_sqlite, is_mysql, is_postgres)
 
 
+def fetch_estimated_row_counts(conn, dialect: str) -> dict[str, int]:
+    """Read row count estimates for the fact tables from the engine's statistics.
+
+    Uses information_schema.tables.table_rows (MySQL/MariaDB),
+    pg_class.reltuples (PostgreSQL) or sqlite_stat1 (SQLite, written by
+    ANALYZE / PRAGMA optimize). These are metadata lookups and return in
+    milliseconds regardless of table size.
+
+    Args:
+        conn: Open database connection
+        dialect: SQLAlchemy dialect name (mysql, mariadb, postgresql, sqlite)
+
+    Returns:
+        dict: {table_name: estimated_rows} for tables with a usable
+            estimate. Tables without one (never analyzed, missing) are
+            left out so the caller can count them exactly.
+    """
+    if dialect in ('mysql', 'mariadb'):
+        query = text("""
+            SELECT table_name, table_rows
+            FROM information_schema.tables
+            WHERE table_schema = DATABASE()
+            AND table_name IN ('states', 'statistics', 'statistics_short_term')
+        """)
+    elif dialect == 'postgresql':
+        # reltuples is -1 (PG14+) or 0 for tables that were never vacuumed/analyzed.
+        # Visible tables are the ones the recorder's unqualified names resolve
+        # to through search_path, whichever schema that is.
+        query = text("""
+            SELECT c.relname, c.reltuples::bigint
+            FROM pg_class c
+            WHERE pg_table_is_visible(c.oid)
+            AND c.relkind = 'r'
+            AND c.relname IN ('states', 'statistics', 'statistics_short_term')
+        """)
+    elif dialect == 'sqlite':
+        # First integer of each stat row is the number of rows in the table/index
+        query = text("""
+            SELECT tbl, MAX(CAST(stat AS INTEGER))
+            FROM sqlite_stat1
+            WHERE tbl IN ('states', 'statistics', 'statistics_short_term')
+            GROUP BY tbl
+        """)
+    else:
+        return {}
+
+    try:
+        rows = conn.execute(query).fetchall()
+    except Exception as err:
+        # sqlite_stat1 only exists after ANALYZE; keep the connection usable
+        _LOGGER.debug("Row count estimates unavailable: %s", err)
+        conn.rollback()
+        return {}
+
+    estimates = {}
+    for row in rows:
+        table_name, estimate = row[0], row[1]
+        if table_name in COUNTED_TABLES and estimate is not None and estimate > 0:
+            estimates[table_name] = int(estimate)
+    return estimates
+
+
 class DatabaseService:
     """Service for database operations."""
 
@@ -60,13 +125,17 @@ class DatabaseService:
             # Determine database type for connection arguments
             is_sqlite, is_mysql, is_postgres = get_database_type(self.entry)
 
-            # Add connection timeout for remote databases (MySQL/PostgreSQL)
+            # Add connection timeout and pool size for remote databases (MySQL/PostgreSQL)
             connect_args = {}
+            pool_args = {}
             if is_mysql or is_postgres:
                 # 10 second connection timeout to prevent indefinite hangs
                 connect_args["connect_timeout"] = 10
+                pool_args["pool_size"] = DB_POOL_SIZE
 
-            self._engine = create_engine(db_url, pool_pre_ping=True, connect_args=connect_args)
+            self._engine = create_engine(
+                db_url, pool_pre_ping=True, connect_args=connect_args, **pool_args
+            )
 
         return self._engine
 
@@ -84,43 +153,101 @@ class DatabaseService:
             self._engine.dispose()
             self._engine = None
 
-    def _fetch_database_size(self) -> dict[str, Any]:
-        """Fetch database size information (blocking I/O)."""
+    def _fetch_estimated_row_counts(self, conn) -> dict[str, int]:
+        """Read row count estimates from the engine's statistics.
+
+        Args:
+            conn: Open database connection
+
+        Returns:
+            dict: {table_name: estimated_rows}, see fetch_estimated_row_counts
+        """
+        is_sqlite, is_mysql, is_postgres = self.get_db_type()
+        if is_mysql:
+            dialect = 'mysql'
+        elif is_postgres:
+            dialect = 'postgresql'
+        elif is_sqlite:
+            dialect = 'sqlite'
+        else:
+            return {}
+        return fetch_estimated_row_counts(conn, dialect)
+
+    def _fetch_sqlite_table_sizes(self, conn) -> dict[str, int] | None:
+        """Get on-disk bytes per table (including its indexes) from dbstat.
+
+        dbstat is a virtual table compiled into most SQLite builds
+        (SQLITE_ENABLE_DBSTAT_VTAB). With aggregate = TRUE it returns one row
+        per b-tree; joining sqlite_master maps each index to its table.
+
+        Args:
+            conn: Open SQLite connection
+
+        Returns:
+            dict: {table_name: bytes} or None if dbstat is not available
+        """
+        query = text("""
+            SELECT COALESCE(m.tbl_name, d.name) AS table_name, SUM(d.pgsize) AS size
+            FROM dbstat AS d
+            LEFT JOIN sqlite_master AS m ON m.name = d.name
+            WHERE d.aggregate = TRUE
+            GROUP BY table_name
+        """)
+        try:
+            return {row[0]: int(row[1] or 0) for row in conn.execute(query)}
+        except Exception as err:
+            _LOGGER.debug("dbstat not available, estimating SQLite table sizes: %s", err)
+            conn.rollback()
+            return None
+
+    def _fetch_row_counts(self, conn, exact: bool) -> tuple[dict[str, int], bool]:
+        """Get row counts for the fact tables.
+
+        Args:
+            conn: Open database connection
+            exact: Always run COUNT(*) instead of using engine estimates
+
+        Returns:
+            tuple: ({table_name: row_count}, estimated) where estimated is
+                True if any count came from engine statistics
+        """
+        counts = {} if exact else self._fetch_estimated_row_counts(conn)
+        estimated = bool(counts)
+
+        for table_name in COUNTED_TABLES:
+            if table_name in counts:
+                continue
+            try:
+                counts[table_name] = conn.execute(
+                    text(f"SELECT COUNT(*) as count FROM {table_name}")
+                ).fetchone()[0]
+            except Exception:
+                if table_name != 'statistics_short_term':
+                    raise
+                # Table might not exist in older HA versions
+                counts[table_name] = 0
+
+        return counts, estimated
+
+    def _fetch_database_size(self, exact: bool = False) -> dict[str, Any]:
+        """Fetch database size information (blocking I/O).
+
+        Args:
+            exact: Count rows with COUNT(*) instead of engine estimates.
+                Exact counts scan every fact table and can take tens of
+                seconds on large databases.
+        """
         engine = self.get_engine()
 
         with engine.connect() as conn:
             # Determine database type
             is_sqlite, is_mysql, is_postgres = self.get_db_type()
 
-            # Get database size for different tables
-            # Query for states table size
-            states_query = text("""
-                SELECT COUNT(*) as count
-                FROM states
-            """)
-            states_result = conn.execute(states_query)
-            states_count = states_result.fetchone()[0]
-
-            # Query for statistics table (long-term)
-            statistics_query = text("""
-                SELECT COUNT(*) as count
-                FROM statistics
-            """)
-            statistics_result = conn.execute(statistics_query)
-            statistics_count = statistics_result.fetchone()[0]
-
-            # Query for statistics_short_term table
-            statistics_short_term_count = 0
-            statistics_short_term_query = text("""
-                SELECT COUNT(*) as count
-                FROM statistics_short_term
-            """)
-            try:
-                statistics_short_term_result = conn.execute(statistics_short_term_query)
-                statistics_short_term_count = statistics_short_term_result.fetchone()[0]
-            except Exception:
-                # Table might not exist in older HA versions
-                pass
+            # Row counts for the fact tables (estimated unless exact requested)
+            counts, counts_estimated = self._fetch_row_counts(conn, exact)
+            states_count = counts['states']
+            statistics_count = counts['statistics']
+            statistics_short_term_count = counts['statistics_short_term']
 
             # Get table sizes in bytes
             states_size = 0
@@ -136,15 +263,25 @@ class DatabaseService:
                     result = conn.execute(size_query)
                     total_size = result.fetchone()[0]
 
-                    # Estimate based on row counts (rough approximation)
-                    total_count = states_count + statistics_count + statistics_short_term_count
-                    if total_count > 0:
-                        states_size = int((states_count / total_count) * total_size * MYSQL_COMPRESSION_FACTOR)
-                        statistics_size = int((statistics_count / total_count) * total_size * MYSQL_COMPRESSION_FACTOR)
-                        statistics_short_term_size = int((statistics_short_term_count / total_count) * total_size * MYSQL_COMPRESSION_FACTOR)
-                        other_size = total_size - states_size - statistics_size - statistics_short_term_size
+                    # Real per-table sizes (data + indexes) when dbstat is compiled in
+                    table_sizes = self._fetch_sqlite_table_sizes(conn)
+                    if table_sizes is not None:
+                        states_size = table_sizes.get('states', 0)
+                        statistics_size = table_sizes.get('statistics', 0)
+                        statistics_short_term_size = table_sizes.get('statistics_short_term', 0)
+                        # Everything else, including free pages
+                        other_size = max(0, total_size - states_size - statistics_size - statistics_short_term_size)
+
                     else:
-                        other_size = total_size
+                        # Estimate based on row counts (rough approximation)
+                        total_count = states_count + statistics_count + statistics_short_term_count
+                        if total_count > 0:
+                            states_size = int((states_count / total_count) * total_size * MYSQL_COMPRESSION_FACTOR)
+                            statistics_size = int((statistics_count / total_count) * total_size * MYSQL_COMPRESSION_FACTOR)
+                            statistics_short_term_size = int((statistics_short_term_count / total_count) * total_size * MYSQL_COMPRESSION_FACTOR)
+                            other_size = total_size - states_size - statistics_size - statistics_short_term_size
+                        else:
+                            other_size = total_size
 
                 elif is_mysql:
                     # For MySQL/MariaDB
@@ -208,13 +345,18 @@ class DatabaseService:
                 "states_size": states_size,
                 "statistics_size": statistics_size,
                 "statistics_short_term_size": statistics_short_term_size,
-                "other_size": other_size
+                "other_size": other_size,
+                "counts_estimated": counts_estimated,
             }
 
-    async def async_get_database_size(self) -> dict[str, Any]:
-        """Get database size information."""
+    async def async_get_database_size(self, exact: bool = False) -> dict[str, Any]:
+        """Get database size information.
+
+        Args:
+            exact: Count rows exactly instead of using engine estimates.
+        """
         try:
-            return await self.hass.async_add_executor_job(self._fetch_database_size)
+            return await self.hass.async_add_executor_job(self._fetch_database_size, exact)
         except SQLAlchemyError as err:
             _LOGGER.error("Error fetching database size: %s", err)
             return {
@@ -225,5 +367,6 @@ class DatabaseService:
                 "states_size": 0,
                 "statistics_size": 0,
                 "statistics_short_term_size": 0,
-                "other_size": 0
+                "other_size": 0,
+                "counts_estimated": False,
             }
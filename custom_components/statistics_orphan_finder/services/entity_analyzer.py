@@ -1,18 +1,15 @@
 """Entity analysis service for Statistics Orphan Finder."""
 import logging
 from datetime import datetime, timezone
-from typing import Any, NamedTuple
+from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.engine import Engine
 
-_LOGGER = logging.getLogger(__name__)
-
+from .histogram_cache import HistogramCache
+from .message_histogram import count_message_buckets, resolve_metadata_ids
 
-class HourlyMessageRow(NamedTuple):
-    """Result row for hourly message count queries."""
-    hour_bucket: int
-    count: int
+_LOGGER = logging.getLogger(__name__)
 
 
 class EntityAnalyzer:
@@ -35,6 +32,41 @@ class EntityAnalyzer:
             state: Current state object (or None if no state)
             device_registry: Device registry instance
 
+        Returns:
+            Human-readable reason for unavailability, or None if entity is available
+        """
+        device_entry = None
+        if registry_entry and registry_entry.device_id:
+            device_entry = device_registry.async_get(registry_entry.device_id)
+
+        config_entry = None
+        if registry_entry and registry_entry.config_entry_id:
+            config_entry = hass.config_entries.async_get_entry(
+                registry_entry.config_entry_id
+            )
+
+        return EntityAnalyzer.availability_reason(registry_entry, state, device_entry, config_entry)
+
+    @staticmethod
+    def availability_reason(
+        registry_entry,
+        state,
+        device_entry,
+        config_entry,
+        now: datetime | None = None
+    ) -> str | None:
+        """Determine why an entity is unavailable from already looked-up entries.
+
+        Same result as determine_availability_reason, for callers that hold
+        prebuilt registry indexes (see RegistryAdapter.build_snapshot).
+
+        Args:
+            registry_entry: Entity registry entry (or None if not in registry)
+            state: Current state object (or None if no state)
+            device_entry: Device of the registry entry (or None)
+            config_entry: Config entry of the registry entry (or None)
+            now: Reference time for unavailable durations (defaults to now)
+
         Returns:
             Human-readable reason for unavailability, or None if entity is available
         """
@@ -49,28 +81,23 @@ class EntityAnalyzer:
             return reasons.get(registry_entry.disabled_by, "Disabled")
 
         # Check device status
-        if registry_entry and registry_entry.device_id:
-            device_entry = device_registry.async_get(registry_entry.device_id)
-            if device_entry and device_entry.disabled:
-                return f"Parent device '{device_entry.name}' is disabled"
+        if device_entry and device_entry.disabled:
+            return f"Parent device '{device_entry.name}' is disabled"
 
         # Check config entry status
-        if registry_entry and registry_entry.config_entry_id:
-            config_entry = hass.config_entries.async_get_entry(
-                registry_entry.config_entry_id
-            )
-            if config_entry:
-                platform_name = registry_entry.platform or "integration"
-                if config_entry.state.name == "SETUP_ERROR":
-                    return f"Integration failed to load ({platform_name})"
-                elif config_entry.state.name == "SETUP_RETRY":
-                    return f"Integration retrying setup ({platform_name})"
-                elif config_entry.state.name == "NOT_LOADED":
-                    return f"Integration not loaded ({platform_name})"
+        if registry_entry and config_entry:
+            platform_name = registry_entry.platform or "integration"
+            if config_entry.state.name == "SETUP_ERROR":
+                return f"Integration failed to load ({platform_name})"
+            elif config_entry.state.name == "SETUP_RETRY":
+                return f"Integration retrying setup ({platform_name})"
+            elif config_entry.state.name == "NOT_LOADED":
+                return f"Integration not loaded ({platform_name})"
 
         # Check if recently unavailable (likely still loading)
         if state and state.state in ["unavailable", "unknown"]:
-            now = datetime.now(timezone.utc)
+            if now is None:
+                now = datetime.now(timezone.utc)
             duration = (now - state.last_changed).total_seconds()
 
             if duration < 120:  # Less than 2 minutes
@@ -180,15 +207,18 @@ class EntityAnalyzer:
         with engine.connect() as conn:
             # Get count of updates in last 24 hours
             cutoff_ts = datetime.now(timezone.utc).timestamp() - 86400
-            count_query = text("""
-                SELECT COUNT(*)
-                FROM states s
-                JOIN states_meta sm ON s.metadata_id = sm.metadata_id
-                WHERE sm.entity_id = :entity_id
-                AND s.last_updated_ts >= :cutoff
-            """)
-            count_result = conn.execute(count_query, {"entity_id": entity_id, "cutoff": cutoff_ts})
-            count_24h = count_result.scalar()
+            # Range scan on the (metadata_id, last_updated_ts) index
+            metadata_ids = list(resolve_metadata_ids(conn, [entity_id]))
+            count_24h = 0
+            if metadata_ids:
+                count_query = text("""
+                    SELECT COUNT(*)
+                    FROM states
+                    WHERE metadata_id IN :metadata_ids
+                    AND last_updated_ts >= :cutoff
+                """).bindparams(bindparam("metadata_ids", expanding=True))
+                count_result = conn.execute(count_query, {"metadata_ids": metadata_ids, "cutoff": cutoff_ts})
+                count_24h = count_result.scalar()
 
             # Need at least 2 messages to calculate meaningful interval
             if count_24h < 2:
@@ -237,16 +267,24 @@ class EntityAnalyzer:
                 return f"{hours:.2f}h"
 
     @staticmethod
-    def get_hourly_message_counts(engine: Engine, entity_id: str, hours: int) -> dict[str, Any]:
+    def get_hourly_message_counts(
+        engine: Engine,
+        entity_id: str,
+        hours: int,
+        cache: HistogramCache | None = None,
+    ) -> dict[str, Any]:
         """Get message counts per hour for the specified time range.
 
         Groups state updates by hour to show activity patterns (e.g., burst vs idle periods).
-        Useful for visualizing when entities are most active.
+        Useful for visualizing when entities are most active. Only completed
+        hours are counted, so with a cache a repeated request only counts the
+        hours that closed since the last one.
 
         Args:
             engine: Database engine
             entity_id: Entity ID to analyze
             hours: Time range in hours (24, 48, or 168 for 7 days)
+            cache: Optional cache of closed buckets
 
         Returns:
             Dictionary with:
@@ -256,62 +294,25 @@ class EntityAnalyzer:
         """
         with engine.connect() as conn:
             # Use UTC for consistent timestamp calculations
-            now = datetime.now(timezone.utc)
-
-            # Round down to the start of the current hour for aligned buckets
-            # This ensures buckets align to clock hours (e.g., 14:00-15:00, 15:00-16:00)
-            current_hour_start = now.replace(minute=0, second=0, microsecond=0)
-            end_cutoff = current_hour_start.timestamp()
-
-            # Go back the specified number of hours from the current hour start
-            cutoff_ts = end_cutoff - (hours * 3600)
-
-            # Get message counts grouped by hour
-            # hour_bucket 0 = oldest hour, hour_bucket N-1 = most recent hour
-            # Using FLOOR instead of CAST for more consistent behavior across databases
-            query = text("""
-                SELECT
-                    FLOOR((last_updated_ts - :cutoff) / 3600.0) as hour_bucket,
-                    COUNT(*) as count
-                FROM states s
-                JOIN states_meta sm ON s.metadata_id = sm.metadata_id
-                WHERE sm.entity_id = :entity_id
-                AND s.last_updated_ts >= :cutoff
-                AND s.last_updated_ts < :end_cutoff
-                GROUP BY hour_bucket
-                ORDER BY hour_bucket
-            """)
-
-            result = conn.execute(query, {
-                "entity_id": entity_id,
-                "cutoff": cutoff_ts,
-                "end_cutoff": end_cutoff
-            })
-
-            # Create array with all hours (0 to hours-1), fill missing hours with 0
-            hourly_counts = [0] * hours
-            total = 0
+            now = datetime.now(timezone.utc).timestamp()
 
-            for row in result:
-                # Convert row to NamedTuple for type-safe access
-                row_data = HourlyMessageRow(
-                    hour_bucket=int(row[0]) if row[0] is not None else -1,
-                    count=row[1]
-                )
+            # Buckets align to clock hours (e.g., 14:00-15:00, 15:00-16:00) and
+            # end at the start of the current hour: index 0 = oldest hour
+            end_bucket = int(now // 3600)
+            first_bucket = end_bucket - hours
 
-                # Validate bounds to prevent array index errors
-                if 0 <= row_data.hour_bucket < hours:
-                    hourly_counts[row_data.hour_bucket] = row_data.count
-                    total += row_data.count
-                else:
-                    # Log unexpected hour buckets (shouldn't happen with proper query)
-                    _LOGGER.warning(
-                        "Unexpected hour_bucket %s for entity %s (hours=%s). Skipping.",
-                        row_data.hour_bucket, entity_id, hours
-                    )
+            hourly_counts = [0] * hours
+            metadata_ids = list(resolve_metadata_ids(conn, [entity_id], cache))
+            if metadata_ids:
+                counts = count_message_buckets(
+                    conn, metadata_ids, 3600, first_bucket, end_bucket, now, cache
+                )
+                for series in counts.values():
+                    for index, count in enumerate(series):
+                        hourly_counts[index] += count
 
             return {
                 "hourly_counts": hourly_counts,
-                "total_messages": total,
+                "total_messages": sum(hourly_counts),
                 "time_range_hours": hours
             }
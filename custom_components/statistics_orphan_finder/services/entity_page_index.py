@@ -0,0 +1,201 @@
+"""Server-side pagination, sorting and filtering of the finalized entity list."""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Page size limits
+DEFAULT_PAGE_LIMIT = 100
+MAX_PAGE_LIMIT = 1000
+
+# Number of filtered+sorted position lists kept for repeated page requests
+RESULT_CACHE_SIZE = 8
+
+SORT_DIRECTIONS = ("asc", "desc")
+
+# Sort key functions (mirror EntityFilterService.sortEntities in the frontend)
+SORT_KEYS: dict[str, Callable[[dict[str, Any]], Any]] = {
+    'entity_id': lambda e: e['entity_id'],
+    'registry_status': lambda e: e['registry_status'],
+    'state_status': lambda e: e['state_status'],
+    'states_count': lambda e: e['states_count'],
+    'stats_short_count': lambda e: e['stats_short_count'],
+    'stats_long_count': lambda e: e['stats_long_count'],
+    'estimated_bytes': lambda e: e.get('estimated_bytes', 0),
+    'update_interval': lambda e: (
+        e['update_interval_seconds'] if e['update_interval_seconds'] is not None else 999999
+    ),
+    'last_state_update': lambda e: e['last_state_update'] or '',
+    'last_stats_update': lambda e: e['last_stats_update'] or '',
+    'in_entity_registry': lambda e: bool(e['in_entity_registry']),
+    'in_state_machine': lambda e: bool(e['in_state_machine']),
+    'in_states_meta': lambda e: bool(e['in_states_meta']),
+    'in_states': lambda e: bool(e['in_states']),
+    'in_statistics_meta': lambda e: bool(e['in_statistics_meta']),
+    'in_statistics_short_term': lambda e: bool(e['in_statistics_short_term']),
+    'in_statistics_long_term': lambda e: bool(e['in_statistics_long_term']),
+}
+
+# Column ids used by the frontend table that map onto a sort key
+SORT_KEY_ALIASES = {
+    'registry': 'registry_status',
+    'state': 'state_status',
+}
+
+# Exact-match filters on entity fields
+FILTER_FIELDS = ('registry_status', 'state_status', 'origin', 'domain')
+
+
+class EntityPageIndex:
+    """Read-only index over a finalized entities list for paged access.
+
+    The entities list is shared with the cached overview and never mutated.
+    Sort orders are computed once per (sort key, direction) as lists of
+    positions into the entities list; later requests for the same order
+    reuse them. Filtering walks a precomputed order and keeps positions
+    whose entity matches, so the result is already sorted. The most recent
+    filtered orders are kept in a small LRU so scrolling through pages of
+    the same view only slices a list.
+
+    Thread-safety: pages are built in executor threads, so the memoized
+    orders and results are guarded by a lock.
+    """
+
+    def __init__(self, entities: list[dict[str, Any]], generated_at: float | None = None) -> None:
+        """Initialize index.
+
+        Args:
+            entities: Finalized entity dictionaries (step 6 list enriched by steps 7-8)
+            generated_at: Unix timestamp of the overview (defaults to now)
+        """
+        self._entities = entities
+        self.generated_at = generated_at if generated_at is not None else time.time()
+        self._domains = [entity['entity_id'].split('.', 1)[0] for entity in entities]
+        self._search_keys = [entity['entity_id'].lower() for entity in entities]
+        self._orders: dict[tuple[str, str], list[int]] = {}
+        self._results: OrderedDict[tuple, list[int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Precompute the default order so the first page is a plain slice
+        self._get_order('entity_id', 'asc')
+
+    @property
+    def total_entities(self) -> int:
+        """Number of entities in the index."""
+        return len(self._entities)
+
+    @staticmethod
+    def normalize_sort_key(sort_key: str) -> str:
+        """Resolve frontend column aliases and validate the sort key.
+
+        Args:
+            sort_key: Sort key or frontend column id
+
+        Returns:
+            str: Canonical sort key
+
+        Raises:
+            ValueError: If the sort key is not supported
+        """
+        sort_key = SORT_KEY_ALIASES.get(sort_key, sort_key)
+        if sort_key not in SORT_KEYS:
+            raise ValueError(f"Unsupported sort key: {sort_key}")
+        return sort_key
+
+    def _get_order(self, sort_key: str, direction: str) -> list[int]:
+        """Return positions sorted by key, computing and memoizing on first use.
+
+        Ties keep entity_id order in both directions, matching the stable
+        sort used by the frontend.
+        """
+        order = self._orders.get((sort_key, direction))
+        if order is None:
+            key_func = SORT_KEYS[sort_key]
+            entities = self._entities
+            order = sorted(
+                range(len(entities)),
+                key=lambda i: key_func(entities[i]),
+                reverse=direction == 'desc'
+            )
+            self._orders[(sort_key, direction)] = order
+        return order
+
+    def _matches(self, position: int, filters: dict[str, str], search: str) -> bool:
+        """Check whether the entity at position passes all filters."""
+        entity = self._entities[position]
+        for field, value in filters.items():
+            actual = self._domains[position] if field == 'domain' else entity.get(field)
+            if actual != value:
+                return False
+        return not search or search in self._search_keys[position]
+
+    def get_page(
+        self,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_LIMIT,
+        sort_key: str = 'entity_id',
+        direction: str = 'asc',
+        filters: dict[str, str] | None = None,
+        search: str | None = None,
+    ) -> dict[str, Any]:
+        """Return one page of filtered, sorted entities.
+
+        Args:
+            offset: Index of the first entity in the filtered result
+            limit: Maximum number of entities to return (1-MAX_PAGE_LIMIT)
+            sort_key: Sort key (see SORT_KEYS) or frontend column alias
+            direction: "asc" or "desc"
+            filters: Exact-match filters keyed by FILTER_FIELDS
+            search: Case-insensitive substring matched against entity_id
+
+        Returns:
+            dict: Page entities plus total/filtered counts and echo of parameters
+
+        Raises:
+            ValueError: If any parameter is out of range or unsupported
+        """
+        if offset < 0:
+            raise ValueError("offset must be >= 0")
+        if not 1 <= limit <= MAX_PAGE_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_LIMIT}")
+        if direction not in SORT_DIRECTIONS:
+            raise ValueError(f"direction must be one of: {', '.join(SORT_DIRECTIONS)}")
+        sort_key = self.normalize_sort_key(sort_key)
+
+        active_filters = {field: value for field, value in (filters or {}).items() if value}
+        unknown = set(active_filters) - set(FILTER_FIELDS)
+        if unknown:
+            raise ValueError(f"Unsupported filter: {', '.join(sorted(unknown))}")
+        search_key = (search or '').strip().lower()
+
+        cache_key = (sort_key, direction, tuple(sorted(active_filters.items())), search_key)
+
+        with self._lock:
+            positions = self._results.get(cache_key)
+            if positions is None:
+                order = self._get_order(sort_key, direction)
+                if active_filters or search_key:
+                    positions = [
+                        i for i in order if self._matches(i, active_filters, search_key)
+                    ]
+                else:
+                    positions = order
+                self._results[cache_key] = positions
+                if len(self._results) > RESULT_CACHE_SIZE:
+                    self._results.popitem(last=False)
+            else:
+                self._results.move_to_end(cache_key)
+
+        return {
+            'entities': [self._entities[i] for i in positions[offset:offset + limit]],
+            'total': len(positions),
+            'total_entities': len(self._entities),
+            'offset': offset,
+            'limit': limit,
+            'sort': sort_key,
+            'direction': direction,
+            'generated_at': self.generated_at,
+        }
@@ -3,11 +3,19 @@ import logging
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
+from .chunked_query import execute_chunked_in
+from .database_service import fetch_estimated_row_counts
 from .entity_analyzer import EntityAnalyzer
+from .overview_snapshot import (
+    OverviewSnapshot,
+    SCAN_MODE_FULL,
+    SCAN_MODE_INCREMENTAL,
+    SNAPSHOT_TABLES,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -16,7 +24,8 @@ class EntityRepository:
     """Stateless repository for querying entity data from database.
 
     All methods accept an SQLAlchemy engine and return data structures
-    without side effects. The coordinator orchestrates the queries and
+    without side effects, except that an OverviewSnapshot passed in is
+    brought up to date. The coordinator orchestrates the queries and
     updates session data.
     """
 
@@ -36,15 +45,58 @@ class EntityRepository:
             return {row[0] for row in result}
 
     @staticmethod
-    def fetch_states_with_counts(engine: Engine) -> tuple[dict[str, Any], dict[str, Any]]:
+    def fetch_states_metadata_map(engine: Engine) -> dict[int, str]:
+        """Fetch metadata_id to entity_id mapping from states_meta table.
+
+        Args:
+            engine: SQLAlchemy database engine
+
+        Returns:
+            dict: Mapping of metadata_id to entity_id
+        """
+        with engine.connect() as conn:
+            return EntityRepository._states_metadata_map(conn)
+
+    @staticmethod
+    def _states_metadata_map(conn) -> dict[int, str]:
+        """Read states_meta into a metadata_id to entity_id mapping."""
+        result = conn.execute(text("SELECT metadata_id, entity_id FROM states_meta"))
+        return {row[0]: row[1] for row in result}
+
+    @staticmethod
+    def _statistics_metadata_map(conn) -> dict[int, str]:
+        """Read statistics_meta into an id to statistic_id mapping."""
+        result = conn.execute(text("SELECT id, statistic_id FROM statistics_meta"))
+        return {row[0]: row[1] for row in result}
+
+    @staticmethod
+    def fetch_states_with_counts(
+        engine: Engine,
+        combined: bool = True,
+        metadata_map: dict[int, str] | None = None,
+        snapshot: OverviewSnapshot | None = None
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
         """Fetch states counts, last updates, and update frequencies.
 
-        Performs two queries:
-        1. State counts and last update timestamps
-        2. Update frequencies for entities (batched for N+1 prevention)
+        Aggregates by the indexed integer metadata_id column and maps the
+        results to entity_ids in Python, so the database never groups on
+        the VARCHAR entity_id or joins states_meta for every fact row.
+
+        In combined mode (default) a single pass over the states table
+        computes the total count, the last update and the 24h update count
+        using conditional aggregation. The legacy mode performs two queries
+        (totals, then a separate 24h frequency scan) and is kept for
+        benchmarking and as a fallback.
+
+        With a snapshot, only rows above the snapshot's state_id watermark
+        are aggregated and merged (see _fetch_states_incremental).
 
         Args:
             engine: SQLAlchemy database engine
+            combined: Use single-pass conditional aggregation
+            metadata_map: Optional metadata_id to entity_id mapping from
+                states_meta. Fetched on the same connection if not provided.
+            snapshot: Optional persistent snapshot for incremental scans
 
         Returns:
             tuple: (states_data, frequency_data) dictionaries
@@ -53,18 +105,53 @@ class EntityRepository:
         """
         states_data = {}
         frequency_data = {}
+        cutoff_ts = datetime.now(timezone.utc).timestamp() - 86400
 
         with engine.connect() as conn:
+            if metadata_map is None:
+                metadata_map = EntityRepository._states_metadata_map(conn)
+
+            if snapshot is not None:
+                return EntityRepository._fetch_states_incremental(
+                    conn, snapshot, metadata_map, cutoff_ts
+                )
+
+            if combined:
+                # Single scan: count, last update and 24h count in one GROUP BY
+                query = text("""
+                    SELECT
+                        s.metadata_id,
+                        COUNT(*) as count,
+                        MAX(s.last_updated_ts) as last_update,
+                        SUM(CASE WHEN s.last_updated_ts >= :cutoff THEN 1 ELSE 0 END) as count_24h
+                    FROM states s
+                    GROUP BY s.metadata_id
+                """)
+                result = conn.execute(query, {"cutoff": cutoff_ts})
+                for row in result:
+                    entity_id = metadata_map.get(row[0])
+                    if entity_id is None:
+                        continue
+                    states_data[entity_id] = {
+                        'count': row[1],
+                        'last_update': datetime.fromtimestamp(row[2]).isoformat() if row[2] else None
+                    }
+                    count_24h = int(row[3] or 0)
+                    if count_24h >= 2:
+                        frequency_data[entity_id] = EntityRepository._build_frequency(count_24h)
+                return states_data, frequency_data
+
             # Query 1: Fetch state counts and last updates
             query = text("""
-                SELECT sm.entity_id, COUNT(*) as count, MAX(s.last_updated_ts) as last_update
+                SELECT s.metadata_id, COUNT(*) as count, MAX(s.last_updated_ts) as last_update
                 FROM states s
-                JOIN states_meta sm ON s.metadata_id = sm.metadata_id
-                GROUP BY sm.entity_id
+                GROUP BY s.metadata_id
             """)
             result = conn.execute(query)
             for row in result:
-                entity_id = row[0]
+                entity_id = metadata_map.get(row[0])
+                if entity_id is None:
+                    continue
                 states_data[entity_id] = {
                     'count': row[1],
                     'last_update': datetime.fromtimestamp(row[2]).isoformat() if row[2] else None
@@ -72,27 +159,242 @@ class EntityRepository:
 
             # Query 2: PERFORMANCE OPTIMIZATION - Batch calculate update frequencies
             # This eliminates N+1 queries that would happen in step 6
-            cutoff_ts = datetime.now(timezone.utc).timestamp() - 86400
             frequency_query = text("""
-                SELECT sm.entity_id, COUNT(*) as count_24h
+                SELECT s.metadata_id, COUNT(*) as count_24h
                 FROM states s
-                JOIN states_meta sm ON s.metadata_id = sm.metadata_id
                 WHERE s.last_updated_ts >= :cutoff
-                GROUP BY sm.entity_id
+                GROUP BY s.metadata_id
                 HAVING COUNT(*) >= 2
             """)
             freq_result = conn.execute(frequency_query, {"cutoff": cutoff_ts})
             for row in freq_result:
-                entity_id, count_24h = row[0], row[1]
-                interval_seconds = 86400 // count_24h
-                frequency_data[entity_id] = {
-                    'interval_seconds': interval_seconds,
-                    'update_count_24h': count_24h,
-                    'interval_text': EntityAnalyzer.format_interval(interval_seconds)
-                }
+                entity_id = metadata_map.get(row[0])
+                if entity_id is not None:
+                    frequency_data[entity_id] = EntityRepository._build_frequency(row[1])
 
         return states_data, frequency_data
 
+    @staticmethod
+    def _table_id_bounds(conn, table_name: str) -> tuple[int | None, int | None]:
+        """Get min and max primary key of a snapshot-tracked fact table.
+
+        Args:
+            conn: Database connection
+            table_name: states, statistics or statistics_short_term
+
+        Returns:
+            tuple: (min_id, max_id), both None if the table is empty
+        """
+        id_column = SNAPSHOT_TABLES[table_name]
+        # table_name/id_column come from the SNAPSHOT_TABLES whitelist
+        row = conn.execute(
+            text(f"SELECT MIN({id_column}), MAX({id_column}) FROM {table_name}")
+        ).fetchone()
+        return (row[0], row[1]) if row else (None, None)
+
+    @staticmethod
+    def _recount_pending(
+        conn, table_name: str, snapshot: OverviewSnapshot, max_id: int
+    ) -> dict[int, tuple[int, float | None]] | None:
+        """Count the rows of metadata_ids marked for recount, up to max_id.
+
+        Each metadata_id is an index range on the fact table, and these are
+        entities whose rows are being deleted, so the ranges are short.
+
+        Args:
+            conn: Database connection
+            table_name: states, statistics or statistics_short_term
+            snapshot: Persistent overview snapshot
+            max_id: Primary key bound of the current refresh
+
+        Returns:
+            dict: {metadata_id: (count, last_ts)} with (0, None) for
+                metadata_ids without rows, or None if nothing is pending
+        """
+        metadata_ids = snapshot.pending_recount(table_name)
+        if not metadata_ids:
+            return None
+
+        id_column = SNAPSHOT_TABLES[table_name]
+        ts_column = 'last_updated_ts' if table_name == 'states' else 'start_ts'
+        # table_name/id_column come from the SNAPSHOT_TABLES whitelist
+        query = text(f"""
+            SELECT metadata_id, COUNT(*), MAX({ts_column})
+            FROM {table_name}
+            WHERE metadata_id IN :metadata_ids
+            AND {id_column} <= :max_id
+            GROUP BY metadata_id
+        """).bindparams(bindparam("metadata_ids", expanding=True))
+
+        recounted: dict[int, tuple[int, float | None]] = {
+            metadata_id: (0, None) for metadata_id in metadata_ids
+        }
+        for row in execute_chunked_in(conn, query, "metadata_ids", metadata_ids, {"max_id": max_id}):
+            recounted[row[0]] = (row[1], row[2])
+        return recounted
+
+    @staticmethod
+    def _fetch_states_incremental(
+        conn,
+        snapshot: OverviewSnapshot,
+        metadata_map: dict[int, str],
+        cutoff_ts: float
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Bring the states snapshot up to date and build step 2 results.
+
+        Full mode runs the combined single-pass aggregation bounded by the
+        current max state_id. Incremental mode aggregates only rows above the
+        watermark. The 24h counts cannot be maintained incrementally (the
+        window slides), so outside full mode they come from a range query on
+        last_updated_ts which only touches the last day of rows.
+
+        Args:
+            conn: Database connection
+            snapshot: Persistent overview snapshot (updated in place)
+            metadata_map: metadata_id to entity_id mapping from states_meta
+            cutoff_ts: Start of the 24h frequency window
+
+        Returns:
+            tuple: (states_data, frequency_data) as fetch_states_with_counts
+        """
+        counts_24h: dict[int, int] = {}
+
+        with snapshot.refreshing('states'):
+            min_id, max_id = EntityRepository._table_id_bounds(conn, 'states')
+            estimated_rows = fetch_estimated_row_counts(conn, conn.dialect.name).get('states')
+            scan_mode, watermark = snapshot.plan('states', min_id, max_id, estimated_rows)
+
+            delta: dict[int, tuple[int, float | None]] = {}
+            if scan_mode == SCAN_MODE_FULL and max_id is not None:
+                query = text("""
+                    SELECT
+                        s.metadata_id,
+                        COUNT(*) as count,
+                        MAX(s.last_updated_ts) as last_update,
+                        SUM(CASE WHEN s.last_updated_ts >= :cutoff THEN 1 ELSE 0 END) as count_24h
+                    FROM states s
+                    WHERE s.state_id <= :max_id
+                    GROUP BY s.metadata_id
+                """)
+                for row in conn.execute(query, {"cutoff": cutoff_ts, "max_id": max_id}):
+                    delta[row[0]] = (row[1], row[2])
+                    counts_24h[row[0]] = int(row[3] or 0)
+            elif scan_mode == SCAN_MODE_INCREMENTAL:
+                query = text("""
+                    SELECT s.metadata_id, COUNT(*) as count, MAX(s.last_updated_ts) as last_update
+                    FROM states s
+                    WHERE s.state_id > :watermark AND s.state_id <= :max_id
+                    GROUP BY s.metadata_id
+                """)
+                for row in conn.execute(query, {"watermark": watermark, "max_id": max_id}):
+                    delta[row[0]] = (row[1], row[2])
+
+            recounted = None
+            if scan_mode != SCAN_MODE_FULL and max_id is not None:
+                recounted = EntityRepository._recount_pending(conn, 'states', snapshot, max_id)
+
+            aggregates = snapshot.apply(
+                'states', scan_mode, delta, min_id, max_id, estimated_rows, recounted
+            )
+
+        if scan_mode != SCAN_MODE_FULL:
+            window_query = text("""
+                SELECT s.metadata_id, COUNT(*) as count_24h
+                FROM states s
+                WHERE s.last_updated_ts >= :cutoff
+                GROUP BY s.metadata_id
+            """)
+            for row in conn.execute(window_query, {"cutoff": cutoff_ts}):
+                counts_24h[row[0]] = row[1]
+
+        _LOGGER.debug("States aggregation used %s scan (%d entities)", scan_mode, len(aggregates))
+
+        states_data = {}
+        frequency_data = {}
+        for metadata_id, (count, last_ts) in aggregates.items():
+            entity_id = metadata_map.get(metadata_id)
+            if entity_id is None or count <= 0:
+                continue
+            states_data[entity_id] = {
+                'count': count,
+                'last_update': datetime.fromtimestamp(last_ts).isoformat() if last_ts else None
+            }
+            count_24h = counts_24h.get(metadata_id, 0)
+            if count_24h >= 2:
+                frequency_data[entity_id] = EntityRepository._build_frequency(count_24h)
+
+        return states_data, frequency_data
+
+    @staticmethod
+    def _aggregate_statistics_incremental(
+        conn, table_name: str, snapshot: OverviewSnapshot
+    ) -> dict[int, tuple[int, float | None]]:
+        """Bring a statistics table snapshot up to date.
+
+        Args:
+            conn: Database connection
+            table_name: statistics or statistics_short_term
+            snapshot: Persistent overview snapshot (updated in place)
+
+        Returns:
+            dict: {metadata_id: (count, last_ts)} for the whole table
+        """
+        with snapshot.refreshing(table_name):
+            min_id, max_id = EntityRepository._table_id_bounds(conn, table_name)
+            estimated_rows = fetch_estimated_row_counts(conn, conn.dialect.name).get(table_name)
+            scan_mode, watermark = snapshot.plan(table_name, min_id, max_id, estimated_rows)
+
+            delta: dict[int, tuple[int, float | None]] = {}
+            if scan_mode == SCAN_MODE_FULL and max_id is not None:
+                # table_name is validated by the caller against the whitelist
+                query = text(f"""
+                    SELECT s.metadata_id, COUNT(*) as count, MAX(s.start_ts) as last_update
+                    FROM {table_name} s
+                    WHERE s.id <= :max_id
+                    GROUP BY s.metadata_id
+                """)
+                params = {"max_id": max_id}
+            elif scan_mode == SCAN_MODE_INCREMENTAL:
+                query = text(f"""
+                    SELECT s.metadata_id, COUNT(*) as count, MAX(s.start_ts) as last_update
+                    FROM {table_name} s
+                    WHERE s.id > :watermark AND s.id <= :max_id
+                    GROUP BY s.metadata_id
+                """)
+                params = {"watermark": watermark, "max_id": max_id}
+            else:
+                query = None
+
+            if query is not None:
+                for row in conn.execute(query, params):
+                    delta[row[0]] = (row[1], row[2])
+
+            recounted = None
+            if scan_mode != SCAN_MODE_FULL and max_id is not None:
+                recounted = EntityRepository._recount_pending(conn, table_name, snapshot, max_id)
+
+            _LOGGER.debug("%s aggregation used %s scan", table_name, scan_mode)
+            return snapshot.apply(
+                table_name, scan_mode, delta, min_id, max_id, estimated_rows, recounted
+            )
+
+    @staticmethod
+    def _build_frequency(count_24h: int) -> dict[str, Any]:
+        """Build update frequency data from a 24h message count.
+
+        Args:
+            count_24h: Number of state updates in the last 24 hours (>= 2)
+
+        Returns:
+            dict: {interval_seconds, update_count_24h, interval_text}
+        """
+        interval_seconds = 86400 // count_24h
+        return {
+            'interval_seconds': interval_seconds,
+            'update_count_24h': count_24h,
+            'interval_text': EntityAnalyzer.format_interval(interval_seconds)
+        }
+
     @staticmethod
     def fetch_statistics_meta(engine: Engine) -> dict[str, int]:
         """Fetch statistics metadata with entity IDs and metadata IDs.
@@ -105,23 +407,71 @@ class EntityRepository:
         Returns:
             dict: Mapping of entity_id to metadata_id
         """
-        metadata_map = {}
-
         with engine.connect() as conn:
-            query = text("SELECT id, statistic_id FROM statistics_meta")
-            result = conn.execute(query)
-            for row in result:
-                metadata_id, entity_id = row[0], row[1]
-                metadata_map[entity_id] = metadata_id
+            return {
+                entity_id: metadata_id
+                for metadata_id, entity_id in EntityRepository._statistics_metadata_map(conn).items()
+            }
 
-        return metadata_map
+    @staticmethod
+    def _aggregate_statistics_table(
+        conn,
+        table_name: str,
+        metadata_map: dict[int, str] | None,
+        snapshot: OverviewSnapshot | None = None
+    ) -> dict[str, Any]:
+        """Aggregate count and last start_ts per metadata_id for a statistics table.
+
+        Args:
+            conn: Database connection
+            table_name: statistics or statistics_short_term
+            metadata_map: Optional id to statistic_id mapping from statistics_meta
+            snapshot: Optional persistent snapshot for incremental scans
+
+        Returns:
+            dict: {entity_id: {count, last_update}}
+        """
+        if table_name not in ('statistics', 'statistics_short_term'):
+            raise ValueError(f"Invalid table name: {table_name}")
+
+        if metadata_map is None:
+            metadata_map = EntityRepository._statistics_metadata_map(conn)
+
+        if snapshot is not None:
+            rows = EntityRepository._aggregate_statistics_incremental(conn, table_name, snapshot)
+        else:
+            # table_name is validated against the whitelist above
+            query = text(f"""
+                SELECT s.metadata_id, COUNT(*) as count, MAX(s.start_ts) as last_update
+                FROM {table_name} s
+                GROUP BY s.metadata_id
+            """)
+            rows = {row[0]: (row[1], row[2]) for row in conn.execute(query)}
+
+        stats_data = {}
+        for metadata_id, (count, last_ts) in rows.items():
+            entity_id = metadata_map.get(metadata_id)
+            if entity_id is None or count <= 0:
+                continue
+            stats_data[entity_id] = {
+                'count': count,
+                'last_update': datetime.fromtimestamp(last_ts).isoformat() if last_ts else None
+            }
+        return stats_data
 
     @staticmethod
-    def fetch_statistics_short_term(engine: Engine) -> dict[str, Any]:
+    def fetch_statistics_short_term(
+        engine: Engine,
+        metadata_map: dict[int, str] | None = None,
+        snapshot: OverviewSnapshot | None = None
+    ) -> dict[str, Any]:
         """Fetch short-term statistics counts and last updates.
 
         Args:
             engine: SQLAlchemy database engine
+            metadata_map: Optional id to statistic_id mapping from statistics_meta.
+                Fetched on the same connection if not provided.
+            snapshot: Optional persistent snapshot for incremental scans
 
         Returns:
             dict: {entity_id: {count, last_update}}
@@ -134,19 +484,9 @@ class EntityRepository:
 
         with engine.connect() as conn:
             try:
-                query = text("""
-                    SELECT sm.statistic_id, COUNT(*) as count, MAX(s.start_ts) as last_update
-                    FROM statistics_short_term s
-                    JOIN statistics_meta sm ON s.metadata_id = sm.id
-                    GROUP BY sm.statistic_id
-                """)
-                result = conn.execute(query)
-                for row in result:
-                    entity_id = row[0]
-                    stats_data[entity_id] = {
-                        'count': row[1],
-                        'last_update': datetime.fromtimestamp(row[2]).isoformat() if row[2] else None
-                    }
+                stats_data = EntityRepository._aggregate_statistics_table(
+                    conn, 'statistics_short_term', metadata_map, snapshot
+                )
             except OperationalError as err:
                 # Table might not exist in older HA versions or different database configurations
                 _LOGGER.info("statistics_short_term table not available: %s", err)
@@ -158,30 +498,23 @@ class EntityRepository:
         return stats_data
 
     @staticmethod
-    def fetch_statistics_long_term(engine: Engine) -> dict[str, Any]:
+    def fetch_statistics_long_term(
+        engine: Engine,
+        metadata_map: dict[int, str] | None = None,
+        snapshot: OverviewSnapshot | None = None
+    ) -> dict[str, Any]:
         """Fetch long-term statistics counts and last updates.
 
         Args:
             engine: SQLAlchemy database engine
+            metadata_map: Optional id to statistic_id mapping from statistics_meta.
+                Fetched on the same connection if not provided.
+            snapshot: Optional persistent snapshot for incremental scans
 
         Returns:
             dict: {entity_id: {count, last_update}}
         """
-        stats_data = {}
-
         with engine.connect() as conn:
-            query = text("""
-                SELECT sm.statistic_id, COUNT(*) as count, MAX(s.start_ts) as last_update
-                FROM statistics s
-                JOIN statistics_meta sm ON s.metadata_id = sm.id
-                GROUP BY sm.statistic_id
-            """)
-            result = conn.execute(query)
-            for row in result:
-                entity_id = row[0]
-                stats_data[entity_id] = {
-                    'count': row[1],
-                    'last_update': datetime.fromtimestamp(row[2]).isoformat() if row[2] else None
-                }
-
-        return stats_data
+            return EntityRepository._aggregate_statistics_table(
+                conn, 'statistics', metadata_map, snapshot
+            )
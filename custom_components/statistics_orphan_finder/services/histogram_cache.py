@@ -0,0 +1,236 @@
+"""Bounded LRU cache of closed message histogram buckets."""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable
+
+from .overview_snapshot import RECOUNT_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+# Total buckets kept across all cached series (about 8 bytes each)
+HISTOGRAM_CACHE_MAX_BUCKETS = 500_000
+
+# Seconds after a bucket ends before it counts as closed. The recorder
+# commits in batches, so rows for a bucket can still arrive shortly after.
+HISTOGRAM_SETTLE_SECONDS = 30
+
+# Seconds a resolved entity_id -> metadata_ids lookup is reused. Bounded so
+# an entity that is deleted and recorded again picks up its new metadata_id.
+METADATA_ID_TTL = 600
+
+# Resolved entity_ids kept (least recently used dropped first)
+MAX_CACHED_METADATA_IDS = 10_000
+
+
+class HistogramCache:
+    """Completed histogram buckets per (metadata_id, bucket size).
+
+    A series holds the counts of consecutive closed buckets starting at an
+    absolute bucket index (Unix timestamp // bucket size). Closed buckets
+    never change, so a later request only has to count the buckets after
+    the cached ones: the open bucket and any buckets that closed since.
+
+    Series of the same key that overlap or touch are merged, so requests
+    with different time ranges extend one series instead of replacing each
+    other. metadata_ids that delete SQL was generated for are not cached
+    for RECOUNT_WINDOW seconds (see invalidate).
+
+    Memory is capped by the total number of cached buckets; the least
+    recently used series are evicted first. The entity_id -> metadata_id
+    lookups in front of the histogram queries are cached as well, for
+    METADATA_ID_TTL seconds.
+
+    Thread-safety: histograms are built in executor threads, so all access
+    is guarded by a lock.
+    """
+
+    def __init__(self, max_buckets: int = HISTOGRAM_CACHE_MAX_BUCKETS) -> None:
+        """Initialize cache.
+
+        Args:
+            max_buckets: Maximum number of buckets kept across all series
+        """
+        self.max_buckets = max_buckets
+        self._series: OrderedDict[tuple[int, int], tuple[int, list[int]]] = OrderedDict()
+        self._bucket_total = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._metadata_ids: OrderedDict[str, tuple[float, tuple[int, ...]]] = OrderedDict()
+        self._invalidated: dict[int, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, metadata_id: int, bucket_seconds: int, first_bucket: int) -> list[int] | None:
+        """Return cached closed counts from first_bucket onwards.
+
+        Args:
+            metadata_id: states_meta metadata_id
+            bucket_seconds: Bucket size in seconds
+            first_bucket: Absolute index of the first bucket needed
+
+        Returns:
+            list: Counts of the closed buckets first_bucket, first_bucket + 1, ...
+                (possibly empty), or None if the cache does not reach back
+                to first_bucket
+        """
+        key = (metadata_id, bucket_seconds)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None or series[0] > first_bucket or self._is_invalidated(metadata_id):
+                self._misses += 1
+                return None
+            self._series.move_to_end(key)
+            self._hits += 1
+            start, counts = series
+            return counts[first_bucket - start:]
+
+    def store(self, metadata_id: int, bucket_seconds: int, first_bucket: int, counts: list[int]) -> None:
+        """Cache the counts of closed buckets starting at first_bucket.
+
+        Keeps the cached series if it already covers the new range and
+        merges the two if they overlap or touch; a disjoint series is
+        replaced. Nothing is stored for invalidated metadata_ids.
+
+        Args:
+            metadata_id: states_meta metadata_id
+            bucket_seconds: Bucket size in seconds
+            first_bucket: Absolute index of the first bucket in counts
+            counts: Counts of consecutive closed buckets
+        """
+        if not counts or len(counts) > self.max_buckets:
+            return
+
+        key = (metadata_id, bucket_seconds)
+        end = first_bucket + len(counts)
+        with self._lock:
+            if self._is_invalidated(metadata_id):
+                return
+
+            start, merged = first_bucket, list(counts)
+            existing = self._series.get(key)
+            if existing is not None:
+                existing_start, existing_counts = existing
+                existing_end = existing_start + len(existing_counts)
+                if existing_start <= first_bucket and existing_end >= end:
+                    self._series.move_to_end(key)
+                    return
+                if existing_start <= end and first_bucket <= existing_end:
+                    # Overlapping or contiguous: the new counts are the fresher ones
+                    merged = (
+                        existing_counts[:max(first_bucket - existing_start, 0)]
+                        + merged
+                        + existing_counts[max(end - existing_start, 0):]
+                    )
+                    start = min(existing_start, first_bucket)
+                    if len(merged) > self.max_buckets:
+                        start, merged = first_bucket, list(counts)
+                self._bucket_total -= len(existing_counts)
+
+            self._series[key] = (start, merged)
+            self._series.move_to_end(key)
+            self._bucket_total += len(merged)
+
+            while self._bucket_total > self.max_buckets:
+                _, (_, evicted) = self._series.popitem(last=False)
+                self._bucket_total -= len(evicted)
+                self._evictions += 1
+
+    def invalidate(self, metadata_ids: Iterable[int]) -> None:
+        """Drop and stop caching the series of metadata_ids for RECOUNT_WINDOW seconds.
+
+        Delete SQL is run by hand at some later point, so closed buckets of
+        these metadata_ids can shrink at any time within the window. Cached
+        entity_id lookups resolving to them are dropped as well.
+
+        Args:
+            metadata_ids: states_meta metadata_ids whose rows may be deleted
+        """
+        ids = set(metadata_ids)
+        if not ids:
+            return
+        until = time.monotonic() + RECOUNT_WINDOW
+        with self._lock:
+            for metadata_id in ids:
+                self._invalidated[metadata_id] = until
+            for key in [key for key in self._series if key[0] in ids]:
+                self._bucket_total -= len(self._series.pop(key)[1])
+            for entity_id in [
+                entity_id for entity_id, (_, resolved) in self._metadata_ids.items()
+                if ids.intersection(resolved)
+            ]:
+                del self._metadata_ids[entity_id]
+
+    def _is_invalidated(self, metadata_id: int) -> bool:
+        """Return whether metadata_id is within its invalidation window (lock held)."""
+        until = self._invalidated.get(metadata_id)
+        if until is None:
+            return False
+        if until <= time.monotonic():
+            del self._invalidated[metadata_id]
+            return False
+        return True
+
+    def get_metadata_ids(self, entity_ids: list[str]) -> dict[str, tuple[int, ...]]:
+        """Return unexpired metadata_id lookups for entity_ids.
+
+        Args:
+            entity_ids: Entity IDs to look up
+
+        Returns:
+            dict: entity_id -> metadata_ids (empty if it has none) for the
+                entity_ids resolved within METADATA_ID_TTL
+        """
+        now = time.monotonic()
+        found = {}
+        with self._lock:
+            for entity_id in entity_ids:
+                entry = self._metadata_ids.get(entity_id)
+                if entry is None:
+                    continue
+                if entry[0] <= now:
+                    del self._metadata_ids[entity_id]
+                    continue
+                self._metadata_ids.move_to_end(entity_id)
+                found[entity_id] = entry[1]
+        return found
+
+    def store_metadata_ids(self, resolved: dict[str, tuple[int, ...]]) -> None:
+        """Remember entity_id -> metadata_ids lookups for METADATA_ID_TTL seconds.
+
+        Args:
+            resolved: entity_id -> metadata_ids (empty for entities without any)
+        """
+        expires = time.monotonic() + METADATA_ID_TTL
+        with self._lock:
+            for entity_id, metadata_ids in resolved.items():
+                self._metadata_ids[entity_id] = (expires, metadata_ids)
+                self._metadata_ids.move_to_end(entity_id)
+            while len(self._metadata_ids) > MAX_CACHED_METADATA_IDS:
+                self._metadata_ids.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached series and lookups (statistics and invalidations are kept)."""
+        with self._lock:
+            self._series.clear()
+            self._bucket_total = 0
+            self._metadata_ids.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return cache size and hit/miss/eviction counters.
+
+        Returns:
+            dict: series, buckets, max_buckets, hits, misses, evictions
+                and the number of cached metadata_id lookups
+        """
+        with self._lock:
+            return {
+                'series': len(self._series),
+                'buckets': self._bucket_total,
+                'max_buckets': self.max_buckets,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'metadata_ids': len(self._metadata_ids),
+            }
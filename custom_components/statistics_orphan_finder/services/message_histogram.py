@@ -0,0 +1,271 @@
+"""Batched message histograms for many entities at configurable resolutions."""
+import logging
+import math
+import time
+from collections import defaultdict
+from typing import Any
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Engine
+
+from .chunked_query import execute_chunked_in
+from .histogram_cache import HISTOGRAM_SETTLE_SECONDS, HistogramCache
+
+_LOGGER = logging.getLogger(__name__)
+
+# Allowed bucket sizes in seconds (5 minutes to 1 day)
+HISTOGRAM_BUCKET_SIZES = (300, 900, 1800, 3600, 10800, 21600, 43200, 86400)
+
+# Longest histogram range in hours: the recorder's default purge_keep_days of
+# 10. The database is reached through its URL, so the retention configured
+# for it is unknown here; requests report the cap as max_hours instead.
+MAX_HISTOGRAM_HOURS = 240
+
+# Entities per request, enough for one page of the entity table
+MAX_HISTOGRAM_ENTITIES = 100
+
+# Absolute bucket index per SQLAlchemy dialect name. Integer division keeps
+# the expression cheap: SQLite divides integers, MySQL has DIV and
+# PostgreSQL div(). Timestamps are positive, so truncation equals floor.
+BUCKET_EXPRESSIONS = {
+    'sqlite': 'CAST(last_updated_ts AS INTEGER) / :bucket',
+    'mysql': 'last_updated_ts DIV :bucket',
+    'postgresql': 'div(CAST(last_updated_ts AS numeric), :bucket)',
+}
+
+# Bucket index for unknown dialects
+DEFAULT_BUCKET_EXPRESSION = 'FLOOR(last_updated_ts / :bucket)'
+
+
+def validate_histogram_request(entity_ids: list[str], bucket_seconds: int, hours: int) -> None:
+    """Check a batched histogram request against the supported limits.
+
+    Args:
+        entity_ids: Requested entity IDs
+        bucket_seconds: Bucket size in seconds
+        hours: Time range in hours
+
+    Raises:
+        ValueError: If any parameter is out of range or unsupported
+    """
+    if not entity_ids:
+        raise ValueError("At least one entity_id is required")
+    if len(entity_ids) > MAX_HISTOGRAM_ENTITIES:
+        raise ValueError(f"At most {MAX_HISTOGRAM_ENTITIES} entity_ids per request")
+    for entity_id in entity_ids:
+        if len(entity_id.split(".")) != 2 or not all(entity_id.split(".")):
+            raise ValueError(f"Invalid entity_id: {entity_id}")
+    if bucket_seconds not in HISTOGRAM_BUCKET_SIZES:
+        raise ValueError(
+            f"bucket must be one of: {', '.join(str(size) for size in HISTOGRAM_BUCKET_SIZES)}"
+        )
+    if not 1 <= hours <= MAX_HISTOGRAM_HOURS:
+        raise ValueError(
+            f"hours must be between 1 and {MAX_HISTOGRAM_HOURS} "
+            f"(the recorder's default retention of {MAX_HISTOGRAM_HOURS // 24} days)"
+        )
+    if (hours * 3600) % bucket_seconds:
+        raise ValueError("hours must span a whole number of buckets")
+
+
+def bucket_expression(conn) -> str:
+    """Return the SQL expression for the absolute bucket index of a state.
+
+    Every variant reads only last_updated_ts, so together with the
+    metadata_id filter the histogram is answered from the recorder's
+    (metadata_id, last_updated_ts) index without touching table rows.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        str: Expression using the :bucket parameter (bucket size in seconds)
+    """
+    dialect = getattr(getattr(conn, 'dialect', None), 'name', None)
+    return BUCKET_EXPRESSIONS.get(dialect, DEFAULT_BUCKET_EXPRESSION)
+
+
+def resolve_metadata_ids(
+    conn, entity_ids: list[str], cache: HistogramCache | None = None
+) -> dict[int, str]:
+    """Look up the states_meta metadata_ids of entity IDs.
+
+    Args:
+        conn: Database connection
+        entity_ids: Entity IDs to resolve
+        cache: Optional cache of earlier lookups; only unknown entity IDs are queried
+
+    Returns:
+        dict: metadata_id -> entity_id (entities without states_meta rows are absent)
+    """
+    resolved = cache.get_metadata_ids(entity_ids) if cache else {}
+    missing = [entity_id for entity_id in entity_ids if entity_id not in resolved]
+
+    if missing:
+        query = text(
+            "SELECT metadata_id, entity_id FROM states_meta WHERE entity_id IN :entity_ids"
+        ).bindparams(bindparam("entity_ids", expanding=True))
+        looked_up: dict[str, tuple[int, ...]] = {entity_id: () for entity_id in missing}
+        for metadata_id, entity_id in execute_chunked_in(conn, query, "entity_ids", missing):
+            looked_up[entity_id] = (*looked_up.get(entity_id, ()), metadata_id)
+        if cache is not None:
+            cache.store_metadata_ids(looked_up)
+        resolved = {**resolved, **looked_up}
+
+    return {
+        metadata_id: entity_id
+        for entity_id, metadata_ids in resolved.items()
+        for metadata_id in metadata_ids
+    }
+
+
+def count_message_buckets(
+    conn,
+    metadata_ids: list[int],
+    bucket_seconds: int,
+    first_bucket: int,
+    end_bucket: int,
+    now: float,
+    cache: HistogramCache | None = None,
+) -> dict[int, list[int]]:
+    """Count state writes per bucket, reusing cached closed buckets.
+
+    Buckets are addressed by absolute index (Unix timestamp // bucket size).
+    For series with cached closed buckets only the buckets after them are
+    counted. metadata_ids are grouped by the first bucket they still need,
+    so a warm cache costs one range query starting at the oldest uncached
+    bucket. Newly closed buckets are written back to the cache.
+
+    Args:
+        conn: Database connection
+        metadata_ids: states_meta metadata_ids to count
+        bucket_seconds: Bucket size in seconds
+        first_bucket: Absolute index of the first bucket
+        end_bucket: Absolute index after the last bucket
+        now: Reference Unix timestamp, decides which buckets are closed
+        cache: Optional cache of closed buckets
+
+    Returns:
+        dict: metadata_id -> counts for buckets first_bucket..end_bucket - 1
+    """
+    # Buckets below closed_end ended at least HISTOGRAM_SETTLE_SECONDS ago
+    closed_end = min(int((now - HISTOGRAM_SETTLE_SECONDS) // bucket_seconds), end_bucket)
+
+    counts: dict[int, list[int]] = {}
+    by_start: dict[int, list[int]] = defaultdict(list)
+    for metadata_id in metadata_ids:
+        cached = cache.get(metadata_id, bucket_seconds, first_bucket) if cache else None
+        counts[metadata_id] = (cached or [])[:end_bucket - first_bucket]
+        by_start[first_bucket + len(counts[metadata_id])].append(metadata_id)
+
+    # Range scan on the (metadata_id, last_updated_ts) index; no states_meta join
+    query = text(f"""
+        SELECT
+            metadata_id,
+            {bucket_expression(conn)} AS bucket,
+            COUNT(*) AS count
+        FROM states
+        WHERE metadata_id IN :metadata_ids
+        AND last_updated_ts >= :start
+        AND last_updated_ts < :end
+        GROUP BY metadata_id, bucket
+    """).bindparams(bindparam("metadata_ids", expanding=True))
+
+    for start_bucket, group in by_start.items():
+        if start_bucket >= end_bucket:
+            continue
+        for metadata_id in group:
+            counts[metadata_id].extend([0] * (end_bucket - start_bucket))
+        rows = execute_chunked_in(
+            conn, query, "metadata_ids", group,
+            params={
+                "start": start_bucket * bucket_seconds,
+                "end": end_bucket * bucket_seconds,
+                "bucket": bucket_seconds,
+            },
+        )
+        for metadata_id, bucket, count in rows:
+            bucket = int(bucket) if bucket is not None else -1
+            if start_bucket <= bucket < end_bucket:
+                counts[metadata_id][bucket - first_bucket] += count
+            else:
+                _LOGGER.warning(
+                    "Unexpected bucket %s for metadata_id %s (range %s-%s). Skipping.",
+                    bucket, metadata_id, start_bucket, end_bucket
+                )
+
+    if cache is not None and closed_end > first_bucket:
+        for metadata_id, series in counts.items():
+            cache.store(metadata_id, bucket_seconds, first_bucket, series[:closed_end - first_bucket])
+
+    return counts
+
+
+def get_message_histograms(
+    engine: Engine,
+    entity_ids: list[str],
+    bucket_seconds: int,
+    hours: int,
+    now: float | None = None,
+    cache: HistogramCache | None = None,
+) -> dict[str, Any]:
+    """Count state writes per bucket for several entities in one aggregate query.
+
+    Buckets are aligned to multiples of bucket_seconds since the epoch (UTC)
+    and the last bucket is the one containing now, so it is still filling.
+    Entity IDs are resolved to metadata_ids first; the histogram itself is a
+    GROUP BY metadata_id, bucket over states (see count_message_buckets).
+
+    Args:
+        engine: Database engine
+        entity_ids: Entity IDs to analyze (see validate_histogram_request)
+        bucket_seconds: Bucket size in seconds
+        hours: Time range in hours
+        now: Reference Unix timestamp (defaults to now)
+        cache: Optional cache of closed buckets
+
+    Returns:
+        Dictionary with:
+        - histograms: {entity_id: {"counts": [...], "total_messages": n}},
+          zero-filled for entities without states
+        - bucket_seconds, buckets, time_range_hours: echo of the resolution
+        - max_hours: Longest supported range (MAX_HISTOGRAM_HOURS)
+        - start_ts, end_ts: Covered range (end is the end of the open bucket)
+
+    Raises:
+        ValueError: If the request is out of range (see validate_histogram_request)
+    """
+    validate_histogram_request(entity_ids, bucket_seconds, hours)
+
+    if now is None:
+        now = time.time()
+    buckets = hours * 3600 // bucket_seconds
+    end_bucket = math.floor(now / bucket_seconds) + 1
+    first_bucket = end_bucket - buckets
+
+    histograms = {
+        entity_id: {"counts": [0] * buckets, "total_messages": 0}
+        for entity_id in entity_ids
+    }
+
+    with engine.connect() as conn:
+        entity_by_metadata_id = resolve_metadata_ids(conn, entity_ids, cache)
+        if entity_by_metadata_id:
+            counts = count_message_buckets(
+                conn, list(entity_by_metadata_id), bucket_seconds, first_bucket, end_bucket, now, cache
+            )
+            for metadata_id, series in counts.items():
+                histogram = histograms[entity_by_metadata_id[metadata_id]]
+                for index, count in enumerate(series):
+                    histogram["counts"][index] += count
+                histogram["total_messages"] += sum(series)
+
+    return {
+        "histograms": histograms,
+        "bucket_seconds": bucket_seconds,
+        "buckets": buckets,
+        "time_range_hours": hours,
+        "max_hours": MAX_HISTOGRAM_HOURS,
+        "start_ts": first_bucket * bucket_seconds,
+        "end_ts": end_bucket * bucket_seconds,
+    }
@@ -0,0 +1,144 @@
+"""Top-K ranking of the entities writing the most states."""
+import heapq
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.engine import Engine
+
+from .chunked_query import execute_chunked_in
+from .storage_constants import STATES_FIXED_ROW_BYTES, STATES_INDEX_ROW_BYTES
+
+_LOGGER = logging.getLogger(__name__)
+
+# Ranking windows by name, in seconds
+NOISY_WINDOWS = {
+    '1h': 3600,
+    '24h': 86400,
+    '7d': 604800,
+}
+
+DEFAULT_NOISY_WINDOW = '24h'
+
+# Ranking keys: states rows written, or estimated bytes written
+NOISY_RANK_KEYS = ('writes', 'bytes')
+
+DEFAULT_NOISY_LIMIT = 20
+MAX_NOISY_LIMIT = 200
+
+# Days used for the projected growth of each entity
+PROJECTION_DAYS = 30
+
+
+def _row_bytes(writes: int, state_bytes: int) -> int:
+    """Estimate bytes written by states rows from their count and state lengths.
+
+    Shared state_attributes rows are left out: most writes reuse an
+    existing attributes row.
+    """
+    return state_bytes + writes * (STATES_FIXED_ROW_BYTES + STATES_INDEX_ROW_BYTES)
+
+
+def rank_noisy_entities(
+    engine: Engine,
+    window: str = DEFAULT_NOISY_WINDOW,
+    limit: int = DEFAULT_NOISY_LIMIT,
+    rank_by: str = 'writes',
+    now: float | None = None,
+) -> dict[str, Any]:
+    """Rank entities by write rate or bytes written over a recent window.
+
+    One aggregate scan of the window (a last_updated_ts range, grouped by
+    metadata_id) feeds a heap that keeps only the top `limit` entities, so
+    memory and sorting stay O(limit) however many entities are active.
+    Only the winners' entity_ids are looked up in states_meta afterwards.
+
+    Args:
+        engine: Database engine
+        window: Window name (see NOISY_WINDOWS)
+        limit: Number of entities to return (1-MAX_NOISY_LIMIT)
+        rank_by: "writes" or "bytes"
+        now: Reference Unix timestamp (defaults to now)
+
+    Returns:
+        Dictionary with:
+        - entities: Top entities, each with writes, writes_per_hour,
+          bytes, bytes_per_day, projected_bytes (PROJECTION_DAYS ahead)
+          and share_of_writes
+        - window, window_seconds, rank_by, limit: echo of the request
+        - total_writes, total_bytes_per_day, active_entities: window totals
+
+    Raises:
+        ValueError: If window, limit or rank_by is not supported
+    """
+    if window not in NOISY_WINDOWS:
+        raise ValueError(f"window must be one of: {', '.join(NOISY_WINDOWS)}")
+    if not 1 <= limit <= MAX_NOISY_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_NOISY_LIMIT}")
+    if rank_by not in NOISY_RANK_KEYS:
+        raise ValueError(f"rank_by must be one of: {', '.join(NOISY_RANK_KEYS)}")
+
+    if now is None:
+        now = time.time()
+    window_seconds = NOISY_WINDOWS[window]
+    days = window_seconds / 86400
+
+    aggregate_query = text("""
+        SELECT metadata_id, COUNT(*), SUM(COALESCE(LENGTH(state), 0))
+        FROM states
+        WHERE last_updated_ts >= :start
+        AND last_updated_ts < :end
+        GROUP BY metadata_id
+    """)
+    meta_query = text(
+        "SELECT metadata_id, entity_id FROM states_meta WHERE metadata_id IN :metadata_ids"
+    ).bindparams(bindparam("metadata_ids", expanding=True))
+
+    totals = {'writes': 0, 'bytes': 0, 'entities': 0}
+
+    def scan(result):
+        for metadata_id, writes, state_bytes in result:
+            row_bytes = _row_bytes(writes, state_bytes or 0)
+            totals['writes'] += writes
+            totals['bytes'] += row_bytes
+            totals['entities'] += 1
+            yield metadata_id, writes, row_bytes
+
+    rank_index = 1 if rank_by == 'writes' else 2
+    with engine.connect() as conn:
+        result = conn.execute(aggregate_query, {"start": now - window_seconds, "end": now})
+        top = heapq.nlargest(limit, scan(result), key=lambda row: (row[rank_index], -row[0]))
+
+        entity_ids = dict(execute_chunked_in(
+            conn, meta_query, "metadata_ids", [row[0] for row in top]
+        )) if top else {}
+
+    entities = []
+    for metadata_id, writes, row_bytes in top:
+        bytes_per_day = round(row_bytes / days)
+        entities.append({
+            'entity_id': entity_ids.get(metadata_id),
+            'metadata_id': metadata_id,
+            'writes': writes,
+            'writes_per_hour': round(writes * 3600 / window_seconds, 2),
+            'bytes': row_bytes,
+            'bytes_per_day': bytes_per_day,
+            'projected_bytes': bytes_per_day * PROJECTION_DAYS,
+            'share_of_writes': round(writes / totals['writes'], 4) if totals['writes'] else 0.0,
+        })
+
+    _LOGGER.debug(
+        "Ranked %d active entities over %s by %s", totals['entities'], window, rank_by
+    )
+    return {
+        'entities': entities,
+        'window': window,
+        'window_seconds': window_seconds,
+        'rank_by': rank_by,
+        'limit': limit,
+        'projection_days': PROJECTION_DAYS,
+        'total_writes': totals['writes'],
+        'total_bytes_per_day': round(totals['bytes'] / days),
+        'active_entities': totals['entities'],
+    }
@@ -0,0 +1,298 @@
+"""Persistent incremental snapshot of per-entity aggregates."""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Storage version for the persisted snapshot (bump on incompatible changes)
+SNAPSHOT_STORAGE_VERSION = 1
+
+# Delay before writing the snapshot to disk after a refresh (seconds)
+SNAPSHOT_SAVE_DELAY = 10
+
+# Fact tables tracked by the snapshot and their primary key columns
+SNAPSHOT_TABLES = {
+    'states': 'state_id',
+    'statistics': 'id',
+    'statistics_short_term': 'id',
+}
+
+# Fraction by which the engine's row estimate may fall below the snapshot
+# total before a correction pass runs. Estimates are approximate (InnoDB
+# samples index pages, reltuples lags until autovacuum), so small gaps are
+# expected even when nothing was deleted.
+ROW_ESTIMATE_TOLERANCE = 0.2
+
+# Seconds metadata_ids stay marked for exact recounts after delete SQL was
+# generated for them. The integration never runs that SQL itself, so the
+# rows can disappear at any time while an admin reviews and executes it.
+RECOUNT_WINDOW = 86400
+
+SCAN_MODE_FULL = "full"
+SCAN_MODE_INCREMENTAL = "incremental"
+SCAN_MODE_CACHED = "cached"
+
+
+class OverviewSnapshot:
+    """Per-metadata_id counts and last-update values with id high-water marks.
+
+    For every fact table the snapshot keeps the aggregated row count and
+    latest timestamp per metadata_id, plus the min and max primary key seen
+    when it was last refreshed. Later overview runs only aggregate rows
+    above the max id watermark and merge the deltas.
+
+    Purge detection: the recorder purges old rows, which moves the table's
+    min id forward. When that happens (or the max id drops below the
+    watermark, e.g. after a table rebuild) a full correction pass is
+    required because the number of deleted rows per entity is unknown.
+    Deletes in the middle of the id range (purge_entities, per-entity
+    keep_days, manual DELETEs) leave both bounds alone; they are caught by
+    comparing the engine's row estimate with the snapshot total whenever
+    the estimate changes. metadata_ids this integration generated delete
+    SQL for are recounted exactly for RECOUNT_WINDOW seconds instead.
+
+    Thread-safety: refreshes run in executor threads. Each table has its own
+    refresh lock, held across plan/query/apply so concurrent sessions cannot
+    merge the same delta twice. A separate data lock guards reads for
+    serialization so saving never waits on a running scan.
+    """
+
+    def __init__(self, source: str, data: dict[str, Any] | None = None) -> None:
+        """Initialize snapshot.
+
+        Args:
+            source: Identifier of the database the snapshot belongs to
+            data: Optional persisted snapshot data (from as_dict)
+        """
+        self.source = source
+        self._tables: dict[str, dict[str, Any]] = {}
+        # table -> {metadata_id: recount window end (Unix time)}
+        self._recount: dict[str, dict[int, float]] = {}
+        self._data_lock = threading.Lock()
+        self._refresh_locks = {table: threading.Lock() for table in SNAPSHOT_TABLES}
+
+        if data:
+            self.load(data)
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Load persisted snapshot data, discarding it if it is for another database.
+
+        Recount marks already set in memory (delete SQL generated before the
+        load) are merged with the persisted ones, keeping the later window end.
+
+        Args:
+            data: Snapshot data as produced by as_dict
+        """
+        if data.get('source') != self.source:
+            _LOGGER.info("Ignoring overview snapshot from a different database")
+            return
+
+        tables = {}
+        for table, entry in data.get('tables', {}).items():
+            if table not in SNAPSHOT_TABLES:
+                continue
+            tables[table] = {
+                'min_id': entry.get('min_id'),
+                'max_id': entry.get('max_id'),
+                'estimate': entry.get('estimate'),
+                'rows': {
+                    int(metadata_id): (int(values[0]), values[1])
+                    for metadata_id, values in entry.get('rows', {}).items()
+                },
+            }
+
+        recount = {
+            table: {int(metadata_id): float(until) for metadata_id, until in pending.items()}
+            for table, pending in data.get('recount', {}).items()
+            if table in SNAPSHOT_TABLES
+        }
+
+        with self._data_lock:
+            for table, pending in self._recount.items():
+                merged = recount.setdefault(table, {})
+                for metadata_id, until in pending.items():
+                    merged[metadata_id] = max(until, merged.get(metadata_id, until))
+            self._tables = tables
+            self._recount = recount
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize snapshot for persistent storage.
+
+        Returns:
+            dict: JSON-serializable snapshot data
+        """
+        with self._data_lock:
+            return {
+                'source': self.source,
+                'tables': {
+                    table: {
+                        'min_id': entry['min_id'],
+                        'max_id': entry['max_id'],
+                        'estimate': entry.get('estimate'),
+                        'rows': {
+                            str(metadata_id): [count, last_ts]
+                            for metadata_id, (count, last_ts) in entry['rows'].items()
+                        },
+                    }
+                    for table, entry in self._tables.items()
+                },
+                'recount': {
+                    table: {str(metadata_id): until for metadata_id, until in pending.items()}
+                    for table, pending in self._recount.items()
+                    if pending
+                },
+            }
+
+    def clear(self) -> None:
+        """Drop all aggregates, forcing a full scan on the next refresh.
+
+        Pending recounts are kept: the delete SQL may still be run later.
+        """
+        with self._data_lock:
+            self._tables = {}
+
+    def invalidate(self, table: str, metadata_ids: Iterable[int]) -> None:
+        """Recount metadata_ids exactly on every refresh for RECOUNT_WINDOW seconds.
+
+        Args:
+            table: Fact table name
+            metadata_ids: metadata_ids whose rows may be deleted
+        """
+        until = time.time() + RECOUNT_WINDOW
+        with self._data_lock:
+            pending = self._recount.setdefault(table, {})
+            for metadata_id in metadata_ids:
+                pending[metadata_id] = until
+
+    def pending_recount(self, table: str) -> list[int]:
+        """Return the metadata_ids of a table still inside their recount window.
+
+        Args:
+            table: Fact table name
+
+        Returns:
+            list: metadata_ids to recount exactly
+        """
+        now = time.time()
+        with self._data_lock:
+            pending = self._recount.get(table)
+            if not pending:
+                return []
+            for metadata_id in [mid for mid, until in pending.items() if until <= now]:
+                del pending[metadata_id]
+            return list(pending)
+
+    @contextmanager
+    def refreshing(self, table: str) -> Iterator[None]:
+        """Hold the refresh lock for a table across plan, query and apply.
+
+        Args:
+            table: Fact table name
+        """
+        with self._refresh_locks[table]:
+            yield
+
+    def plan(
+        self,
+        table: str,
+        min_id: int | None,
+        max_id: int | None,
+        estimated_rows: int | None = None
+    ) -> tuple[str, int | None]:
+        """Decide how to bring a table's aggregates up to date.
+
+        Args:
+            table: Fact table name
+            min_id: Current minimum primary key (None if table is empty)
+            max_id: Current maximum primary key (None if table is empty)
+            estimated_rows: Engine's row count estimate for the table, if any
+
+        Returns:
+            tuple: (scan_mode, watermark) where watermark is the id above
+                which rows must be aggregated for incremental mode
+        """
+        with self._data_lock:
+            entry = self._tables.get(table)
+
+        if entry is None or entry['max_id'] is None or max_id is None:
+            return SCAN_MODE_FULL, None
+
+        if entry['min_id'] is not None and min_id is not None and min_id > entry['min_id']:
+            _LOGGER.debug(
+                "Purge detected on %s (min id %s -> %s), running correction pass",
+                table, entry['min_id'], min_id
+            )
+            return SCAN_MODE_FULL, None
+
+        if max_id < entry['max_id']:
+            _LOGGER.debug("%s max id moved backwards, running correction pass", table)
+            return SCAN_MODE_FULL, None
+
+        # Only a changed estimate is checked, so a stale one (SQLite keeps
+        # sqlite_stat1 until the next ANALYZE) triggers at most one pass
+        if estimated_rows is not None and estimated_rows != entry.get('estimate'):
+            total = sum(count for count, _ in entry['rows'].values())
+            if estimated_rows < total * (1 - ROW_ESTIMATE_TOLERANCE):
+                _LOGGER.debug(
+                    "%s holds about %d rows but the snapshot counts %d, running correction pass",
+                    table, estimated_rows, total
+                )
+                return SCAN_MODE_FULL, None
+
+        if max_id == entry['max_id']:
+            return SCAN_MODE_CACHED, entry['max_id']
+
+        return SCAN_MODE_INCREMENTAL, entry['max_id']
+
+    def apply(
+        self,
+        table: str,
+        scan_mode: str,
+        rows: dict[int, tuple[int, float | None]],
+        min_id: int | None,
+        max_id: int | None,
+        estimated_rows: int | None = None,
+        recounted: dict[int, tuple[int, float | None]] | None = None
+    ) -> dict[int, tuple[int, float | None]]:
+        """Store full aggregates or merge a delta, then move the watermarks.
+
+        Args:
+            table: Fact table name
+            scan_mode: Mode returned by plan
+            rows: {metadata_id: (count, last_ts)} from the scan
+            min_id: Minimum primary key observed before the scan
+            max_id: Maximum primary key the scan was bounded by
+            estimated_rows: Row estimate passed to plan (remembered for the next check)
+            recounted: Exact {metadata_id: (count, last_ts)} up to max_id for
+                pending recounts; they replace the merged values (count 0 drops them)
+
+        Returns:
+            dict: Up-to-date {metadata_id: (count, last_ts)} for the table
+        """
+        with self._data_lock:
+            if scan_mode == SCAN_MODE_FULL or table not in self._tables:
+                merged = dict(rows)
+            else:
+                merged = dict(self._tables[table]['rows'])
+                for metadata_id, (count, last_ts) in rows.items():
+                    old_count, old_ts = merged.get(metadata_id, (0, None))
+                    if old_ts is None or (last_ts is not None and last_ts > old_ts):
+                        old_ts = last_ts
+                    merged[metadata_id] = (old_count + count, old_ts)
+
+                for metadata_id, (count, last_ts) in (recounted or {}).items():
+                    if count:
+                        merged[metadata_id] = (count, last_ts)
+                    else:
+                        merged.pop(metadata_id, None)
+
+            self._tables[table] = {
+                'min_id': min_id,
+                'max_id': max_id,
+                'estimate': estimated_rows,
+                'rows': merged,
+            }
+            return dict(merged)
@@ -1,7 +1,9 @@
 """Registry adapter for Home Assistant entity enrichment."""
+import asyncio
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable, Iterable, NamedTuple
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
@@ -11,6 +13,26 @@ from .entity_analyzer import EntityAnalyzer
 
 _LOGGER = logging.getLogger(__name__)
 
+# Items indexed between checks of the time slice while snapshotting on the loop
+SNAPSHOT_YIELD_EVERY = 1000
+
+# Longest uninterrupted stretch of snapshot work on the event loop (seconds)
+SNAPSHOT_TIME_SLICE = 0.005
+
+
+class RegistrySnapshot(NamedTuple):
+    """Lookup indexes of registry and state machine data taken once per run."""
+    entries: dict[str, Any]
+    """entity_id -> entity registry entry"""
+    devices: dict[str, Any]
+    """device_id -> device registry entry"""
+    config_entries: dict[str, Any]
+    """entry_id -> config entry"""
+    states: dict[str, Any]
+    """entity_id -> State"""
+    now: datetime
+    """Reference time for unavailable durations"""
+
 
 class RegistryAdapter:
     """Adapter for Home Assistant registry access and entity enrichment.
@@ -27,30 +49,99 @@ class RegistryAdapter:
         """
         self.hass = hass
 
-    def enrich_entities(self, entity_map: dict[str, Any]) -> list[dict[str, Any]]:
+    def build_snapshot(self) -> RegistrySnapshot:
+        """Index registry and state machine data for one enrichment run.
+
+        Every lookup enrich_entities needs becomes a plain dict lookup, and
+        devices and config entries shared by many entities are resolved once.
+        Reads the registries in one pass, so it must run on the event loop;
+        prefer async_build_snapshot for large installations.
+
+        Returns:
+            RegistrySnapshot: Indexes plus the reference time of the run
+        """
+        entity_registry = er.async_get(self.hass)
+        device_registry = dr.async_get(self.hass)
+
+        return RegistrySnapshot(
+            entries=dict(entity_registry.entities),
+            devices=dict(device_registry.devices),
+            config_entries=self._get_config_entries_map(),
+            states={state.entity_id: state for state in self.hass.states.async_all()},
+            now=datetime.now(timezone.utc),
+        )
+
+    async def async_build_snapshot(self) -> RegistrySnapshot:
+        """Index registry and state machine data on the event loop.
+
+        The registries and the state machine may only be read from the
+        event loop, so this runs there and leaves the merge in
+        enrich_entities to an executor job. Each source's keys are copied
+        in one step; the entries are then looked up in slices, yielding to
+        the loop with asyncio.sleep(0) every SNAPSHOT_YIELD_EVERY items once
+        SNAPSHOT_TIME_SLICE has been used. Registry entries removed while
+        yielded are left out of the snapshot.
+
+        Returns:
+            RegistrySnapshot: Indexes plus the reference time of the run
+        """
+        start = time.monotonic()
+        entity_registry = er.async_get(self.hass)
+        device_registry = dr.async_get(self.hass)
+
+        entities = entity_registry.entities
+        entries = await _async_index(
+            list(entities), lambda entity_id: (entity_id, entities.get(entity_id))
+        )
+        devices = device_registry.devices
+        device_index = await _async_index(
+            list(devices), lambda device_id: (device_id, devices.get(device_id))
+        )
+        states = await _async_index(
+            self.hass.states.async_all(), lambda state: (state.entity_id, state)
+        )
+
+        snapshot = RegistrySnapshot(
+            entries=entries,
+            devices=device_index,
+            config_entries=self._get_config_entries_map(),
+            states=states,
+            now=datetime.now(timezone.utc),
+        )
+        _LOGGER.debug(
+            "Registry snapshot of %d entities, %d devices and %d states took %.1f ms",
+            len(entries), len(device_index), len(states), (time.monotonic() - start) * 1000
+        )
+        return snapshot
+
+    def enrich_entities(
+        self,
+        entity_map: dict[str, Any],
+        snapshot: RegistrySnapshot | None = None
+    ) -> list[dict[str, Any]]:
         """Enrich entity map with registry and state machine information.
 
         Main orchestrator for Step 6 entity enrichment. Processes all entities
         in the entity_map and returns a fully enriched list ready for display.
+        Only reads the snapshot, so it can run in an executor thread when the
+        snapshot was taken on the event loop (async_build_snapshot).
 
         Args:
             entity_map: Dictionary mapping entity_id to entity data from steps 1-5
+            snapshot: Prebuilt registry indexes (built here if not given)
 
         Returns:
             list: Enriched entity dictionaries with all metadata
         """
-        # Get registries
-        entity_registry = er.async_get(self.hass)
-        device_registry = dr.async_get(self.hass)
-
-        # PERFORMANCE OPTIMIZATION: Pre-fetch config entries to avoid N+1 lookups
-        config_entries_map = self._get_config_entries_map()
+        if snapshot is None:
+            snapshot = self.build_snapshot()
+        entries, devices, config_entries, states, now = snapshot
 
         entities_list = []
         for entity_id, info in sorted(entity_map.items()):
             # Get registry and state info
-            registry_entry = entity_registry.async_get(entity_id)
-            state = self._get_entity_state(entity_id)
+            registry_entry = entries.get(entity_id)
+            state = states.get(entity_id)
 
             # Determine statuses
             in_registry = registry_entry is not None
@@ -63,22 +154,22 @@ class RegistryAdapter:
             disabled_by = registry_entry.disabled_by if registry_entry else None
 
             # Get device information
-            device_name, device_disabled = self._get_device_info(
-                registry_entry, device_registry
-            )
+            device_entry = self._get_device_entry(registry_entry, devices)
+            device_name = device_entry.name if device_entry else None
+            device_disabled = (device_entry.disabled or False) if device_entry else False
 
-            # Get config entry information (O(1) lookup)
-            config_entry_state, config_entry_title = self._get_config_entry_info(
-                registry_entry, config_entries_map
-            )
+            # Get config entry information
+            config_entry = self._get_config_entry(registry_entry, config_entries)
+            config_entry_state = config_entry.state.name if config_entry else None
+            config_entry_title = config_entry.title if config_entry else None
 
             # Determine availability reason
-            availability_reason = EntityAnalyzer.determine_availability_reason(
-                self.hass, entity_id, registry_entry, state, device_registry
+            availability_reason = EntityAnalyzer.availability_reason(
+                registry_entry, state, device_entry, config_entry, now
             )
 
             # Calculate unavailable duration
-            unavailable_duration_seconds = self._calculate_unavailable_duration(state)
+            unavailable_duration_seconds = self._calculate_unavailable_duration(state, now)
 
             # PERFORMANCE OPTIMIZATION: Use update frequency from step 2
             update_frequency_data = info.get('update_frequency')
@@ -137,17 +228,6 @@ class RegistryAdapter:
             for entry in self.hass.config_entries.async_entries()
         }
 
-    def _get_entity_state(self, entity_id: str):
-        """Get current state for entity.
-
-        Args:
-            entity_id: Entity ID to look up
-
-        Returns:
-            State object or None if not in state machine
-        """
-        return self.hass.states.get(entity_id)
-
     def _determine_registry_status(self, registry_entry) -> str:
         """Determine registry status string.
 
@@ -176,61 +256,47 @@ class RegistryAdapter:
             return "Available"
         return "Not Present"
 
-    def _get_device_info(self, registry_entry, device_registry) -> tuple[str | None, bool]:
-        """Get device name and disabled status.
+    def _get_device_entry(self, registry_entry, devices: dict[str, Any]):
+        """Get the device of a registry entry from the device index.
 
         Args:
             registry_entry: Entity registry entry or None
-            device_registry: Device registry instance
+            devices: Device index (device_id -> device entry)
 
         Returns:
-            tuple: (device_name, device_disabled)
+            Device entry or None if the entity has no (known) device
         """
-        device_name = None
-        device_disabled = False
-
         if registry_entry and registry_entry.device_id:
-            device_entry = device_registry.async_get(registry_entry.device_id)
-            if device_entry:
-                device_name = device_entry.name
-                device_disabled = device_entry.disabled or False
-
-        return device_name, device_disabled
+            return devices.get(registry_entry.device_id)
+        return None
 
-    def _get_config_entry_info(
-        self, registry_entry, config_entries_map: dict
-    ) -> tuple[str | None, str | None]:
-        """Get config entry state and title.
+    def _get_config_entry(self, registry_entry, config_entries_map: dict[str, Any]):
+        """Get the config entry of a registry entry from the config entry index.
 
         Args:
             registry_entry: Entity registry entry or None
             config_entries_map: Pre-fetched config entries map
 
         Returns:
-            tuple: (config_entry_state, config_entry_title)
+            Config entry or None if the entity has no (known) config entry
         """
-        config_entry_state = None
-        config_entry_title = None
-
         if registry_entry and registry_entry.config_entry_id:
-            config_entry = config_entries_map.get(registry_entry.config_entry_id)
-            if config_entry:
-                config_entry_state = config_entry.state.name
-                config_entry_title = config_entry.title
-
-        return config_entry_state, config_entry_title
+            return config_entries_map.get(registry_entry.config_entry_id)
+        return None
 
-    def _calculate_unavailable_duration(self, state) -> int | None:
+    def _calculate_unavailable_duration(self, state, now: datetime | None = None) -> int | None:
         """Calculate how long entity has been unavailable.
 
         Args:
             state: State object or None
+            now: Reference time (defaults to now)
 
         Returns:
             int: Seconds unavailable, or None if not unavailable
         """
         if state and state.state in ["unavailable", "unknown"]:
-            now = datetime.now(timezone.utc)
+            if now is None:
+                now = datetime.now(timezone.utc)
             return int((now - state.last_changed).total_seconds())
         return None
 
@@ -282,3 +348,27 @@ class RegistryAdapter:
             return "Short-term"
 
         return None
+
+
+async def _async_index(
+    items: Iterable[Any], pair: Callable[[Any], tuple[str, Any]]
+) -> dict[str, Any]:
+    """Build a dict index on the event loop without holding it for long.
+
+    Args:
+        items: Items to index (a copy, so the source may change while yielded)
+        pair: Returns (key, value) for an item; None values are skipped
+
+    Returns:
+        dict: key -> value
+    """
+    index: dict[str, Any] = {}
+    slice_start = time.monotonic()
+    for count, item in enumerate(items, 1):
+        key, value = pair(item)
+        if value is not None:
+            index[key] = value
+        if count % SNAPSHOT_YIELD_EVERY == 0 and time.monotonic() - slice_start >= SNAPSHOT_TIME_SLICE:
+            await asyncio.sleep(0)
+            slice_start = time.monotonic()
+    return index
@@ -1,6 +1,11 @@
 """Session management for progressive data loading."""
 import asyncio
 import logging
+import os
+import pickle
+import shutil
+import tempfile
+import threading
 import time
 import uuid
 from collections import defaultdict
@@ -11,24 +16,156 @@ _LOGGER = logging.getLogger(__name__)
 # Session timeout in seconds (5 minutes)
 SESSION_TIMEOUT = 300
 
+# Interval of the background cleanup of stale sessions (seconds)
+SESSION_CLEANUP_INTERVAL = 60
+
+# Approximate resident bytes per entity, used for the session memory budget
+# (measured with tracemalloc on 30,000 entities): an entity_map record with
+# its entity_id, timestamp strings and update frequency dict, and an enriched
+# step 6 entity dict (its strings are shared with the record)
+ENTITY_RECORD_BYTES = 700
+ENRICHED_ENTITY_BYTES = 1000
+
+# Approximate bytes per EntityRecord overflow field (dict slot and value)
+OVERFLOW_FIELD_BYTES = 150
+
+# Per-entity fields accumulated by steps 1-5 and their initial values
+ENTITY_FIELDS: dict[str, Any] = {
+    'in_states_meta': False,
+    'in_states': False,
+    'in_statistics_meta': False,
+    'in_statistics_short_term': False,
+    'in_statistics_long_term': False,
+    'states_count': 0,
+    'stats_short_count': 0,
+    'stats_long_count': 0,
+    'last_state_update': None,
+    'last_stats_update': None,
+    'metadata_id': None,
+    'update_frequency': None,
+}
+
+
+class EntityRecord:
+    """Per-entity step data stored in slots instead of a dict.
+
+    A session holds one record per entity_id found in the recorder, so on
+    large installations the per-entity overhead dominates session memory.
+    Slots keep a record at under a third of an equivalent dict. Records
+    keep the mapping interface used by the step merges and the registry
+    adapter (item access, get, in); keys outside ENTITY_FIELDS go to a
+    lazily created overflow dict. Use as_dict to materialize a dict.
+    """
+
+    __slots__ = (*ENTITY_FIELDS, '_extra')
+
+    def __init__(self) -> None:
+        """Initialize record with the default value of every field."""
+        for field, default in ENTITY_FIELDS.items():
+            setattr(self, field, default)
+        self._extra: dict[str, Any] | None = None
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a field value."""
+        if key in ENTITY_FIELDS:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Set a field value."""
+        if key in ENTITY_FIELDS:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether the record has a field."""
+        return key in ENTITY_FIELDS or (self._extra is not None and key in self._extra)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return a field value, or default if the field is unknown."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def as_dict(self) -> dict[str, Any]:
+        """Materialize the record as a plain dict.
+
+        Returns:
+            dict: Field values, including any overflow fields
+        """
+        data = {field: getattr(self, field) for field in ENTITY_FIELDS}
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __repr__(self) -> str:
+        """Return representation for debugging."""
+        return f"EntityRecord({self.as_dict()!r})"
+
+
+class EntityMap(defaultdict):
+    """entity_id -> EntityRecord mapping that creates records on first access."""
+
+    def __init__(self) -> None:
+        """Initialize empty map."""
+        super().__init__(EntityRecord)
+
+    def __reduce__(self):
+        """Pickle without the default factory argument (for session spill)."""
+        return (EntityMap, (), None, None, iter(self.items()))
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Materialize all records as plain dicts.
+
+        Returns:
+            dict: entity_id -> field dict
+        """
+        return {entity_id: record.as_dict() for entity_id, record in self.items()}
+
 
 class SessionManager:
     """Manages session lifecycle for progressive data loading.
 
     Provides temporal isolation for multi-step operations, preventing
     concurrent requests from interfering with each other. Sessions
-    automatically expire after SESSION_TIMEOUT seconds of inactivity.
+    expire after SESSION_TIMEOUT seconds of inactivity; the coordinator
+    runs cleanup_stale_sessions every SESSION_CLEANUP_INTERVAL seconds.
+
+    Memory budget: when the estimated size of resident sessions exceeds
+    memory_budget bytes, the least recently used idle sessions are evicted.
+    With spill_to_disk their step data is pickled to a private temporary
+    directory and loaded back on next access; otherwise they are dropped and
+    the client gets a session expired error. Sessions whose lock is held
+    (a step is running) are never evicted.
 
     Thread-safety: Each session has an asyncio.Lock to prevent race
     conditions when multiple requests try to access the same session.
+    Steps run in executor threads, so the session table itself is guarded
+    by a threading lock.
     """
 
-    def __init__(self) -> None:
-        """Initialize session manager."""
-        # Key: session_id (UUID), Value: {data: dict, timestamp: float}
+    def __init__(self, memory_budget: int = 0, spill_to_disk: bool = False) -> None:
+        """Initialize session manager.
+
+        Args:
+            memory_budget: Maximum estimated bytes of resident session data
+                (0 disables the budget)
+            spill_to_disk: Spill evicted sessions to disk instead of dropping them
+        """
+        # Key: session_id (UUID), Value: {data: dict | None, timestamp: float, spill_path: str | None}
         self._sessions: dict[str, dict[str, Any]] = {}
         # Key: session_id (UUID), Value: asyncio.Lock
         self._locks: dict[str, asyncio.Lock] = {}
+        self._memory_budget = memory_budget
+        self._spill_to_disk = spill_to_disk
+        self._spill_dir: str | None = None
+        self._guard = threading.RLock()
 
     def get_lock(self, session_id: str) -> asyncio.Lock:
         """Get or create a lock for a session.
@@ -46,46 +183,32 @@ class SessionManager:
     def create_session(self) -> str:
         """Create a new session and return its ID.
 
-        Automatically cleans up stale sessions before creating new one.
         Initializes session with entity_map structure for step-by-step data accumulation.
 
         Returns:
             str: Session ID (UUID)
         """
-        # Clean up stale sessions before creating new one
-        self.cleanup_stale_sessions()
-
         # Generate new session ID
         session_id = str(uuid.uuid4())
 
-        # Initialize session data with entity_map structure
-        self._sessions[session_id] = {
-            'data': {
-                'entity_map': defaultdict(lambda: {
-                    'in_states_meta': False,
-                    'in_states': False,
-                    'in_statistics_meta': False,
-                    'in_statistics_short_term': False,
-                    'in_statistics_long_term': False,
-                    'states_count': 0,
-                    'stats_short_count': 0,
-                    'stats_long_count': 0,
-                    'last_state_update': None,
-                    'last_stats_update': None,
-                    'metadata_id': None,
-                })
-            },
-            'timestamp': time.time()
-        }
-
-        # Create lock for this session
-        self._locks[session_id] = asyncio.Lock()
+        with self._guard:
+            # Initialize session data with entity_map structure
+            self._sessions[session_id] = {
+                'data': {
+                    'entity_map': EntityMap()
+                },
+                'timestamp': time.time(),
+                'spill_path': None,
+            }
+
+            # Create lock for this session
+            self._locks[session_id] = asyncio.Lock()
 
         _LOGGER.debug("Created new session %s", session_id[:8])
         return session_id
 
     def get_session_data(self, session_id: str) -> dict[str, Any]:
-        """Retrieve session data by ID.
+        """Retrieve session data by ID, loading it back if it was spilled.
 
         Args:
             session_id: Session ID to retrieve
@@ -96,24 +219,34 @@ class SessionManager:
         Raises:
             KeyError: If session ID does not exist
         """
-        if session_id not in self._sessions:
-            raise KeyError(f"Session {session_id[:8]} not found")
+        with self._guard:
+            if session_id not in self._sessions:
+                raise KeyError(f"Session {session_id[:8]} not found")
 
-        return self._sessions[session_id]['data']
+            session = self._sessions[session_id]
+            if session['data'] is None:
+                self._restore_session(session_id)
+                self.enforce_memory_budget(keep=session_id)
+            return session['data']
 
     def update_timestamp(self, session_id: str) -> None:
         """Update session timestamp to keep it alive.
 
+        Called after every completed step, so this is also where the memory
+        budget is enforced as session data grows.
+
         Args:
             session_id: Session ID to update
 
         Raises:
             KeyError: If session ID does not exist
         """
-        if session_id not in self._sessions:
-            raise KeyError(f"Session {session_id[:8]} not found")
+        with self._guard:
+            if session_id not in self._sessions:
+                raise KeyError(f"Session {session_id[:8]} not found")
 
-        self._sessions[session_id]['timestamp'] = time.time()
+            self._sessions[session_id]['timestamp'] = time.time()
+            self.enforce_memory_budget(keep=session_id)
         _LOGGER.debug("Updated timestamp for session %s", session_id[:8])
 
     def validate_session(self, session_id: str) -> bool:
@@ -123,7 +256,7 @@ class SessionManager:
             session_id: Session ID to validate
 
         Returns:
-            bool: True if session exists, False otherwise
+            bool: True if session exists (resident or spilled), False otherwise
         """
         return session_id in self._sessions
 
@@ -136,43 +269,187 @@ class SessionManager:
         Raises:
             KeyError: If session ID does not exist
         """
-        if session_id not in self._sessions:
-            raise KeyError(f"Session {session_id[:8]} not found")
+        with self._guard:
+            if session_id not in self._sessions:
+                raise KeyError(f"Session {session_id[:8]} not found")
 
-        del self._sessions[session_id]
-        # Clean up lock for this session
-        if session_id in self._locks:
-            del self._locks[session_id]
+            self._remove_session(session_id)
         _LOGGER.debug("Deleted session %s", session_id[:8])
 
     def cleanup_stale_sessions(self) -> None:
-        """Remove sessions older than SESSION_TIMEOUT.
+        """Remove sessions older than SESSION_TIMEOUT and enforce the memory budget.
 
-        Automatically called before creating new sessions to prevent
-        memory leaks from abandoned sessions.
+        Called periodically by the coordinator to release abandoned
+        sessions (closed browser tabs, interrupted loads).
         """
         current_time = time.time()
-        stale_sessions = [
-            session_id
-            for session_id, session in self._sessions.items()
-            if current_time - session['timestamp'] > SESSION_TIMEOUT
-        ]
-
-        for session_id in stale_sessions:
-            age = int(current_time - self._sessions[session_id]['timestamp'])
-            _LOGGER.info("Cleaning up stale session %s (age: %ds)", session_id[:8], age)
-            del self._sessions[session_id]
-            # Clean up lock for stale session
-            if session_id in self._locks:
-                del self._locks[session_id]
+        with self._guard:
+            stale_sessions = [
+                session_id
+                for session_id, session in self._sessions.items()
+                if current_time - session['timestamp'] > SESSION_TIMEOUT
+            ]
+
+            for session_id in stale_sessions:
+                age = int(current_time - self._sessions[session_id]['timestamp'])
+                _LOGGER.info("Cleaning up stale session %s (age: %ds)", session_id[:8], age)
+                self._remove_session(session_id)
+
+            self.enforce_memory_budget()
 
     def clear_all_sessions(self) -> None:
         """Clear all sessions (typically called during shutdown).
 
-        Logs the number of sessions being cleared if any exist.
+        Logs the number of sessions being cleared if any exist and removes
+        the spill directory.
+        """
+        with self._guard:
+            session_count = len(self._sessions)
+            if session_count > 0:
+                _LOGGER.info("Clearing %d session(s)", session_count)
+            self._sessions.clear()
+            self._locks.clear()
+
+            if self._spill_dir is not None:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+
+    @staticmethod
+    def estimate_session_bytes(data: dict[str, Any]) -> int:
+        """Estimate bytes of a session's step data.
+
+        Counts everything eviction would pickle: entity_map records with
+        their overflow fields, the enriched entities and a bound cached
+        overview. The cached overview is shared with the coordinator cache
+        while resident, but a spill writes a full copy of it.
+
+        Args:
+            data: Session data dictionary
+
+        Returns:
+            int: Approximate size in bytes
+        """
+        entity_map = data.get('entity_map', {})
+        overflow_fields = sum(
+            len(record._extra) for record in entity_map.values()
+            if isinstance(record, EntityRecord) and record._extra
+        )
+        cached_entities = 0
+        if 'cached_overview' in data:
+            cached_entities = len(data['cached_overview'][0].get('entities', ()))
+        return (
+            len(entity_map) * ENTITY_RECORD_BYTES
+            + overflow_fields * OVERFLOW_FIELD_BYTES
+            + (len(data.get('entities_list', ())) + cached_entities) * ENRICHED_ENTITY_BYTES
+        )
+
+    def resident_bytes(self) -> int:
+        """Return the estimated bytes of all sessions held in memory."""
+        with self._guard:
+            return sum(
+                self.estimate_session_bytes(session['data'])
+                for session in self._sessions.values()
+                if session['data'] is not None
+            )
+
+    def enforce_memory_budget(self, keep: str | None = None) -> int:
+        """Evict least recently used idle sessions until within the memory budget.
+
+        Args:
+            keep: Session ID that must stay resident (the one being used)
+
+        Returns:
+            int: Number of sessions evicted
+        """
+        if self._memory_budget <= 0:
+            return 0
+
+        with self._guard:
+            sizes = {
+                session_id: self.estimate_session_bytes(session['data'])
+                for session_id, session in self._sessions.items()
+                if session['data'] is not None
+            }
+            total = sum(sizes.values())
+            if total <= self._memory_budget:
+                return 0
+
+            candidates = sorted(
+                (
+                    session_id for session_id, size in sizes.items()
+                    if size > 0 and session_id != keep
+                    and not (session_id in self._locks and self._locks[session_id].locked())
+                ),
+                key=lambda session_id: self._sessions[session_id]['timestamp'],
+            )
+
+            evicted = 0
+            for session_id in candidates:
+                if total <= self._memory_budget:
+                    break
+                total -= sizes[session_id]
+                self._evict_session(session_id)
+                evicted += 1
+
+            if total > self._memory_budget:
+                _LOGGER.debug(
+                    "Session data still above memory budget (%d > %d bytes)",
+                    total, self._memory_budget
+                )
+            return evicted
+
+    def _evict_session(self, session_id: str) -> None:
+        """Spill a session to disk, or drop it if spilling is disabled or fails."""
+        session = self._sessions[session_id]
+        if self._spill_to_disk:
+            try:
+                if self._spill_dir is None:
+                    self._spill_dir = tempfile.mkdtemp(prefix="statistics_orphan_finder_")
+                path = os.path.join(self._spill_dir, f"{session_id}.pickle")
+                with open(path, 'wb') as file:
+                    pickle.dump(session['data'], file, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as err:
+                _LOGGER.warning("Could not spill session %s to disk: %s", session_id[:8], err)
+            else:
+                session['data'] = None
+                session['spill_path'] = path
+                _LOGGER.debug("Spilled idle session %s to disk", session_id[:8])
+                return
+
+        _LOGGER.info("Evicting idle session %s to stay within memory budget", session_id[:8])
+        self._remove_session(session_id)
+
+    def _restore_session(self, session_id: str) -> None:
+        """Load spilled step data back into memory.
+
+        Raises:
+            KeyError: If the spill file cannot be read (the session is dropped)
         """
-        session_count = len(self._sessions)
-        if session_count > 0:
-            _LOGGER.info("Clearing %d session(s)", session_count)
-        self._sessions.clear()
-        self._locks.clear()
+        session = self._sessions[session_id]
+        path = session['spill_path']
+        try:
+            with open(path, 'rb') as file:
+                session['data'] = pickle.load(file)
+        except Exception as err:
+            _LOGGER.warning("Could not load spilled session %s: %s", session_id[:8], err)
+            self._remove_session(session_id)
+            raise KeyError(f"Session {session_id[:8]} not found") from err
+
+        session['spill_path'] = None
+        self._remove_spill_file(path)
+        _LOGGER.debug("Loaded spilled session %s", session_id[:8])
+
+    def _remove_session(self, session_id: str) -> None:
+        """Forget a session, its lock and its spill file."""
+        session = self._sessions.pop(session_id)
+        self._locks.pop(session_id, None)
+        if session.get('spill_path'):
+            self._remove_spill_file(session['spill_path'])
+
+    @staticmethod
+    def _remove_spill_file(path: str) -> None:
+        """Delete a spill file, ignoring files that are already gone."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,86 @@
+"""Request coalescing for identical blocking calls running at the same time."""
+import logging
+import threading
+from typing import Any, Callable, Hashable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Call:
+    """State of one in-flight call shared by its waiters."""
+
+    __slots__ = ('done', 'result', 'error', 'waiters')
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run a call once per key while it is in flight and share its result.
+
+    The first caller for a key runs the function; callers arriving with the
+    same key before it finishes block until it does and receive the same
+    result (or exception). Nothing is cached: a call that starts after the
+    previous one finished runs again.
+
+    Used for the database reads of overview steps 1-5, so sessions started
+    at the same time (several browser tabs, auto-refreshing dashboards)
+    scan the recorder tables once. Callers must treat shared results as
+    read-only.
+
+    Thread-safety: calls run in executor threads; the in-flight table is
+    guarded by a lock.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.shared_calls = 0
+
+    def do(self, key: Hashable, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run func, or wait for the in-flight call with the same key.
+
+        Args:
+            key: Identifies calls that return the same result
+            func: Blocking function to run
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Result of func (possibly computed by another thread)
+
+        Raises:
+            Exception: Whatever func raised, in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self.shared_calls += 1
+
+        if not leader:
+            _LOGGER.debug("Joining in-flight call %s", key)
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as err:
+            call.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+            if call.waiters:
+                _LOGGER.debug("Shared call %s with %d waiting caller(s)", key, call.waiters)
+        return call.result
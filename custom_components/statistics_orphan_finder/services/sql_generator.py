@@ -1,23 +1,58 @@
 """SQL generation service for Statistics Orphan Finder."""
 import logging
-from typing import Any
+from typing import Any, Callable
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.engine import Engine
 
 from homeassistant.config_entries import ConfigEntry
 
+from .chunked_query import execute_chunked_in, in_chunk_size
 from .database_service import get_database_type
 
 _LOGGER = logging.getLogger(__name__)
 
+# metadata_ids per bulk DELETE transaction. Every metadata_id can own
+# millions of rows, so batches stay small enough to keep each transaction
+# (and the row locks it holds) short. InnoDB also locks the index gaps it
+# scans, so MySQL gets the smallest batches.
+DELETE_BATCH_SIZES = {
+    'sqlite': 200,
+    'mysql': 50,
+    'postgresql': 100,
+}
+
+# Maximum entity_ids per bulk generation request
+MAX_BULK_SQL_ENTITIES = 2000
+
 
 class SqlGenerator:
     """Service for generating SQL DELETE statements."""
 
-    def __init__(self, entry: ConfigEntry) -> None:
-        """Initialize SQL generator."""
+    def __init__(
+        self,
+        entry: ConfigEntry,
+        on_delete_generated: Callable[[list[int], list[int]], None] | None = None
+    ) -> None:
+        """Initialize SQL generator.
+
+        Args:
+            entry: Config entry
+            on_delete_generated: Called with (states metadata_ids, statistics_meta ids)
+                whenever DELETE statements were generated for them, so cached
+                aggregates can stop trusting those ids
+        """
         self.entry = entry
+        self._on_delete_generated = on_delete_generated
+
+    def _notify_delete_generated(self, states_ids: list[int], statistics_ids: list[int]) -> None:
+        """Report metadata_ids that DELETE statements were generated for."""
+        if self._on_delete_generated is None or not (states_ids or statistics_ids):
+            return
+        try:
+            self._on_delete_generated(states_ids, statistics_ids)
+        except Exception as err:
+            _LOGGER.warning("Could not invalidate cached data for deleted entities: %s", err)
 
     def generate_delete_sql(
         self,
@@ -71,20 +106,24 @@ class SqlGenerator:
 
         # Build DELETE statements
         delete_statements = []
+        states_ids: list[int] = []
+        statistics_ids: list[int] = []
 
         with engine.connect() as conn:
             # Handle states_meta deletion
             if in_states_meta or origin == "States" or origin == "States+Statistics":
-                states_statements = self._generate_states_delete(conn, entity_id)
+                states_statements = self._generate_states_delete(conn, entity_id, states_ids)
                 delete_statements.extend(states_statements)
 
             # Handle statistics_meta deletion
             if in_statistics_meta or origin in ["Short-term", "Long-term", "Both", "States+Statistics"]:
                 statistics_statements = self._generate_statistics_delete(
-                    conn, entity_id, origin, metadata_id_statistics
+                    conn, entity_id, origin, metadata_id_statistics, statistics_ids
                 )
                 delete_statements.extend(statistics_statements)
 
+        self._notify_delete_generated(states_ids, statistics_ids)
+
         # Combine into transaction block
         if not delete_statements:
             return "-- No data found to delete"
@@ -95,12 +134,114 @@ class SqlGenerator:
 
         return sql
 
-    def _generate_states_delete(self, conn, entity_id: str) -> list[str]:
+    def generate_bulk_delete_sql(self, engine: Engine, entity_ids: list[str]) -> dict[str, Any]:
+        """Generate set-based DELETE statements for many entities at once.
+
+        All metadata_ids are resolved with one lookup across states_meta and
+        statistics_meta (chunked only past the dialect's IN list size), then
+        every table is cleared with `WHERE metadata_id IN (...)` statements.
+        The ids are split into batches of DELETE_BATCH_SIZES, each in its own
+        transaction, so locks are released between batches.
+
+        All recorder data of an entity is removed: states, both statistics
+        tables and the metadata rows. The same SECURITY NOTICE as
+        generate_delete_sql applies: the interpolated values are integers
+        read from the database and the SQL is only shown for manual review.
+
+        Args:
+            engine: Database engine
+            entity_ids: Entity IDs to delete (duplicates are ignored)
+
+        Returns:
+            Dictionary with:
+            - sql: Batched transactions, or a comment if nothing was found
+            - batch_size: metadata_ids per transaction for this database
+            - batches: Number of transactions
+            - states_metadata_ids / statistics_metadata_ids: Rows resolved
+            - missing: entity_ids found in neither metadata table
+        """
+        _is_sqlite, is_mysql, is_postgres = get_database_type(self.entry)
+        if is_mysql:
+            begin_stmt = "START TRANSACTION;"
+            batch_size = DELETE_BATCH_SIZES['mysql']
+        else:
+            begin_stmt = "BEGIN;"
+            batch_size = DELETE_BATCH_SIZES['postgresql' if is_postgres else 'sqlite']
+
+        query = text("""
+            SELECT 'states', metadata_id, entity_id FROM states_meta
+            WHERE entity_id IN :entity_ids
+            UNION ALL
+            SELECT 'statistics', id, statistic_id FROM statistics_meta
+            WHERE statistic_id IN :entity_ids
+        """).bindparams(bindparam("entity_ids", expanding=True))
+
+        states_ids: list[int] = []
+        statistics_ids: list[int] = []
+        found: set[str] = set()
+        with engine.connect() as conn:
+            # The IN list is bound twice, so chunks are half the usual size
+            for table, metadata_id, entity_id in execute_chunked_in(
+                conn, query, "entity_ids", entity_ids,
+                chunk_size=max(1, in_chunk_size(conn) // 2),
+            ):
+                (states_ids if table == 'states' else statistics_ids).append(int(metadata_id))
+                found.add(entity_id)
+
+        states_ids.sort()
+        statistics_ids.sort()
+        transactions = []
+        for start in range(0, len(states_ids), batch_size):
+            id_list = ", ".join(str(metadata_id) for metadata_id in states_ids[start:start + batch_size])
+            transactions.append([
+                # Nested subquery for MySQL compatibility (see _generate_states_delete)
+                f"UPDATE states SET old_state_id = NULL WHERE old_state_id IN "
+                f"(SELECT state_id FROM (SELECT state_id FROM states WHERE metadata_id IN ({id_list})) AS temp);",
+                f"DELETE FROM states WHERE metadata_id IN ({id_list});",
+                f"DELETE FROM states_meta WHERE metadata_id IN ({id_list});",
+            ])
+        for start in range(0, len(statistics_ids), batch_size):
+            id_list = ", ".join(str(metadata_id) for metadata_id in statistics_ids[start:start + batch_size])
+            transactions.append([
+                f"DELETE FROM statistics WHERE metadata_id IN ({id_list});",
+                f"DELETE FROM statistics_short_term WHERE metadata_id IN ({id_list});",
+                f"DELETE FROM statistics_meta WHERE id IN ({id_list});",
+            ])
+
+        self._notify_delete_generated(states_ids, statistics_ids)
+
+        missing = [entity_id for entity_id in dict.fromkeys(entity_ids) if entity_id not in found]
+        _LOGGER.debug(
+            "Generated %d DELETE batches for %d entities (%d not found)",
+            len(transactions), len(found), len(missing)
+        )
+
+        if transactions:
+            sql = "\n\n".join(
+                begin_stmt + "\n" + "\n".join(statements) + "\nCOMMIT;"
+                for statements in transactions
+            )
+        else:
+            sql = "-- No data found to delete"
+
+        return {
+            'sql': sql,
+            'batch_size': batch_size,
+            'batches': len(transactions),
+            'states_metadata_ids': len(states_ids),
+            'statistics_metadata_ids': len(statistics_ids),
+            'missing': missing,
+        }
+
+    def _generate_states_delete(
+        self, conn, entity_id: str, deleted_ids: list[int] | None = None
+    ) -> list[str]:
         """Generate DELETE statements for states tables.
 
         Args:
             conn: Database connection
             entity_id: Entity ID to delete
+            deleted_ids: Optional list the states metadata_id is appended to
 
         Returns:
             List of DELETE SQL statements
@@ -115,6 +256,8 @@ class SqlGenerator:
 
             if row:
                 states_metadata_id = row[0]
+                if deleted_ids is not None:
+                    deleted_ids.append(states_metadata_id)
                 # First, clear any old_state_id references to states we're about to delete
                 # This prevents foreign key constraint violations
                 # Using nested subquery for MySQL compatibility
@@ -136,7 +279,8 @@ class SqlGenerator:
         conn,
         entity_id: str,
         origin: str,
-        metadata_id_statistics: int | None = None
+        metadata_id_statistics: int | None = None,
+        deleted_ids: list[int] | None = None
     ) -> list[str]:
         """Generate DELETE statements for statistics tables.
 
@@ -145,6 +289,7 @@ class SqlGenerator:
             entity_id: Entity ID to delete
             origin: Origin indicator (Short-term, Long-term, Both, States+Statistics)
             metadata_id_statistics: Optional metadata_id for statistics (if known)
+            deleted_ids: Optional list the statistics_meta id is appended to
 
         Returns:
             List of DELETE SQL statements
@@ -177,6 +322,8 @@ class SqlGenerator:
 
                 # Always delete from statistics_meta last (parent record)
                 statements.append(f"DELETE FROM statistics_meta WHERE id = {metadata_id_statistics};")
+                if deleted_ids is not None:
+                    deleted_ids.append(metadata_id_statistics)
         except Exception as err:
             _LOGGER.warning("Could not look up statistics_meta metadata_id for %s: %s", entity_id, err)
 
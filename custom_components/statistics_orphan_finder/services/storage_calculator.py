@@ -1,22 +1,54 @@
 """Storage calculation service for Statistics Orphan Finder."""
 import logging
+import time
 from typing import Any, NamedTuple
 
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 from sqlalchemy.engine import Engine
 
 from homeassistant.config_entries import ConfigEntry
 
+from .chunked_query import execute_chunked_in
 from .database_service import get_database_type
 from .storage_constants import (
     DEFAULT_STATES_ROW_SIZE,
     STATES_META_ROW_SIZE,
     DEFAULT_STATISTICS_ROW_SIZE,
     STATISTICS_META_ROW_SIZE,
+    PRECISE_SAMPLE_ROWS,
+    STATES_FIXED_ROW_BYTES,
+    STATES_INDEX_ROW_BYTES,
+    TABLE_STATS_TTL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Byte length of a text column per SQLAlchemy dialect name. LENGTH() counts
+# characters on SQLite and PostgreSQL, so non-ASCII states and attributes
+# would be undercounted; MySQL's LENGTH() already returns bytes.
+BYTE_LENGTH_EXPRESSIONS = {
+    'sqlite': 'LENGTH(CAST({column} AS BLOB))',
+    'mysql': 'LENGTH({column})',
+    'postgresql': 'OCTET_LENGTH({column})',
+}
+
+# Byte length for unknown dialects (OCTET_LENGTH is standard SQL)
+DEFAULT_BYTE_LENGTH_EXPRESSION = 'OCTET_LENGTH({column})'
+
+
+def byte_length(conn, column: str) -> str:
+    """Return the SQL expression for the stored byte length of a text column.
+
+    Args:
+        conn: Database connection
+        column: Column reference, e.g. "s.state"
+
+    Returns:
+        str: Expression evaluating to the column's length in bytes
+    """
+    dialect = getattr(getattr(conn, 'dialect', None), 'name', None)
+    return BYTE_LENGTH_EXPRESSIONS.get(dialect, DEFAULT_BYTE_LENGTH_EXPRESSION).format(column=column)
+
 
 class MetadataIdRow(NamedTuple):
     """Result row for metadata_id queries (states_meta)."""
@@ -38,12 +70,90 @@ class AvgRowSizeRow(NamedTuple):
     avg_row_size: float
 
 
+# Fallback average row size per table when the engine has no statistics
+DEFAULT_ROW_SIZES = {
+    'states': DEFAULT_STATES_ROW_SIZE,
+    'statistics': DEFAULT_STATISTICS_ROW_SIZE,
+    'statistics_short_term': DEFAULT_STATISTICS_ROW_SIZE,
+}
+
+
 class StorageCalculator:
     """Service for calculating entity storage sizes."""
 
     def __init__(self, entry: ConfigEntry) -> None:
         """Initialize storage calculator."""
         self.entry = entry
+        # (fetched_at, {table_name: avg_row_size}) shared by all calculations
+        self._table_stats: tuple[float, dict[str, int]] | None = None
+
+    def invalidate_table_stats(self) -> None:
+        """Drop cached average row sizes so the next calculation re-reads them."""
+        self._table_stats = None
+
+    def _get_avg_row_sizes(
+        self,
+        conn,
+        is_sqlite: bool,
+        is_mysql: bool,
+        is_postgres: bool
+    ) -> dict[str, int]:
+        """Get average row size per table, cached for TABLE_STATS_TTL seconds.
+
+        One catalog query covers states, statistics and statistics_short_term:
+        information_schema.tables.avg_row_length on MySQL/MariaDB and
+        pg_total_relation_size / reltuples on PostgreSQL (no COUNT(*)).
+        SQLite has no per-table statistics and uses the default sizes.
+
+        Args:
+            conn: Database connection
+            is_sqlite: Whether database is SQLite
+            is_mysql: Whether database is MySQL/MariaDB
+            is_postgres: Whether database is PostgreSQL
+
+        Returns:
+            dict: {table_name: avg_row_size} for all three tables
+        """
+        cached = self._table_stats
+        if cached is not None and time.monotonic() - cached[0] < TABLE_STATS_TTL:
+            return cached[1]
+
+        sizes = dict(DEFAULT_ROW_SIZES)
+        if is_mysql:
+            query = text("""
+                SELECT table_name, avg_row_length
+                FROM information_schema.tables
+                WHERE table_schema = DATABASE()
+                AND table_name IN ('states', 'statistics', 'statistics_short_term')
+            """)
+        elif is_postgres:
+            # reltuples is -1 (PG14+) or 0 until the table is vacuumed/analyzed.
+            # pg_table_is_visible picks the tables on search_path, like the
+            # recorder's unqualified names, in whichever schema they live.
+            query = text("""
+                SELECT c.relname,
+                       (pg_total_relation_size(c.oid) / NULLIF(GREATEST(c.reltuples, 0), 0))::bigint
+                FROM pg_class c
+                WHERE pg_table_is_visible(c.oid)
+                AND c.relkind = 'r'
+                AND c.relname IN ('states', 'statistics', 'statistics_short_term')
+            """)
+        else:
+            query = None
+
+        if query is not None:
+            try:
+                for row in conn.execute(query).fetchall():
+                    if row[0] in sizes and row[1]:
+                        sizes[row[0]] = int(row[1])
+            except Exception as err:
+                # Keep defaults for this call but retry on the next one
+                _LOGGER.debug("Could not read table statistics: %s", err)
+                conn.rollback()
+                return sizes
+
+        self._table_stats = (time.monotonic(), sizes)
+        return sizes
 
     def calculate_entity_storage(
         self,
@@ -52,7 +162,8 @@ class StorageCalculator:
         origin: str,
         in_states_meta: bool = False,
         in_statistics_meta: bool = False,
-        metadata_id_statistics: int | None = None
+        metadata_id_statistics: int | None = None,
+        precise: bool = False
     ) -> int:
         """Calculate estimated storage size for an entity's data.
 
@@ -63,6 +174,8 @@ class StorageCalculator:
             in_states_meta: Whether entity is in states_meta table
             in_statistics_meta: Whether entity is in statistics_meta table
             metadata_id_statistics: Optional metadata_id for statistics (if known)
+            precise: Measure states bytes from column lengths (sampled)
+                instead of a table-wide average row size
 
         Returns:
             Total estimated storage size in bytes
@@ -76,9 +189,14 @@ class StorageCalculator:
             try:
                 # Calculate size for states table
                 if in_states_meta or origin == "States" or origin == "States+Statistics":
-                    states_size = self._calculate_states_size(
-                        conn, entity_id, is_sqlite, is_mysql, is_postgres
-                    )
+                    if precise:
+                        states_size = self._batch_calculate_states_size_precise(
+                            conn, [{'entity_id': entity_id}]
+                        ).get(entity_id, 0)
+                    else:
+                        states_size = self._calculate_states_size(
+                            conn, entity_id, is_sqlite, is_mysql, is_postgres
+                        )
                     total_size += states_size
 
                 # Calculate size for statistics tables
@@ -97,7 +215,8 @@ class StorageCalculator:
     def calculate_batch_storage(
         self,
         engine: Engine,
-        entities: list[dict[str, Any]]
+        entities: list[dict[str, Any]],
+        precise: bool = False
     ) -> dict[str, int]:
         """Calculate storage sizes for multiple entities in batched queries.
 
@@ -109,6 +228,8 @@ class StorageCalculator:
                 - in_states_meta: Whether entity is in states_meta table
                 - in_statistics_meta: Whether entity is in statistics_meta table
                 - metadata_id_statistics: Optional metadata_id for statistics (if known)
+            precise: Measure states bytes from column lengths (sampled)
+                instead of a table-wide average row size
 
         Returns:
             Dictionary mapping entity_id to total storage size in bytes
@@ -128,7 +249,11 @@ class StorageCalculator:
                     e for e in entities
                     if e.get('in_states_meta') or e.get('origin') in ['States', 'States+Statistics']
                 ]
-                if states_entities:
+                if states_entities and precise:
+                    states_storage = self._batch_calculate_states_size_precise(conn, states_entities)
+                    for entity_id, size in states_storage.items():
+                        storage_map[entity_id] += size
+                elif states_entities:
                     states_storage = self._batch_calculate_states_size(
                         conn, states_entities, is_sqlite, is_mysql, is_postgres
                     )
@@ -152,6 +277,106 @@ class StorageCalculator:
 
         return storage_map
 
+    def calculate_storage_from_counts(
+        self,
+        engine: Engine,
+        entities: list[dict[str, Any]]
+    ) -> dict[str, int]:
+        """Estimate storage sizes from row counts already collected by the overview.
+
+        Gives the same result as calculate_batch_storage, but takes the
+        counts from the entities (steps 2, 4 and 5) instead of resolving
+        metadata_ids and running GROUP BY COUNT(*) over the fact tables
+        again. The database is only touched to refresh the cached average row
+        sizes, which is a catalog lookup.
+
+        Args:
+            engine: Database engine (used only if table statistics are stale)
+            entities: List of entity dicts with keys:
+                - entity_id: The entity_id
+                - origin: Origin indicator (States, Short-term, Long-term, Both, States+Statistics)
+                - in_states_meta: Whether entity is in states_meta table
+                - in_statistics_meta: Whether entity is in statistics_meta table
+                - states_count, stats_short_count, stats_long_count: Row counts
+
+        Returns:
+            Dictionary mapping entity_id to total storage size in bytes
+        """
+        return {
+            entity_id: sum(parts)
+            for entity_id, parts in self.calculate_breakdown_from_counts(engine, entities).items()
+        }
+
+    def calculate_breakdown_from_counts(
+        self,
+        engine: Engine,
+        entities: list[dict[str, Any]]
+    ) -> dict[str, tuple[int, int, int]]:
+        """Estimate per-table storage from row counts in a single pass.
+
+        The states part includes the states_meta row. The statistics_meta
+        row is counted with long-term statistics, or with short-term
+        statistics when the origin has no long-term data. Entities without
+        an origin (active entities) include every table they have rows in.
+
+        Args:
+            engine: Database engine (used only if table statistics are stale)
+            entities: List of entity dicts (see calculate_storage_from_counts);
+                origin is optional
+
+        Returns:
+            Dictionary mapping entity_id to (states_bytes, short_term_bytes, long_term_bytes)
+        """
+        if not entities:
+            return {}
+
+        avg_row_sizes = self._get_cached_avg_row_sizes(engine)
+        states_row = avg_row_sizes['states']
+        statistics_row = avg_row_sizes['statistics']
+        long_origins = ('Long-term', 'Both', 'States+Statistics')
+        short_origins = ('Short-term', 'Both', 'States+Statistics')
+
+        breakdown: dict[str, tuple[int, int, int]] = {}
+        for entity in entities:
+            states_bytes = short_bytes = long_bytes = 0
+
+            if entity.get('in_states_meta'):
+                states_bytes = entity.get('states_count', 0) * states_row + STATES_META_ROW_SIZE
+
+            if entity.get('in_statistics_meta'):
+                origin = entity.get('origin')
+                include_long = origin is None or origin in long_origins
+                if include_long:
+                    long_bytes = entity.get('stats_long_count', 0) * statistics_row + STATISTICS_META_ROW_SIZE
+                if origin is None or origin in short_origins:
+                    short_bytes = entity.get('stats_short_count', 0) * statistics_row
+                    if not include_long:
+                        short_bytes += STATISTICS_META_ROW_SIZE
+
+            breakdown[entity['entity_id']] = (states_bytes, short_bytes, long_bytes)
+
+        return breakdown
+
+    def _get_cached_avg_row_sizes(self, engine: Engine) -> dict[str, int]:
+        """Return average row sizes, connecting only if remote statistics are stale.
+
+        Args:
+            engine: Database engine
+
+        Returns:
+            Dictionary mapping table name to average row size
+        """
+        is_sqlite, is_mysql, is_postgres = get_database_type(self.entry)
+        cached = self._table_stats
+        try:
+            if is_sqlite or (cached is not None and time.monotonic() - cached[0] < TABLE_STATS_TTL):
+                return self._get_avg_row_sizes(None, is_sqlite, is_mysql, is_postgres)
+            with engine.connect() as conn:
+                return self._get_avg_row_sizes(conn, is_sqlite, is_mysql, is_postgres)
+        except Exception as err:
+            _LOGGER.warning("Could not read table statistics, using default row sizes: %s", err)
+            return DEFAULT_ROW_SIZES
+
     def _batch_calculate_states_size(
         self,
         conn,
@@ -176,14 +401,14 @@ class StorageCalculator:
         entity_ids = [e['entity_id'] for e in entities]
 
         # Batch query 1: Get all metadata_ids at once
-        from sqlalchemy import bindparam
         query = text("""
             SELECT entity_id, metadata_id
             FROM states_meta
             WHERE entity_id IN :entity_ids
         """).bindparams(bindparam("entity_ids", expanding=True))
-        result = conn.execute(query, {"entity_ids": entity_ids})
-        entity_to_metadata = {row[0]: row[1] for row in result.fetchall()}
+        entity_to_metadata = {
+            row[0]: row[1] for row in execute_chunked_in(conn, query, "entity_ids", entity_ids)
+        }
 
         if not entity_to_metadata:
             return storage_map
@@ -197,27 +422,12 @@ class StorageCalculator:
             WHERE metadata_id IN :metadata_ids
             GROUP BY metadata_id
         """).bindparams(bindparam("metadata_ids", expanding=True))
-        count_result = conn.execute(count_query, {"metadata_ids": metadata_ids})
-        metadata_to_count = {row[0]: row[1] for row in count_result.fetchall()}
+        metadata_to_count = {
+            row[0]: row[1] for row in execute_chunked_in(conn, count_query, "metadata_ids", metadata_ids)
+        }
 
-        # Get average row size once for all entities
-        avg_row_size = DEFAULT_STATES_ROW_SIZE
-        if is_mysql:
-            size_query = text("""
-                SELECT avg_row_length
-                FROM information_schema.tables
-                WHERE table_schema = DATABASE() AND table_name = 'states'
-            """)
-            size_result = conn.execute(size_query)
-            row = size_result.fetchone()
-            avg_row_size = row[0] if row and row[0] else DEFAULT_STATES_ROW_SIZE
-        elif is_postgres:
-            size_query = text("""
-                SELECT pg_total_relation_size('states') / NULLIF((SELECT COUNT(*) FROM states), 0) as avg_row_size
-            """)
-            size_result = conn.execute(size_query)
-            row = size_result.fetchone()
-            avg_row_size = int(row[0]) if row and row[0] else DEFAULT_STATES_ROW_SIZE
+        # Average row size from the shared table statistics cache
+        avg_row_size = self._get_avg_row_sizes(conn, is_sqlite, is_mysql, is_postgres)['states']
 
         # Calculate storage for each entity
         for entity_id, metadata_id in entity_to_metadata.items():
@@ -226,6 +436,163 @@ class StorageCalculator:
 
         return storage_map
 
+    def _batch_calculate_states_size_precise(
+        self,
+        conn,
+        entities: list[dict[str, Any]],
+        sample_rows: int | None = PRECISE_SAMPLE_ROWS
+    ) -> dict[str, int]:
+        """Batch calculate states bytes from real column lengths.
+
+        Per entity this sums the byte length of state, its share of each
+        shared state_attributes row (the attributes length divided by the
+        number of states rows referencing it) and fixed per-row column and
+        index overhead. Only the entity's most recent sample_rows rows are
+        read; their per-row bytes are scaled to the entity's exact row count.
+
+        The samples of all entities come from one statement per IN chunk
+        (see _sample_states_bytes), so the number of queries does not grow
+        with the number of entities. A modulo filter on state_id or
+        TABLESAMPLE would visit every row or page of an entity instead of
+        its latest rows.
+
+        Args:
+            conn: Database connection
+            entities: List of entity dicts with entity_id
+            sample_rows: Rows sampled per entity (None reads every row)
+
+        Returns:
+            Dictionary mapping entity_id to states storage size
+        """
+        entity_ids = [e['entity_id'] for e in entities]
+
+        query = text("""
+            SELECT entity_id, metadata_id
+            FROM states_meta
+            WHERE entity_id IN :entity_ids
+        """).bindparams(bindparam("entity_ids", expanding=True))
+        entity_to_metadata = {
+            row[0]: row[1] for row in execute_chunked_in(conn, query, "entity_ids", entity_ids)
+        }
+        if not entity_to_metadata:
+            return {}
+
+        metadata_ids = list(set(entity_to_metadata.values()))
+
+        # Exact row counts (index-only on metadata_id) to scale the sample
+        count_query = text("""
+            SELECT metadata_id, COUNT(*)
+            FROM states
+            WHERE metadata_id IN :metadata_ids
+            GROUP BY metadata_id
+        """).bindparams(bindparam("metadata_ids", expanding=True))
+        row_counts = {
+            row[0]: row[1] for row in execute_chunked_in(conn, count_query, "metadata_ids", metadata_ids)
+        }
+
+        # Sampled state lengths and attribute references
+        samples = self._sample_states_bytes(
+            conn, [metadata_id for metadata_id in metadata_ids if row_counts.get(metadata_id)], sample_rows
+        )
+
+        # Number of states rows sharing each attributes row
+        attributes_ids = list({aid for sample in samples.values() for aid in sample['attributes']})
+        attribute_refs: dict[int, int] = {}
+        if attributes_ids:
+            refs_query = text("""
+                SELECT attributes_id, COUNT(*)
+                FROM states
+                WHERE attributes_id IN :attributes_ids
+                GROUP BY attributes_id
+            """).bindparams(bindparam("attributes_ids", expanding=True))
+            attribute_refs = {
+                row[0]: row[1]
+                for row in execute_chunked_in(conn, refs_query, "attributes_ids", attributes_ids)
+            }
+
+        storage_map: dict[str, int] = {}
+        for entity_id, metadata_id in entity_to_metadata.items():
+            count = row_counts.get(metadata_id, 0)
+            sample = samples.get(metadata_id)
+            if not count or not sample or not sample['rows']:
+                storage_map[entity_id] = STATES_META_ROW_SIZE
+                continue
+
+            attribute_bytes = sum(
+                refs * length / attribute_refs.get(attributes_id, refs)
+                for attributes_id, (refs, length) in sample['attributes'].items()
+            )
+            per_row = (
+                (sample['state_bytes'] + attribute_bytes) / sample['rows']
+                + STATES_FIXED_ROW_BYTES + STATES_INDEX_ROW_BYTES
+            )
+            storage_map[entity_id] = round(count * per_row) + STATES_META_ROW_SIZE
+
+        return storage_map
+
+    def _sample_states_bytes(
+        self,
+        conn,
+        metadata_ids: list[int],
+        sample_rows: int | None
+    ) -> dict[int, dict[str, Any]]:
+        """Read state lengths and attribute references of each entity's latest rows.
+
+        ROW_NUMBER() over each metadata_id's rows, newest first, keeps the
+        latest sample_rows rows per entity, so one statement per IN chunk
+        samples every entity. The window is ordered like the recorder's
+        metadata_id + last_updated_ts index and needs no separate sort.
+
+        Args:
+            conn: Database connection
+            metadata_ids: states_meta ids to sample
+            sample_rows: Number of most recent rows read per entity (None reads every row)
+
+        Returns:
+            {metadata_id: {'rows': n, 'state_bytes': n,
+                'attributes': {attributes_id: (sampled_refs, shared_attrs_length)}}}
+            for the metadata_ids that have states rows
+        """
+        if sample_rows is None:
+            rows_source = """
+                SELECT metadata_id, attributes_id, state
+                FROM states
+                WHERE metadata_id IN :metadata_ids
+            """
+            row_filter = ""
+            params: dict[str, Any] = {}
+        else:
+            rows_source = """
+                SELECT metadata_id, attributes_id, state,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY metadata_id ORDER BY last_updated_ts DESC
+                       ) AS row_num
+                FROM states
+                WHERE metadata_id IN :metadata_ids
+            """
+            row_filter = "WHERE s.row_num <= :sample_rows"
+            params = {"sample_rows": sample_rows}
+
+        query = text(f"""
+            SELECT s.metadata_id, s.attributes_id, COUNT(*),
+                   SUM(COALESCE({byte_length(conn, 's.state')}, 0)),
+                   MAX(COALESCE({byte_length(conn, 'sa.shared_attrs')}, 0))
+            FROM ({rows_source}) s
+            LEFT JOIN state_attributes sa ON sa.attributes_id = s.attributes_id
+            {row_filter}
+            GROUP BY s.metadata_id, s.attributes_id
+        """).bindparams(bindparam("metadata_ids", expanding=True))
+
+        samples: dict[int, dict[str, Any]] = {}
+        rows = execute_chunked_in(conn, query, "metadata_ids", metadata_ids, params=params)
+        for metadata_id, attributes_id, count, state_bytes, attrs_length in rows:
+            sample = samples.setdefault(metadata_id, {'rows': 0, 'state_bytes': 0, 'attributes': {}})
+            sample['rows'] += count
+            sample['state_bytes'] += state_bytes or 0
+            if attributes_id is not None:
+                sample['attributes'][attributes_id] = (count, attrs_length or 0)
+        return samples
+
     def _batch_calculate_statistics_size(
         self,
         conn,
@@ -261,15 +628,13 @@ class StorageCalculator:
 
         # Batch lookup metadata_ids for entities that don't have it
         if entities_needing_lookup:
-            from sqlalchemy import bindparam
             entity_ids = [e['entity_id'] for e in entities_needing_lookup]
             query = text("""
                 SELECT statistic_id, id
                 FROM statistics_meta
                 WHERE statistic_id IN :entity_ids
             """).bindparams(bindparam("entity_ids", expanding=True))
-            result = conn.execute(query, {"entity_ids": entity_ids})
-            for row in result.fetchall():
+            for row in execute_chunked_in(conn, query, "entity_ids", entity_ids):
                 entity_to_metadata[row[0]] = row[1]
 
         if not entity_to_metadata:
@@ -344,18 +709,15 @@ class StorageCalculator:
         if not metadata_ids:
             return {}
 
-        # Remove duplicates
-        unique_metadata_ids = list(set(metadata_ids))
-
-        from sqlalchemy import bindparam
         query = text(f"""
             SELECT metadata_id, COUNT(*)
             FROM {table_name}
             WHERE metadata_id IN :metadata_ids
             GROUP BY metadata_id
         """).bindparams(bindparam("metadata_ids", expanding=True))
-        result = conn.execute(query, {"metadata_ids": unique_metadata_ids})
-        return {row[0]: row[1] for row in result.fetchall()}
+        return {
+            row[0]: row[1] for row in execute_chunked_in(conn, query, "metadata_ids", metadata_ids)
+        }
 
     def _get_statistics_avg_row_size(
         self,
@@ -375,24 +737,7 @@ class StorageCalculator:
         Returns:
             Average row size in bytes
         """
-        if is_mysql:
-            size_query = text("""
-                SELECT avg_row_length
-                FROM information_schema.tables
-                WHERE table_schema = DATABASE() AND table_name = 'statistics'
-            """)
-            size_result = conn.execute(size_query)
-            row = size_result.fetchone()
-            return row[0] if row and row[0] else DEFAULT_STATISTICS_ROW_SIZE
-        elif is_postgres:
-            size_query = text("""
-                SELECT pg_total_relation_size('statistics') / NULLIF((SELECT COUNT(*) FROM statistics), 0) as avg_row_size
-            """)
-            size_result = conn.execute(size_query)
-            row = size_result.fetchone()
-            return int(row[0]) if row and row[0] else DEFAULT_STATISTICS_ROW_SIZE
-        else:  # SQLite
-            return DEFAULT_STATISTICS_ROW_SIZE
+        return self._get_avg_row_sizes(conn, is_sqlite, is_mysql, is_postgres)['statistics']
 
     def _calculate_states_size(
         self,
@@ -416,25 +761,10 @@ class StorageCalculator:
         count_result = conn.execute(count_query, {"metadata_id": metadata_row.metadata_id})
         count_row = CountRow(count=count_result.fetchone()[0])
 
-        size = 0
-        if is_mysql:
-            size_query = text("""
-                SELECT avg_row_length
-                FROM information_schema.tables
-                WHERE table_schema = DATABASE() AND table_name = 'states'
-            """)
-            size_result = conn.execute(size_query)
-            avg_size_row = AvgRowSizeRow(avg_row_size=size_result.fetchone()[0] or DEFAULT_STATES_ROW_SIZE)
-            size = count_row.count * avg_size_row.avg_row_size
-        elif is_postgres:
-            size_query = text("""
-                SELECT pg_total_relation_size('states') / NULLIF((SELECT COUNT(*) FROM states), 0) as avg_row_size
-            """)
-            size_result = conn.execute(size_query)
-            avg_size_row = AvgRowSizeRow(avg_row_size=size_result.fetchone()[0] or DEFAULT_STATES_ROW_SIZE)
-            size = count_row.count * int(avg_size_row.avg_row_size)
-        else:  # SQLite
-            size = count_row.count * DEFAULT_STATES_ROW_SIZE
+        avg_size_row = AvgRowSizeRow(
+            avg_row_size=self._get_avg_row_sizes(conn, is_sqlite, is_mysql, is_postgres)['states']
+        )
+        size = count_row.count * avg_size_row.avg_row_size
 
         # Add states_meta row size
         size += STATES_META_ROW_SIZE
@@ -522,24 +852,7 @@ class StorageCalculator:
         count_result = conn.execute(count_query, {"metadata_id": metadata_id})
         count_row = CountRow(count=count_result.fetchone()[0])
 
-        if is_mysql:
-            # Use parameterized query for table name in information_schema
-            size_query = text("""
-                SELECT avg_row_length
-                FROM information_schema.tables
-                WHERE table_schema = DATABASE() AND table_name = :table_name
-            """)
-            size_result = conn.execute(size_query, {"table_name": table_name})
-            avg_size_row = AvgRowSizeRow(avg_row_size=size_result.fetchone()[0] or DEFAULT_STATISTICS_ROW_SIZE)
-            return count_row.count * avg_size_row.avg_row_size
-        elif is_postgres:
-            # For PostgreSQL, use proper type casting and parameterization where possible
-            # pg_total_relation_size requires string literal, so we use validated table_name
-            size_query = text(f"""
-                SELECT pg_total_relation_size('{table_name}') / NULLIF((SELECT COUNT(*) FROM {table_name}), 0) as avg_row_size
-            """)
-            size_result = conn.execute(size_query)
-            avg_size_row = AvgRowSizeRow(avg_row_size=size_result.fetchone()[0] or DEFAULT_STATISTICS_ROW_SIZE)
-            return count_row.count * int(avg_size_row.avg_row_size)
-        else:  # SQLite
-            return count_row.count * DEFAULT_STATISTICS_ROW_SIZE
+        avg_size_row = AvgRowSizeRow(
+            avg_row_size=self._get_avg_row_sizes(conn, is_sqlite, is_mysql, is_postgres)[table_name]
+        )
+        return count_row.count * avg_size_row.avg_row_size
@@ -33,3 +33,25 @@ Stores source, statistic_id, unit_of_measurement, and has_mean/sum flags."""
 MYSQL_COMPRESSION_FACTOR = 0.85
 """Compression factor for MySQL InnoDB compressed tables.
 InnoDB's page compression typically achieves ~15% size reduction (0.85 ratio)."""
+
+# Precise per-entity attribution (StorageCalculator precise mode)
+STATES_FIXED_ROW_BYTES = 80
+"""Bytes per states row outside the state string and attributes.
+Covers the record header, integer/float columns (ids, timestamps,
+origin_idx) and binary context ids as stored by the recorder schema."""
+
+STATES_INDEX_ROW_BYTES = 60
+"""Index bytes per states row.
+The recorder keeps several secondary indexes on states (metadata_id +
+last_updated_ts, attributes_id, context_id_bin, old_state_id); each entry
+holds the key plus the primary key and per-entry overhead."""
+
+PRECISE_SAMPLE_ROWS = 1000
+"""States rows sampled per entity for precise attribution (the most recent
+ones, read through the metadata_id + last_updated_ts index). Entities with
+fewer rows are measured in full."""
+
+TABLE_STATS_TTL = 300
+"""Seconds to reuse table-level average row sizes before re-reading them.
+Row sizes change slowly; one refresh serves steps 7 and 8 and any number
+of generate_delete_sql requests in between."""
@@ -4,10 +4,17 @@
  */
 
 import type {
+  BulkDeleteSqlResponse,
   DatabaseSize,
+  EntitiesPageQuery,
+  EntitiesPageResponse,
   EntityStorageOverviewResponse,
   GenerateSqlResponse,
   MessageHistogramResponse,
+  MessageHistogramsResponse,
+  NoisyEntitiesResponse,
+  NoisyRankBy,
+  NoisyWindow,
   OrphanOrigin,
   HomeAssistant,
   StepResponse
@@ -119,6 +126,23 @@ export class ApiService {
     }
   }
 
+  /**
+   * Generate batched set-based delete SQL for many entities in one request.
+   * Sent as a POST body since hundreds of entity_ids overflow a query string.
+   */
+  async generateBulkDeleteSql(entityIds: string[]): Promise<BulkDeleteSqlResponse> {
+    this.validateConnection();
+    try {
+      return await this.hass.callApi<BulkDeleteSqlResponse>(
+        'POST',
+        `${API_BASE}?action=generate_bulk_delete_sql`,
+        { entity_ids: entityIds }
+      );
+    } catch (err) {
+      throw new Error(`Failed to generate bulk delete SQL: ${err instanceof Error ? err.message : 'Unknown error'}`);
+    }
+  }
+
   /**
    * Fetch hourly message histogram for an entity
    */
@@ -139,4 +163,65 @@ export class ApiService {
       throw new Error(`Failed to fetch message histogram: ${err instanceof Error ? err.message : 'Unknown error'}`);
     }
   }
+
+  /**
+   * Fetch message histograms for several entities in one request
+   * (e.g. every row of the visible table page)
+   */
+  async fetchMessageHistograms(
+    entityIds: string[],
+    bucketSeconds: number = 3600,
+    hours: number = 24
+  ): Promise<MessageHistogramsResponse> {
+    this.validateConnection();
+    try {
+      const url = `${API_BASE}?action=entity_message_histograms` +
+        `&entity_ids=${encodeURIComponent(entityIds.join(','))}` +
+        `&bucket=${bucketSeconds}` +
+        `&hours=${hours}`;
+
+      return await this.hass.callApi<MessageHistogramsResponse>('GET', url);
+    } catch (err) {
+      throw new Error(`Failed to fetch message histograms: ${err instanceof Error ? err.message : 'Unknown error'}`);
+    }
+  }
+
+  /**
+   * Fetch the entities writing the most states over a recent window
+   */
+  async fetchNoisyEntities(
+    window: NoisyWindow = '24h',
+    limit: number = 20,
+    rankBy: NoisyRankBy = 'writes'
+  ): Promise<NoisyEntitiesResponse> {
+    this.validateConnection();
+    try {
+      const url = `${API_BASE}?action=noisy_entities` +
+        `&window=${encodeURIComponent(window)}` +
+        `&limit=${limit}` +
+        `&rank_by=${encodeURIComponent(rankBy)}`;
+
+      return await this.hass.callApi<NoisyEntitiesResponse>('GET', url);
+    } catch (err) {
+      throw new Error(`Failed to fetch noisy entities: ${err instanceof Error ? err.message : 'Unknown error'}`);
+    }
+  }
+
+  /**
+   * Fetch one page of the last finalized overview (sorted and filtered server-side)
+   * Returns 404 until an overview has completed step 8
+   */
+  async fetchEntitiesPage(query: EntitiesPageQuery = {}): Promise<EntitiesPageResponse> {
+    this.validateConnection();
+    try {
+      const params = Object.entries(query)
+        .filter(([, value]) => value !== undefined && value !== null && value !== '')
+        .map(([key, value]) => `&${key}=${encodeURIComponent(String(value))}`)
+        .join('');
+
+      return await this.hass.callApi<EntitiesPageResponse>('GET', `${API_BASE}?action=entities_page${params}`);
+    } catch (err) {
+      throw new Error(`Failed to fetch entities page: ${err instanceof Error ? err.message : 'Unknown error'}`);
+    }
+  }
 }
@@ -186,6 +186,9 @@ export class EntityFilterService {
           case 'stats_long_count':
             result = (a[column as keyof StorageEntity] as number) - (b[column as keyof StorageEntity] as number);
             break;
+          case 'estimated_bytes':
+            result = (a.estimated_bytes ?? 0) - (b.estimated_bytes ?? 0);
+            break;
           case 'update_interval':
             const aInterval = a.update_interval_seconds ?? 999999;
             const bInterval = b.update_interval_seconds ?? 999999;
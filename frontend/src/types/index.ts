@@ -51,6 +51,7 @@ export interface DatabaseSize {
   statistics_size: number;
   statistics_short_term_size: number;
   other_size: number;
+  counts_estimated?: boolean;  // Row counts from engine statistics (request exact=true for COUNT(*))
   version?: string;
 }
 
@@ -59,6 +60,16 @@ export interface GenerateSqlResponse {
   storage_saved: number;
 }
 
+// Set-based DELETEs for many entities, one transaction per batch
+export interface BulkDeleteSqlResponse {
+  sql: string;
+  batch_size: number;
+  batches: number;
+  states_metadata_ids: number;
+  statistics_metadata_ids: number;
+  missing: string[];
+}
+
 // Discriminated union for bulk SQL generation results
 export type BulkSqlGenerationResult =
   | {
@@ -97,10 +108,65 @@ export type BulkSqlGenerationResult =
 // Message Histogram Types
 // ============================================================================
 
+export interface HistogramCacheStats {
+  series: number;
+  buckets: number;
+  max_buckets: number;
+  hits: number;
+  misses: number;
+  evictions: number;
+}
+
 export interface MessageHistogramResponse {
   hourly_counts: number[];
   total_messages: number;
   time_range_hours: number;
+  cache_stats?: HistogramCacheStats;
+}
+
+export interface EntityHistogram {
+  counts: number[];
+  total_messages: number;
+}
+
+export interface MessageHistogramsResponse {
+  histograms: Record<string, EntityHistogram>;
+  bucket_seconds: number;
+  buckets: number;
+  time_range_hours: number;
+  start_ts: number;
+  end_ts: number;
+  cache_stats?: HistogramCacheStats;
+}
+
+// ============================================================================
+// Noisy Entity Types
+// ============================================================================
+
+export type NoisyWindow = '1h' | '24h' | '7d';
+export type NoisyRankBy = 'writes' | 'bytes';
+
+export interface NoisyEntity {
+  entity_id: string | null;
+  metadata_id: number;
+  writes: number;
+  writes_per_hour: number;
+  bytes: number;
+  bytes_per_day: number;
+  projected_bytes: number;
+  share_of_writes: number;
+}
+
+export interface NoisyEntitiesResponse {
+  entities: NoisyEntity[];
+  window: NoisyWindow;
+  window_seconds: number;
+  rank_by: NoisyRankBy;
+  limit: number;
+  projection_days: number;
+  total_writes: number;
+  total_bytes_per_day: number;
+  active_entities: number;
 }
 
 // ============================================================================
@@ -124,6 +190,10 @@ export interface StorageEntity {
   states_count: number;
   stats_short_count: number;
   stats_long_count: number;
+  estimated_bytes?: number;
+  estimated_states_bytes?: number;
+  estimated_short_term_bytes?: number;
+  estimated_long_term_bytes?: number;
   last_state_update: string | null;
   last_stats_update: string | null;
   // Additional metadata
@@ -198,6 +268,29 @@ export interface SortState {
   direction: SortDirection;
 }
 
+export interface EntitiesPageQuery {
+  offset?: number;
+  limit?: number;
+  sort?: string;
+  direction?: SortDirection;
+  registry_status?: RegistryStatus;
+  state_status?: StateStatus;
+  origin?: string;
+  domain?: string;
+  search?: string;
+}
+
+export interface EntitiesPageResponse {
+  entities: StorageEntity[];
+  total: number;
+  total_entities: number;
+  offset: number;
+  limit: number;
+  sort: string;
+  direction: SortDirection;
+  generated_at: number;
+}
+
 export interface ColumnConfig<T = unknown> {
   id: string;
   label: string;
@@ -257,6 +350,9 @@ export type ApiAction =
   | 'database_size'
   | 'entity_storage_overview_step'
   | 'entity_message_histogram'
-  | 'generate_delete_sql';
+  | 'entity_message_histograms'
+  | 'noisy_entities'
+  | 'generate_delete_sql'
+  | 'generate_bulk_delete_sql';
 
 // Note: Custom element types are declared in their respective component files
@@ -0,0 +1 @@
+"""Benchmarks for Statistics Orphan Finder."""
@@ -0,0 +1,148 @@
+"""Fixtures and helpers for Statistics Orphan Finder benchmarks.
+
+Benchmarks are marked ``slow`` and print their measurements. Run them with:
+
+    pytest -m slow -s tests/benchmarks
+
+Dataset size can be scaled with the ``SOF_BENCH_ROWS`` environment variable.
+Benchmarks using ``backend_engine`` also run against existing MySQL and
+PostgreSQL recorder databases given in ``SOF_BENCH_MYSQL_URL`` /
+``SOF_BENCH_POSTGRES_URL``.
+"""
+from __future__ import annotations
+
+import os
+import re
+from datetime import datetime, timezone
+from typing import Generator
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+
+BENCH_ROWS = int(os.environ.get("SOF_BENCH_ROWS", "20000"))
+BENCH_ENTITIES = int(os.environ.get("SOF_BENCH_ENTITIES", "200"))
+
+FACT_TABLES = ("states", "statistics", "statistics_short_term")
+
+REMOTE_URL_VARS = {
+    "mysql": "SOF_BENCH_MYSQL_URL",
+    "postgresql": "SOF_BENCH_POSTGRES_URL",
+}
+
+
+class QueryRecorder:
+    """Record statements executed on an engine and estimate rows scanned.
+
+    Every statement that reads a fact table without a metadata_id filter is
+    counted as a full scan of that table, which is how the recorder tables
+    are read by the overview aggregations.
+    """
+
+    def __init__(self, engine: Engine) -> None:
+        """Attach to engine."""
+        self.engine = engine
+        self.statements: list[str] = []
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def reset(self) -> None:
+        """Forget recorded statements."""
+        self.statements.clear()
+
+    def detach(self) -> None:
+        """Stop recording."""
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+    def full_scans(self, table: str) -> int:
+        """Count statements that scan the given fact table."""
+        pattern = re.compile(rf"\bFROM\s+{table}\b(?!_)", re.IGNORECASE)
+        return sum(len(pattern.findall(stmt)) for stmt in self.statements)
+
+    def rows_scanned(self, table_rows: dict[str, int]) -> dict[str, int]:
+        """Estimate rows scanned per fact table."""
+        return {
+            table: self.full_scans(table) * rows
+            for table, rows in table_rows.items()
+        }
+
+
+def populate_recorder(engine: Engine, rows: int = BENCH_ROWS, entities: int = BENCH_ENTITIES) -> dict[str, int]:
+    """Fill the recorder schema with synthetic data.
+
+    Returns:
+        Mapping of fact table name to row count
+    """
+    now = datetime.now(timezone.utc).timestamp()
+    with engine.connect() as conn:
+        conn.execute(
+            text("INSERT INTO states_meta (metadata_id, entity_id) VALUES (:id, :entity_id)"),
+            [{"id": i + 1, "entity_id": f"sensor.bench_{i}"} for i in range(entities)],
+        )
+        conn.execute(
+            text("""
+                INSERT INTO statistics_meta (id, statistic_id, source, unit_of_measurement, has_mean, has_sum)
+                VALUES (:id, :statistic_id, 'recorder', 'W', 1, 0)
+            """),
+            [{"id": i + 1, "statistic_id": f"sensor.bench_{i}"} for i in range(entities)],
+        )
+        conn.execute(
+            text("INSERT INTO states (metadata_id, state, last_updated_ts) VALUES (:m, :s, :ts)"),
+            [
+                {"m": (i % entities) + 1, "s": str(i % 100), "ts": now - (i * 30)}
+                for i in range(rows)
+            ],
+        )
+        stats_rows = max(1, rows // 10)
+        for table in ("statistics", "statistics_short_term"):
+            conn.execute(
+                text(f"INSERT INTO {table} (metadata_id, start_ts, mean) VALUES (:m, :ts, 1.0)"),
+                [
+                    {"m": (i % entities) + 1, "ts": now - (i * 300)}
+                    for i in range(stats_rows)
+                ],
+            )
+        conn.execute(text(
+            "CREATE INDEX ix_states_metadata_id_last_updated_ts ON states (metadata_id, last_updated_ts)"
+        ))
+        conn.commit()
+
+    return {"states": rows, "statistics": stats_rows, "statistics_short_term": stats_rows}
+
+
+@pytest.fixture
+def bench_table_rows(sqlite_engine: Engine) -> dict[str, int]:
+    """Populate the SQLite engine with a synthetic dataset and return row counts."""
+    return populate_recorder(sqlite_engine)
+
+
+@pytest.fixture
+def bench_engine(sqlite_engine: Engine, bench_table_rows: dict[str, int]) -> Engine:
+    """SQLite engine populated with a synthetic benchmark dataset."""
+    return sqlite_engine
+
+
+@pytest.fixture
+def query_recorder(bench_engine: Engine) -> Generator[QueryRecorder, None, None]:
+    """Statement recorder attached to the benchmark engine."""
+    recorder = QueryRecorder(bench_engine)
+    yield recorder
+    recorder.detach()
+
+
+@pytest.fixture(params=("sqlite", "mysql", "postgresql"))
+def backend_engine(request):
+    """Engine for each backend; remote backends are skipped without a URL."""
+    if request.param == "sqlite":
+        yield request.getfixturevalue("bench_engine")
+        return
+
+    url_var = REMOTE_URL_VARS[request.param]
+    url = os.environ.get(url_var)
+    if not url:
+        pytest.skip(f"{url_var} not set")
+    engine = create_engine(url)
+    yield engine
+    engine.dispose()
@@ -0,0 +1,109 @@
+"""Benchmark message histogram queries: entity_id join versus metadata_id range scan.
+
+SQLite runs against the synthetic benchmark dataset (scale it towards a
+production-sized states table with ``SOF_BENCH_ROWS``, e.g. 100000000).
+MySQL and PostgreSQL run read-only against an existing recorder database
+when ``SOF_BENCH_MYSQL_URL`` / ``SOF_BENCH_POSTGRES_URL`` are set.
+"""
+from __future__ import annotations
+
+import time
+
+import pytest
+from sqlalchemy import text
+
+from custom_components.statistics_orphan_finder.services.histogram_cache import HistogramCache
+from custom_components.statistics_orphan_finder.services.message_histogram import (
+    bucket_expression,
+    count_message_buckets,
+    resolve_metadata_ids,
+)
+
+pytestmark = pytest.mark.slow
+
+HOURS = 24
+ENTITY_COUNTS = (1, 100)
+
+# Query used before the histogram moved to metadata_id ranges (one per entity)
+JOIN_QUERY = text("""
+    SELECT
+        FLOOR((last_updated_ts - :cutoff) / 3600.0) as hour_bucket,
+        COUNT(*) as count
+    FROM states s
+    JOIN states_meta sm ON s.metadata_id = sm.metadata_id
+    WHERE sm.entity_id = :entity_id
+    AND s.last_updated_ts >= :cutoff
+    AND s.last_updated_ts < :end_cutoff
+    GROUP BY hour_bucket
+    ORDER BY hour_bucket
+""")
+
+
+def _join_per_entity(conn, entity_ids, first_bucket, end_bucket, now, cache):
+    """Legacy: one entity_id join query per entity."""
+    return {
+        entity_id: conn.execute(JOIN_QUERY, {
+            "entity_id": entity_id,
+            "cutoff": first_bucket * 3600,
+            "end_cutoff": end_bucket * 3600,
+        }).fetchall()
+        for entity_id in entity_ids
+    }
+
+
+def _metadata_range(conn, entity_ids, first_bucket, end_bucket, now, cache):
+    """metadata_ids resolved, then one range scan grouped by metadata_id and bucket."""
+    metadata_ids = list(resolve_metadata_ids(conn, entity_ids, cache))
+    return count_message_buckets(conn, metadata_ids, 3600, first_bucket, end_bucket, now, cache)
+
+
+def test_histogram_query_latency(backend_engine):
+    """Report histogram latency per strategy for one entity and a table page."""
+    with backend_engine.connect() as conn:
+        dialect = conn.dialect.name
+        print(f"\n{dialect} (bucket expression: {bucket_expression(conn)})")
+        print(f"{'entities':>10}{'join/entity':>14}{'range cold':>14}{'range warm':>14}")
+
+        now = time.time()
+        end_bucket = int(now // 3600)
+        first_bucket = end_bucket - HOURS
+        all_entity_ids = [
+            row[0] for row in conn.execute(
+                text("SELECT entity_id FROM states_meta ORDER BY metadata_id")
+            ).fetchmany(max(ENTITY_COUNTS))
+        ]
+
+        for entity_count in ENTITY_COUNTS:
+            entity_ids = all_entity_ids[:entity_count]
+            cache = HistogramCache()
+            timings = []
+            for strategy, strategy_cache in (
+                (_join_per_entity, None),
+                (_metadata_range, cache),
+                (_metadata_range, cache),
+            ):
+                start = time.perf_counter()
+                strategy(conn, entity_ids, first_bucket, end_bucket, now, strategy_cache)
+                timings.append(f"{(time.perf_counter() - start) * 1000:>12.1f}ms")
+            print(f"{entity_count:>10}" + "".join(timings))
+
+            assert cache.stats()["hits"] >= len(entity_ids) or not entity_ids
+
+        if dialect == "sqlite":
+            metadata_ids = list(resolve_metadata_ids(conn, all_entity_ids[:1]))
+            plan = conn.execute(text(f"""
+                EXPLAIN QUERY PLAN
+                SELECT metadata_id, {bucket_expression(conn)} AS bucket, COUNT(*)
+                FROM states
+                WHERE metadata_id = :metadata_id AND last_updated_ts >= :start AND last_updated_ts < :end
+                GROUP BY metadata_id, bucket
+            """), {
+                "metadata_id": metadata_ids[0],
+                "bucket": 3600,
+                "start": first_bucket * 3600,
+                "end": end_bucket * 3600,
+            }).fetchall()
+            details = " / ".join(row[-1] for row in plan)
+            print(f"plan: {details}")
+            assert "COVERING INDEX" in details
+        conn.rollback()
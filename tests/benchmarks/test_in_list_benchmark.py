@@ -0,0 +1,89 @@
+"""Benchmark IN list sizes against a temp-table join for metadata_id lookups.
+
+SQLite runs against the synthetic benchmark dataset. MySQL and PostgreSQL
+run against an existing recorder database when its URL is given in
+``SOF_BENCH_MYSQL_URL`` / ``SOF_BENCH_POSTGRES_URL``; the only write is a
+temporary table that is dropped afterwards.
+"""
+from __future__ import annotations
+
+import time
+
+import pytest
+from sqlalchemy import bindparam, text
+
+from custom_components.statistics_orphan_finder.services.chunked_query import (
+    execute_chunked_in,
+    in_chunk_size,
+)
+
+pytestmark = pytest.mark.slow
+
+ID_COUNTS = (100, 1000, 5000, 20000)
+
+COUNT_QUERY = text("""
+    SELECT metadata_id, COUNT(*)
+    FROM states
+    WHERE metadata_id IN :metadata_ids
+    GROUP BY metadata_id
+""").bindparams(bindparam("metadata_ids", expanding=True))
+
+
+def _single_in(conn, ids):
+    """One expanding IN list with every id."""
+    return dict(conn.execute(COUNT_QUERY, {"metadata_ids": ids}).fetchall())
+
+
+def _chunked_in(conn, ids):
+    """IN lists split by the dialect chunk size."""
+    return dict(execute_chunked_in(conn, COUNT_QUERY, "metadata_ids", ids))
+
+
+def _temp_table_join(conn, ids):
+    """Stage ids in a temporary table and join."""
+    conn.execute(text("CREATE TEMPORARY TABLE sof_bench_ids (id INTEGER PRIMARY KEY)"))
+    try:
+        conn.execute(text("INSERT INTO sof_bench_ids (id) VALUES (:id)"), [{"id": i} for i in ids])
+        return dict(conn.execute(text("""
+            SELECT s.metadata_id, COUNT(*)
+            FROM states s
+            JOIN sof_bench_ids t ON t.id = s.metadata_id
+            GROUP BY s.metadata_id
+        """)).fetchall())
+    finally:
+        conn.execute(text("DROP TABLE sof_bench_ids"))
+
+
+STRATEGIES = {
+    "single IN": _single_in,
+    "chunked IN": _chunked_in,
+    "temp table": _temp_table_join,
+}
+
+
+def test_in_list_strategies(backend_engine):
+    """Report timings of single IN, chunked IN and temp-table join per id count."""
+    with backend_engine.connect() as conn:
+        dialect = conn.dialect.name
+        print(f"\n{dialect} (chunk size {in_chunk_size(conn)})")
+        print(f"{'ids':>8}" + "".join(f"{name:>14}" for name in STRATEGIES))
+
+        for id_count in ID_COUNTS:
+            ids = list(range(1, id_count + 1))
+            timings = []
+            results = {}
+            for name, strategy in STRATEGIES.items():
+                start = time.perf_counter()
+                try:
+                    results[name] = strategy(conn, ids)
+                except Exception:  # noqa: BLE001 - a failing strategy is a result
+                    conn.rollback()
+                    timings.append(f"{'failed':>14}")
+                    continue
+                timings.append(f"{(time.perf_counter() - start) * 1000:>12.1f}ms")
+            print(f"{id_count:>8}" + "".join(timings))
+
+            assert results["chunked IN"] == results["temp table"]
+            if "single IN" in results:
+                assert results["single IN"] == results["chunked IN"]
+        conn.rollback()
@@ -0,0 +1,64 @@
+"""Benchmark rows scanned by the overview aggregation steps."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from custom_components.statistics_orphan_finder.services.entity_repository import (
+    EntityRepository,
+)
+
+pytestmark = pytest.mark.slow
+
+
+def _measure(recorder, table_rows, func, *args, **kwargs):
+    """Run func and return (elapsed_ms, rows_scanned_per_table)."""
+    recorder.reset()
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    return elapsed_ms, recorder.rows_scanned(table_rows)
+
+
+def test_overview_rows_scanned_per_step(bench_engine, bench_table_rows, query_recorder):
+    """Report rows scanned by steps 2, 4 and 5 before and after combining."""
+    table_rows = bench_table_rows
+
+    steps = {
+        "step 2 (states)": (
+            (EntityRepository.fetch_states_with_counts, {"combined": False}),
+            (EntityRepository.fetch_states_with_counts, {"combined": True}),
+        ),
+        "step 4 (short-term)": (
+            (EntityRepository.fetch_statistics_short_term, {}),
+            (EntityRepository.fetch_statistics_short_term, {}),
+        ),
+        "step 5 (long-term)": (
+            (EntityRepository.fetch_statistics_long_term, {}),
+            (EntityRepository.fetch_statistics_long_term, {}),
+        ),
+    }
+
+    print(f"\n{'step':<22}{'rows before':>14}{'rows after':>14}{'ms before':>12}{'ms after':>12}")
+    for name, ((before_fn, before_kwargs), (after_fn, after_kwargs)) in steps.items():
+        before_ms, before_rows = _measure(query_recorder, table_rows, before_fn, bench_engine, **before_kwargs)
+        after_ms, after_rows = _measure(query_recorder, table_rows, after_fn, bench_engine, **after_kwargs)
+        before_total = sum(before_rows.values())
+        after_total = sum(after_rows.values())
+        print(f"{name:<22}{before_total:>14}{after_total:>14}{before_ms:>12.1f}{after_ms:>12.1f}")
+
+        assert after_total <= before_total
+
+    # Step 2 must scan states exactly once in combined mode
+    query_recorder.reset()
+    EntityRepository.fetch_states_with_counts(bench_engine)
+    assert query_recorder.full_scans("states") == 1
+
+
+def test_combined_mode_matches_legacy_results(bench_engine):
+    """Combined single-pass mode returns the same data as the two-query mode."""
+    legacy = EntityRepository.fetch_states_with_counts(bench_engine, combined=False)
+    combined = EntityRepository.fetch_states_with_counts(bench_engine, combined=True)
+
+    assert combined == legacy
@@ -0,0 +1,149 @@
+"""Benchmark step 6 registry enrichment cost per entity and event loop blocking."""
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.statistics_orphan_finder.services.registry_adapter import (
+    RegistryAdapter,
+)
+from custom_components.statistics_orphan_finder.services.session_manager import EntityMap
+
+pytestmark = pytest.mark.slow
+
+ENTITY_COUNTS = tuple(
+    int(count) for count in os.environ.get("SOF_BENCH_REGISTRY_ENTITIES", "10000,50000,100000").split(",")
+)
+
+# Entities per device and number of config entries in the synthetic registry
+ENTITIES_PER_DEVICE = 8
+CONFIG_ENTRIES = 50
+
+
+def _synthetic_home(entity_count: int):
+    """Build a hass mock, registries and an entity_map for entity_count entities."""
+    now = datetime.now(timezone.utc)
+    config_entries = [
+        SimpleNamespace(entry_id=f"entry_{i}", title=f"Integration {i}", state=SimpleNamespace(name="LOADED"))
+        for i in range(CONFIG_ENTRIES)
+    ]
+    devices = {
+        f"device_{i}": SimpleNamespace(name=f"Device {i}", disabled=i % 50 == 0)
+        for i in range(entity_count // ENTITIES_PER_DEVICE + 1)
+    }
+    entries = {}
+    states = []
+    entity_map = EntityMap()
+    for i in range(entity_count):
+        entity_id = f"sensor.bench_{i}"
+        # 5% deleted from the registry, 2% disabled, 3% unavailable
+        if i % 20 != 0:
+            entries[entity_id] = SimpleNamespace(
+                entity_id=entity_id,
+                disabled=i % 50 == 1,
+                disabled_by="user" if i % 50 == 1 else None,
+                platform="bench",
+                device_id=f"device_{i // ENTITIES_PER_DEVICE}",
+                config_entry_id=f"entry_{i % CONFIG_ENTRIES}",
+            )
+            states.append(SimpleNamespace(
+                entity_id=entity_id,
+                state="unavailable" if i % 33 == 0 else "21.5",
+                last_changed=now - timedelta(minutes=i % 600),
+                attributes={"state_class": "measurement", "unit_of_measurement": "W"},
+            ))
+        record = entity_map[entity_id]
+        record['in_states_meta'] = True
+        record['in_states'] = True
+        record['states_count'] = i
+        if i % 3 == 0:
+            record['in_statistics_meta'] = True
+            record['in_statistics_long_term'] = True
+
+    hass = MagicMock()
+    hass.states.async_all.return_value = states
+    hass.config_entries.async_entries.return_value = config_entries
+    entity_registry = SimpleNamespace(entities=entries)
+    device_registry = SimpleNamespace(devices=devices)
+    return hass, entity_registry, device_registry, entity_map
+
+
+def test_registry_enrichment_per_entity_cost():
+    """Report snapshot build and enrichment time per entity."""
+    print(f"\n{'entities':>10}{'snapshot ms':>14}{'enrich ms':>12}{'us/entity':>12}")
+    for entity_count in ENTITY_COUNTS:
+        hass, entity_registry, device_registry, entity_map = _synthetic_home(entity_count)
+        adapter = RegistryAdapter(hass)
+
+        with patch(
+            "custom_components.statistics_orphan_finder.services.registry_adapter.er.async_get",
+            return_value=entity_registry,
+        ), patch(
+            "custom_components.statistics_orphan_finder.services.registry_adapter.dr.async_get",
+            return_value=device_registry,
+        ):
+            start = time.perf_counter()
+            snapshot = adapter.build_snapshot()
+            snapshot_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        entities = adapter.enrich_entities(entity_map, snapshot)
+        enrich_ms = (time.perf_counter() - start) * 1000
+
+        per_entity_us = (snapshot_ms + enrich_ms) * 1000 / entity_count
+        print(f"{entity_count:>10}{snapshot_ms:>14.1f}{enrich_ms:>12.1f}{per_entity_us:>12.2f}")
+
+        assert len(entities) == entity_count
+        # State machine and config entry lookups all come from the snapshot
+        hass.states.get.assert_not_called()
+        hass.config_entries.async_get_entry.assert_not_called()
+
+
+async def test_registry_snapshot_loop_blocking():
+    """Report the longest event loop stall while snapshotting registries on the loop."""
+    print(f"\n{'entities':>10}{'one-pass ms':>14}{'sliced ms':>12}{'max stall ms':>15}")
+    for entity_count in ENTITY_COUNTS:
+        hass, entity_registry, device_registry, _ = _synthetic_home(entity_count)
+        adapter = RegistryAdapter(hass)
+
+        with patch(
+            "custom_components.statistics_orphan_finder.services.registry_adapter.er.async_get",
+            return_value=entity_registry,
+        ), patch(
+            "custom_components.statistics_orphan_finder.services.registry_adapter.dr.async_get",
+            return_value=device_registry,
+        ):
+            start = time.perf_counter()
+            adapter.build_snapshot()
+            one_pass_ms = (time.perf_counter() - start) * 1000
+
+            # A ticker records the longest gap between its turns on the loop
+            done = False
+            max_gap = 0.0
+
+            async def ticker():
+                nonlocal max_gap
+                last = time.perf_counter()
+                while not done:
+                    await asyncio.sleep(0)
+                    now = time.perf_counter()
+                    max_gap = max(max_gap, now - last)
+                    last = now
+
+            task = asyncio.ensure_future(ticker())
+            await asyncio.sleep(0)
+            start = time.perf_counter()
+            snapshot = await adapter.async_build_snapshot()
+            sliced_ms = (time.perf_counter() - start) * 1000
+            done = True
+            await task
+
+        print(f"{entity_count:>10}{one_pass_ms:>14.1f}{sliced_ms:>12.1f}{max_gap * 1000:>15.2f}")
+
+        assert len(snapshot.entries) == len(entity_registry.entities)
@@ -0,0 +1,70 @@
+"""Benchmark the per-session memory footprint of the entity_map."""
+from __future__ import annotations
+
+import os
+import tracemalloc
+from collections import defaultdict
+
+import pytest
+
+from custom_components.statistics_orphan_finder.services.session_manager import (
+    ENTITY_FIELDS,
+    SessionManager,
+)
+
+pytestmark = pytest.mark.slow
+
+ENTITY_COUNTS = (1000, 10000, int(os.environ.get("SOF_BENCH_SESSION_ENTITIES", "30000")))
+
+
+def _dict_entity_map():
+    """The previous entity_map: a defaultdict of per-entity dicts."""
+    return defaultdict(lambda: dict(ENTITY_FIELDS))
+
+
+def _session_entity_map():
+    """The entity_map created by SessionManager."""
+    manager = SessionManager()
+    return manager.get_session_data(manager.create_session())['entity_map']
+
+
+def _fill(entity_map, entity_count: int) -> None:
+    """Merge synthetic step 1-5 results into the map."""
+    for i in range(entity_count):
+        entity = entity_map[f"sensor.bench_{i}"]
+        entity['in_states_meta'] = True
+        entity['in_states'] = True
+        entity['states_count'] = 1000 + i
+        entity['last_state_update'] = f"2026-01-01T00:00:{i % 60:02d}+00:00"
+        if i % 3 == 0:
+            entity['in_statistics_meta'] = True
+            entity['in_statistics_long_term'] = True
+            entity['stats_long_count'] = 500 + i
+            entity['metadata_id'] = i
+
+
+def _measure(factory, entity_count: int) -> int:
+    """Return bytes allocated by building and filling an entity_map."""
+    tracemalloc.start()
+    try:
+        entity_map = factory()
+        _fill(entity_map, entity_count)
+        size, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del entity_map
+    return size
+
+
+def test_session_entity_map_footprint():
+    """Report entity_map memory with dict entries versus slotted records."""
+    print(f"\n{'entities':>10}{'dict MB':>12}{'records MB':>12}{'ratio':>8}")
+    for entity_count in ENTITY_COUNTS:
+        dict_bytes = _measure(_dict_entity_map, entity_count)
+        record_bytes = _measure(_session_entity_map, entity_count)
+        print(
+            f"{entity_count:>10}{dict_bytes / 1e6:>12.2f}{record_bytes / 1e6:>12.2f}"
+            f"{record_bytes / dict_bytes:>8.2f}"
+        )
+
+        assert record_bytes < dict_bytes
@@ -33,6 +33,7 @@ def mock_config_entry() -> ConfigEntry:
             CONF_USERNAME: None,
             CONF_PASSWORD: None,
         },
+        options={},
         entry_id="test_entry_id",
         title="Test Statistics Orphan Finder",
     )
@@ -185,6 +186,10 @@ def mock_hass() -> MagicMock:
     # Mock states
     hass.states = MagicMock()
     hass.states.get = MagicMock(return_value=None)
+    hass.states.async_all = MagicMock(return_value=[])
+
+    # Mock event bus
+    hass.bus = MagicMock()
 
     return hass
 
@@ -219,6 +224,10 @@ def mock_entity_registry() -> MagicMock:
         return None
 
     registry.async_get = MagicMock(side_effect=async_get)
+    registry.entities = {
+        "sensor.temperature": enabled_entry,
+        "sensor.humidity": disabled_entry,
+    }
 
     return registry
 
@@ -228,6 +237,7 @@ def mock_device_registry() -> MagicMock:
     """Create a mock device registry."""
     registry = MagicMock(spec=dr.DeviceRegistry)
     registry.async_get = MagicMock(return_value=None)
+    registry.devices = {}
     return registry
 
 
@@ -0,0 +1,109 @@
+"""Tests for chunked IN list execution."""
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import bindparam, event, text
+from sqlalchemy.engine import Engine
+
+from custom_components.statistics_orphan_finder.services.chunked_query import (
+    DEFAULT_IN_CHUNK_SIZE,
+    IN_CHUNK_SIZES,
+    execute_chunked_in,
+    in_chunk_size,
+)
+from custom_components.statistics_orphan_finder.services.storage_calculator import (
+    StorageCalculator,
+)
+
+COUNT_QUERY = text("""
+    SELECT metadata_id, COUNT(*)
+    FROM states
+    WHERE metadata_id IN :metadata_ids
+    GROUP BY metadata_id
+""").bindparams(bindparam("metadata_ids", expanding=True))
+
+
+class TestExecuteChunkedIn:
+    """Test execute_chunked_in."""
+
+    def test_chunk_size_by_dialect(self, sqlite_engine: Engine):
+        """Test chunk size follows the connection dialect."""
+        with sqlite_engine.connect() as conn:
+            assert in_chunk_size(conn) == IN_CHUNK_SIZES['sqlite']
+        assert in_chunk_size(MagicMock(spec=[])) == DEFAULT_IN_CHUNK_SIZE
+
+    def test_results_match_single_query(self, populated_sqlite_engine: Engine):
+        """Test chunked results equal one unchunked query."""
+        with populated_sqlite_engine.connect() as conn:
+            expected = dict(conn.execute(COUNT_QUERY, {"metadata_ids": [1, 2, 3, 4]}).fetchall())
+            chunked = dict(execute_chunked_in(conn, COUNT_QUERY, "metadata_ids", [1, 2, 3, 4], chunk_size=1))
+
+        assert chunked == expected
+
+    def test_splits_and_deduplicates(self):
+        """Test values are de-duplicated and split into chunks with shared params."""
+        conn = MagicMock()
+        conn.execute.return_value.fetchall.side_effect = [[(1,)], [(2,)], [(3,)]]
+
+        rows = list(execute_chunked_in(
+            conn, COUNT_QUERY, "metadata_ids", [1, 2, 1, 3, 4, 5], {"limit": 7}, chunk_size=2
+        ))
+
+        assert rows == [(1,), (2,), (3,)]
+        bound = [call.args[1] for call in conn.execute.call_args_list]
+        assert bound == [
+            {"limit": 7, "metadata_ids": [1, 2]},
+            {"limit": 7, "metadata_ids": [3, 4]},
+            {"limit": 7, "metadata_ids": [5]},
+        ]
+
+    def test_empty_values_run_no_query(self):
+        """Test an empty IN list executes nothing."""
+        conn = MagicMock()
+        assert list(execute_chunked_in(conn, COUNT_QUERY, "metadata_ids", [])) == []
+        conn.execute.assert_not_called()
+
+    def test_invalid_chunk_size(self):
+        """Test chunk_size must be positive."""
+        with pytest.raises(ValueError):
+            list(execute_chunked_in(MagicMock(), COUNT_QUERY, "metadata_ids", [1], chunk_size=0))
+
+
+class TestStorageCalculatorChunking:
+    """Test batch storage queries stay below the SQLite variable limit."""
+
+    def test_many_entities_bind_bounded_lists(
+        self, mock_config_entry: MagicMock, sqlite_engine: Engine
+    ):
+        """Test thousands of entities are looked up in bounded IN lists."""
+        entity_count = 2500
+        with sqlite_engine.connect() as conn:
+            conn.execute(
+                text("INSERT INTO states_meta (metadata_id, entity_id) VALUES (:id, :entity_id)"),
+                [{"id": i + 1, "entity_id": f"sensor.deleted_{i}"} for i in range(entity_count)],
+            )
+            conn.execute(
+                text("INSERT INTO states (metadata_id, state) VALUES (:m, 'on')"),
+                [{"m": i + 1} for i in range(entity_count)],
+            )
+            conn.commit()
+
+        parameter_counts = []
+
+        def _on_execute(conn, cursor, statement, parameters, context, executemany):
+            if not executemany:
+                parameter_counts.append(len(parameters))
+
+        event.listen(sqlite_engine, "before_cursor_execute", _on_execute)
+        try:
+            calculator = StorageCalculator(mock_config_entry)
+            entities = [
+                {"entity_id": f"sensor.deleted_{i}", "origin": "States", "in_states_meta": True}
+                for i in range(entity_count)
+            ]
+            result = calculator.calculate_batch_storage(sqlite_engine, entities)
+        finally:
+            event.remove(sqlite_engine, "before_cursor_execute", _on_execute)
+
+        assert len(result) == entity_count
+        assert max(parameter_counts) <= IN_CHUNK_SIZES['sqlite']
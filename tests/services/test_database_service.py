@@ -7,6 +7,7 @@ import pytest
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
+from custom_components.statistics_orphan_finder.const import DB_POOL_SIZE
 from custom_components.statistics_orphan_finder.services.database_service import (
     DatabaseService,
 )
@@ -60,6 +61,22 @@ class TestDatabaseService:
             assert "test_user" in call_args
             assert "test_pass" in call_args
 
+    @pytest.mark.parametrize(
+        ("db_url", "pool_size"),
+        [("mysql://localhost/homeassistant", DB_POOL_SIZE), ("sqlite:///home-assistant_v2.db", None)],
+    )
+    def test_get_engine_pool_size(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, db_url: str, pool_size: int | None
+    ):
+        """Test remote databases pool a connection for every parallel overview read."""
+        mock_config_entry.data = {"db_url": db_url}
+        service = DatabaseService(mock_hass, mock_config_entry)
+
+        with patch("custom_components.statistics_orphan_finder.services.database_service.create_engine") as mock_create:
+            service.get_engine()
+
+        assert mock_create.call_args.kwargs.get("pool_size") == pool_size
+
     def test_get_engine_with_special_characters_in_password(
         self, mock_hass: MagicMock, mock_config_entry: MagicMock
     ):
@@ -273,6 +290,184 @@ class TestDatabaseSizeMultiDB:
         assert result["statistics_size"] >= 0
 
 
+class TestEstimatedRowCounts:
+    """Test row counts from engine statistics instead of COUNT(*)."""
+
+    def test_sqlite_uses_sqlite_stat1_after_analyze(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test SQLite reads row counts from sqlite_stat1 when ANALYZE has run."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        with populated_sqlite_engine.connect() as conn:
+            conn.execute(text("ANALYZE"))
+            conn.commit()
+
+        service = DatabaseService(mock_hass, mock_config_entry)
+        service._engine = populated_sqlite_engine
+
+        statements = []
+        from sqlalchemy import event
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(populated_sqlite_engine, "before_cursor_execute", before_execute)
+        try:
+            result = service._fetch_database_size()
+        finally:
+            event.remove(populated_sqlite_engine, "before_cursor_execute", before_execute)
+
+        assert result["counts_estimated"] is True
+        assert result["states"] == 4
+        assert result["statistics"] == 3
+        assert not any("COUNT(*)" in statement for statement in statements)
+
+    def test_sqlite_without_stats_falls_back_to_exact(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test SQLite counts exactly when sqlite_stat1 does not exist."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        service = DatabaseService(mock_hass, mock_config_entry)
+        service._engine = populated_sqlite_engine
+
+        result = service._fetch_database_size()
+
+        assert result["counts_estimated"] is False
+        assert result["states"] == 4
+
+    def test_exact_skips_estimates(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test exact=True always counts rows."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        with populated_sqlite_engine.connect() as conn:
+            conn.execute(text("ANALYZE"))
+            conn.execute(text("INSERT INTO states (metadata_id, state, last_updated_ts) VALUES (1, '5', 1.0)"))
+            conn.commit()
+
+        service = DatabaseService(mock_hass, mock_config_entry)
+        service._engine = populated_sqlite_engine
+
+        assert service._fetch_database_size()["states"] == 4
+        exact = service._fetch_database_size(exact=True)
+        assert exact["states"] == 5
+        assert exact["counts_estimated"] is False
+
+    @staticmethod
+    def _mock_connection(estimate_rows: list[tuple], exact_count: int) -> MagicMock:
+        """Connection returning estimate_rows for catalog queries and exact_count for COUNT(*)."""
+        conn = MagicMock()
+
+        def execute(query, params=None):
+            result = MagicMock()
+            if "COUNT(*)" in str(query):
+                result.fetchone.return_value = (exact_count,)
+            else:
+                result.fetchall.return_value = estimate_rows
+            return result
+
+        conn.execute.side_effect = execute
+        return conn
+
+    def test_mysql_uses_information_schema(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test MySQL estimates come from information_schema.tables.table_rows."""
+        service = DatabaseService(mock_hass, mock_config_entry)
+        conn = self._mock_connection(
+            [("states", 5000000), ("statistics", 200000), ("statistics_short_term", 90000)], 1
+        )
+
+        with patch.object(service, "get_db_type", return_value=(False, True, False)):
+            counts, estimated = service._fetch_row_counts(conn, exact=False)
+
+        assert estimated is True
+        assert counts == {"states": 5000000, "statistics": 200000, "statistics_short_term": 90000}
+        assert "information_schema.tables" in str(conn.execute.call_args_list[0].args[0])
+        assert conn.execute.call_count == 1
+
+    def test_postgres_unanalyzed_table_counted_exactly(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test tables with reltuples = -1 fall back to COUNT(*)."""
+        service = DatabaseService(mock_hass, mock_config_entry)
+        conn = self._mock_connection(
+            [("states", 1000000), ("statistics", -1), ("statistics_short_term", 4000)], 42
+        )
+
+        with patch.object(service, "get_db_type", return_value=(False, False, True)):
+            counts, estimated = service._fetch_row_counts(conn, exact=False)
+
+        assert estimated is True
+        assert counts == {"states": 1000000, "statistics": 42, "statistics_short_term": 4000}
+        query = str(conn.execute.call_args_list[0].args[0])
+        assert "reltuples" in query
+        # Follows search_path instead of assuming the public schema
+        assert "pg_table_is_visible" in query
+        assert "'public'" not in query
+
+
+class TestSqliteDbstatSizes:
+    """Test SQLite per-table sizes from the dbstat virtual table."""
+
+    def test_dbstat_sizes_account_for_whole_file(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test table sizes are whole pages and add up to the file size."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        service = DatabaseService(mock_hass, mock_config_entry)
+        service._engine = populated_sqlite_engine
+
+        with populated_sqlite_engine.connect() as conn:
+            page_size, page_count = conn.execute(
+                text("SELECT page_size, page_count FROM pragma_page_size(), pragma_page_count()")
+            ).fetchone()
+            table_sizes = service._fetch_sqlite_table_sizes(conn)
+
+        result = service._fetch_database_size()
+
+        assert table_sizes is not None
+        assert result["states_size"] == table_sizes["states"]
+        assert result["states_size"] > 0
+        assert result["states_size"] % page_size == 0
+        assert result["statistics_size"] % page_size == 0
+        assert (
+            result["states_size"] + result["statistics_size"]
+            + result["statistics_short_term_size"] + result["other_size"]
+        ) == page_size * page_count
+
+    def test_indexes_are_attributed_to_their_table(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test index b-trees count towards the table they belong to."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        service = DatabaseService(mock_hass, mock_config_entry)
+
+        with populated_sqlite_engine.connect() as conn:
+            before = service._fetch_sqlite_table_sizes(conn)["states"]
+            conn.execute(text("CREATE INDEX ix_test_states_state ON states (state)"))
+            conn.commit()
+            after = service._fetch_sqlite_table_sizes(conn)
+
+        assert "ix_test_states_state" not in after
+        assert after["states"] > before
+
+    def test_falls_back_to_row_ratio_without_dbstat(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test the proportional estimate is used when dbstat is unavailable."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        service = DatabaseService(mock_hass, mock_config_entry)
+        service._engine = populated_sqlite_engine
+
+        with patch.object(service, "_fetch_sqlite_table_sizes", return_value=None):
+            result = service._fetch_database_size()
+
+        assert result["states_size"] > 0
+        assert result["statistics_size"] > 0
+        assert result["statistics_short_term_size"] > 0
+
+
 class TestDatabaseServiceIntegration:
     """Integration tests with real database."""
 
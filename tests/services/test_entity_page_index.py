@@ -0,0 +1,175 @@
+"""Tests for EntityPageIndex."""
+import pytest
+
+from custom_components.statistics_orphan_finder.services.entity_page_index import (
+    MAX_PAGE_LIMIT,
+    EntityPageIndex,
+)
+
+
+def _entity(entity_id: str, **overrides) -> dict:
+    """Build a finalized entity dict with sensible defaults."""
+    entity = {
+        'entity_id': entity_id,
+        'in_entity_registry': True,
+        'registry_status': 'Enabled',
+        'in_state_machine': True,
+        'state_status': 'Available',
+        'in_states_meta': True,
+        'in_states': True,
+        'in_statistics_meta': False,
+        'in_statistics_short_term': False,
+        'in_statistics_long_term': False,
+        'states_count': 0,
+        'stats_short_count': 0,
+        'stats_long_count': 0,
+        'last_state_update': None,
+        'last_stats_update': None,
+        'update_interval_seconds': None,
+        'origin': None,
+    }
+    entity.update(overrides)
+    return entity
+
+
+@pytest.fixture
+def entities() -> list[dict]:
+    """Entities sorted by entity_id, as produced by step 6."""
+    return [
+        _entity('light.kitchen', states_count=50, update_interval_seconds=60),
+        _entity('sensor.humidity', states_count=10, registry_status='Disabled',
+                state_status='Unavailable', update_interval_seconds=30),
+        _entity('sensor.power', states_count=500, in_statistics_meta=True,
+                in_statistics_long_term=True, origin='Long-term',
+                last_state_update='2026-10-16T10:00:00+00:00'),
+        _entity('sensor.temperature', states_count=50, in_statistics_meta=True,
+                in_statistics_short_term=True, in_statistics_long_term=True, origin='Both',
+                last_state_update='2026-10-17T10:00:00+00:00'),
+        _entity('switch.old_kitchen_plug', states_count=5, in_entity_registry=False,
+                registry_status='Not in Registry', in_state_machine=False,
+                state_status='Not Present', origin='States'),
+    ]
+
+
+def _ids(page: dict) -> list[str]:
+    return [e['entity_id'] for e in page['entities']]
+
+
+class TestEntityPageIndex:
+    """Test paging, sorting and filtering."""
+
+    def test_default_page(self, entities):
+        """Test default request returns entity_id order and counts."""
+        index = EntityPageIndex(entities, generated_at=123.0)
+
+        page = index.get_page()
+
+        assert _ids(page) == [e['entity_id'] for e in entities]
+        assert page['total'] == 5
+        assert page['total_entities'] == 5
+        assert page['generated_at'] == 123.0
+        assert page['sort'] == 'entity_id'
+        assert page['direction'] == 'asc'
+
+    def test_offset_and_limit(self, entities):
+        """Test only the requested slice is returned."""
+        index = EntityPageIndex(entities)
+
+        page = index.get_page(offset=1, limit=2)
+
+        assert _ids(page) == ['sensor.humidity', 'sensor.power']
+        assert page['total'] == 5
+
+    def test_offset_past_end_returns_empty_page(self, entities):
+        """Test an offset beyond the result is an empty page, not an error."""
+        page = EntityPageIndex(entities).get_page(offset=10)
+
+        assert page['entities'] == []
+        assert page['total'] == 5
+
+    def test_sort_numeric_desc_keeps_entity_id_order_for_ties(self, entities):
+        """Test descending sort is stable like the frontend sort."""
+        page = EntityPageIndex(entities).get_page(sort_key='states_count', direction='desc')
+
+        assert _ids(page) == [
+            'sensor.power', 'light.kitchen', 'sensor.temperature',
+            'sensor.humidity', 'switch.old_kitchen_plug',
+        ]
+
+    def test_sort_update_interval_puts_unknown_last(self, entities):
+        """Test entities without an update interval sort after known ones."""
+        page = EntityPageIndex(entities).get_page(sort_key='update_interval')
+
+        assert _ids(page)[:2] == ['sensor.humidity', 'light.kitchen']
+
+    def test_sort_last_state_update_treats_none_as_oldest(self, entities):
+        """Test missing timestamps sort first ascending."""
+        page = EntityPageIndex(entities).get_page(sort_key='last_state_update', direction='desc')
+
+        assert _ids(page)[:2] == ['sensor.temperature', 'sensor.power']
+
+    def test_sort_alias(self, entities):
+        """Test frontend column ids are accepted as sort keys."""
+        page = EntityPageIndex(entities).get_page(sort_key='registry')
+
+        assert page['sort'] == 'registry_status'
+        assert _ids(page)[0] == 'sensor.humidity'
+
+    def test_filters(self, entities):
+        """Test exact-match filters combine with AND."""
+        index = EntityPageIndex(entities)
+
+        assert _ids(index.get_page(filters={'registry_status': 'Disabled'})) == ['sensor.humidity']
+        assert _ids(index.get_page(filters={'state_status': 'Not Present'})) == ['switch.old_kitchen_plug']
+        assert _ids(index.get_page(filters={'origin': 'Both'})) == ['sensor.temperature']
+        assert _ids(index.get_page(filters={'domain': 'sensor', 'state_status': 'Available'})) == [
+            'sensor.power', 'sensor.temperature'
+        ]
+
+    def test_empty_filter_values_are_ignored(self, entities):
+        """Test blank filter values do not restrict the result."""
+        page = EntityPageIndex(entities).get_page(filters={'origin': '', 'domain': None})
+
+        assert page['total'] == 5
+
+    def test_search_is_case_insensitive_substring(self, entities):
+        """Test text search matches anywhere in entity_id."""
+        page = EntityPageIndex(entities).get_page(search='KITCHEN')
+
+        assert _ids(page) == ['light.kitchen', 'switch.old_kitchen_plug']
+
+    def test_filtered_result_is_sorted(self, entities):
+        """Test filtering preserves the requested sort order."""
+        page = EntityPageIndex(entities).get_page(
+            sort_key='states_count', direction='desc', filters={'domain': 'sensor'}
+        )
+
+        assert _ids(page) == ['sensor.power', 'sensor.temperature', 'sensor.humidity']
+        assert page['total'] == 3
+
+    def test_repeated_requests_reuse_sorted_result(self, entities):
+        """Test paging through the same view does not re-filter."""
+        index = EntityPageIndex(entities)
+        index.get_page(limit=2, filters={'domain': 'sensor'})
+
+        key = ('entity_id', 'asc', (('domain', 'sensor'),), '')
+        cached = index._results[key]
+        index.get_page(offset=2, limit=2, filters={'domain': 'sensor'})
+
+        assert index._results[key] is cached
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"offset": -1},
+            {"limit": 0},
+            {"limit": MAX_PAGE_LIMIT + 1},
+            {"direction": "up"},
+            {"sort_key": "device_name"},
+            {"filters": {"platform": "mqtt"}},
+        ],
+    )
+    def test_invalid_parameters(self, entities, kwargs):
+        """Test invalid parameters raise ValueError."""
+        with pytest.raises(ValueError):
+            EntityPageIndex(entities).get_page(**kwargs)
@@ -266,3 +266,62 @@ class TestEntityRepository:
         EntityRepository.fetch_statistics_meta(sqlite_engine)
         EntityRepository.fetch_statistics_short_term(sqlite_engine)
         EntityRepository.fetch_statistics_long_term(sqlite_engine)
+
+    def test_fetch_states_with_counts_combined_matches_legacy(self, populated_sqlite_engine):
+        """Test combined single-pass mode returns same data as two-query mode."""
+        with populated_sqlite_engine.connect() as conn:
+            now = datetime.now(timezone.utc).timestamp()
+            for i in range(5):
+                conn.execute(text("""
+                    INSERT INTO states (metadata_id, state, last_updated_ts)
+                    VALUES (2, :state, :timestamp)
+                """), {"state": str(i), "timestamp": now - (i * 600)})
+            # Old state outside the 24h window must not count towards frequency
+            conn.execute(text("""
+                INSERT INTO states (metadata_id, state, last_updated_ts)
+                VALUES (2, 'old', :timestamp)
+            """), {"timestamp": now - 3 * 86400})
+            conn.commit()
+
+        legacy = EntityRepository.fetch_states_with_counts(populated_sqlite_engine, combined=False)
+        combined = EntityRepository.fetch_states_with_counts(populated_sqlite_engine, combined=True)
+
+        assert combined == legacy
+        states_data, frequency_data = combined
+        assert states_data["sensor.humidity"]["count"] == 7
+        assert frequency_data["sensor.humidity"]["update_count_24h"] == 6
+        # Entities with fewer than 2 updates in 24h get no frequency data
+        assert "sensor.deleted_entity" not in frequency_data
+
+    def test_fetch_states_with_counts_skips_rows_without_states_meta(self, populated_sqlite_engine):
+        """Test rows whose metadata_id is missing from states_meta are ignored."""
+        with populated_sqlite_engine.connect() as conn:
+            conn.execute(text("""
+                INSERT INTO states (metadata_id, state, last_updated_ts)
+                VALUES (999, 'orphan', 1.0)
+            """))
+            conn.commit()
+
+        states_data, _ = EntityRepository.fetch_states_with_counts(populated_sqlite_engine)
+
+        assert set(states_data) == {"sensor.temperature", "sensor.humidity", "sensor.deleted_entity"}
+
+    def test_fetch_states_with_counts_uses_provided_metadata_map(self, populated_sqlite_engine):
+        """Test a provided metadata map is used instead of querying states_meta."""
+        states_data, _ = EntityRepository.fetch_states_with_counts(
+            populated_sqlite_engine, metadata_map={1: "sensor.renamed"}
+        )
+
+        assert set(states_data) == {"sensor.renamed"}
+        assert states_data["sensor.renamed"]["count"] == 2
+
+    def test_fetch_statistics_groups_by_metadata_id(self, populated_sqlite_engine):
+        """Test statistics aggregations map metadata_id back to statistic_id."""
+        long_term = EntityRepository.fetch_statistics_long_term(populated_sqlite_engine)
+        short_term = EntityRepository.fetch_statistics_short_term(
+            populated_sqlite_engine, metadata_map={3: "sensor.deleted_stats"}
+        )
+
+        assert long_term["sensor.temperature"]["count"] == 2
+        assert long_term["sensor.humidity"]["count"] == 1
+        assert set(short_term) == {"sensor.deleted_stats"}
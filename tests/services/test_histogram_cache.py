@@ -0,0 +1,137 @@
+"""Tests for the closed histogram bucket cache."""
+from unittest.mock import patch
+
+from custom_components.statistics_orphan_finder.services.histogram_cache import (
+    METADATA_ID_TTL,
+    RECOUNT_WINDOW,
+    HistogramCache,
+)
+
+
+class TestHistogramCache:
+    """Test HistogramCache."""
+
+    def test_get_slices_from_first_bucket(self):
+        """Test a hit returns the cached counts from the requested bucket onwards."""
+        cache = HistogramCache()
+        cache.store(1, 3600, 100, [1, 2, 3, 4])
+
+        assert cache.get(1, 3600, 100) == [1, 2, 3, 4]
+        assert cache.get(1, 3600, 102) == [3, 4]
+        assert cache.get(1, 3600, 110) == []
+
+    def test_miss_when_range_starts_before_series(self):
+        """Test a request reaching further back than the series is a miss."""
+        cache = HistogramCache()
+        cache.store(1, 3600, 100, [1, 2])
+
+        assert cache.get(1, 3600, 99) is None
+        assert cache.get(1, 300, 100) is None
+        assert cache.get(2, 3600, 100) is None
+        assert cache.stats()["misses"] == 3
+
+    def test_store_keeps_longer_series(self):
+        """Test a shorter series for the same start does not replace a longer one."""
+        cache = HistogramCache()
+        cache.store(1, 3600, 100, [1, 2, 3])
+        cache.store(1, 3600, 100, [1, 2])
+
+        assert cache.get(1, 3600, 100) == [1, 2, 3]
+        assert cache.stats()["buckets"] == 3
+
+    def test_store_keeps_series_covering_new_range(self):
+        """Test a shorter, later-starting range does not replace a covering series."""
+        cache = HistogramCache()
+        cache.store(1, 3600, 100, [1, 2, 3, 4, 5])
+        cache.store(1, 3600, 102, [3, 4])
+
+        assert cache.get(1, 3600, 100) == [1, 2, 3, 4, 5]
+        assert cache.stats()["buckets"] == 5
+
+    def test_store_merges_overlapping_and_contiguous_ranges(self):
+        """Test ranges that overlap or touch extend one series."""
+        cache = HistogramCache()
+        cache.store(1, 3600, 100, [1, 2, 3])
+        cache.store(1, 3600, 102, [3, 4, 5])
+        cache.store(1, 3600, 98, [8, 9])
+
+        assert cache.get(1, 3600, 98) == [8, 9, 1, 2, 3, 4, 5]
+        assert cache.stats()["buckets"] == 7
+
+    def test_store_replaces_disjoint_range(self):
+        """Test a range with a gap to the cached series replaces it."""
+        cache = HistogramCache()
+        cache.store(1, 3600, 100, [1, 2])
+        cache.store(1, 3600, 200, [7])
+
+        assert cache.get(1, 3600, 100) is None
+        assert cache.get(1, 3600, 200) == [7]
+        assert cache.stats()["buckets"] == 1
+
+    def test_invalidate_drops_and_skips_until_window_ends(self):
+        """Test invalidated metadata_ids are neither served nor stored within the window."""
+        cache = HistogramCache()
+        monotonic = "custom_components.statistics_orphan_finder.services.histogram_cache.time.monotonic"
+        with patch(monotonic, return_value=1000.0):
+            cache.store(1, 3600, 100, [1, 2])
+            cache.store(1, 300, 100, [1])
+            cache.store(2, 3600, 100, [5])
+            cache.store_metadata_ids({"sensor.a": (1,), "sensor.b": (2,)})
+
+            cache.invalidate([1])
+            cache.store(1, 3600, 100, [1, 2])
+
+            assert cache.get(1, 3600, 100) is None
+            assert cache.get(2, 3600, 100) == [5]
+            assert cache.get_metadata_ids(["sensor.a", "sensor.b"]) == {"sensor.b": (2,)}
+            assert cache.stats()["buckets"] == 1
+
+        with patch(monotonic, return_value=1000.0 + RECOUNT_WINDOW):
+            cache.store(1, 3600, 100, [1, 2])
+            assert cache.get(1, 3600, 100) == [1, 2]
+
+    def test_lru_eviction_by_bucket_count(self):
+        """Test the least recently used series are evicted to stay under max_buckets."""
+        cache = HistogramCache(max_buckets=5)
+        cache.store(1, 3600, 0, [1, 1])
+        cache.store(2, 3600, 0, [2, 2])
+        cache.get(1, 3600, 0)
+        cache.store(3, 3600, 0, [3, 3])
+
+        assert cache.get(2, 3600, 0) is None
+        assert cache.get(1, 3600, 0) == [1, 1]
+        stats = cache.stats()
+        assert stats["evictions"] == 1
+        assert stats["series"] == 2
+        assert stats["buckets"] == 4
+
+    def test_clear_keeps_statistics(self):
+        """Test clear drops series but keeps the counters."""
+        cache = HistogramCache()
+        cache.store(1, 3600, 0, [1])
+        cache.get(1, 3600, 0)
+        cache.clear()
+
+        stats = cache.stats()
+        assert stats["series"] == 0
+        assert stats["buckets"] == 0
+        assert stats["hits"] == 1
+
+    def test_metadata_ids_expire(self):
+        """Test metadata_id lookups are dropped after METADATA_ID_TTL."""
+        cache = HistogramCache()
+        with patch(
+            "custom_components.statistics_orphan_finder.services.histogram_cache.time.monotonic",
+            return_value=1000.0,
+        ):
+            cache.store_metadata_ids({"sensor.a": (1,), "sensor.none": ()})
+            assert cache.get_metadata_ids(["sensor.a", "sensor.none", "sensor.b"]) == {
+                "sensor.a": (1,), "sensor.none": ()
+            }
+
+        with patch(
+            "custom_components.statistics_orphan_finder.services.histogram_cache.time.monotonic",
+            return_value=1000.0 + METADATA_ID_TTL,
+        ):
+            assert cache.get_metadata_ids(["sensor.a"]) == {}
+        assert cache.stats()["metadata_ids"] == 1
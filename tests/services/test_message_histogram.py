@@ -0,0 +1,240 @@
+"""Tests for batched message histograms."""
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+
+from custom_components.statistics_orphan_finder.services.histogram_cache import HistogramCache
+from custom_components.statistics_orphan_finder.services.message_histogram import (
+    BUCKET_EXPRESSIONS,
+    DEFAULT_BUCKET_EXPRESSION,
+    MAX_HISTOGRAM_ENTITIES,
+    MAX_HISTOGRAM_HOURS,
+    bucket_expression,
+    get_message_histograms,
+    resolve_metadata_ids,
+    validate_histogram_request,
+)
+
+# Bucket-aligned reference time (a multiple of one day) plus 10 minutes
+NOW = 1_700_006_400 + 600
+
+
+def _insert(engine: Engine, entities: dict[str, int], timestamps: dict[int, list[float]]) -> None:
+    """Insert states_meta rows and states at the given timestamps per metadata_id."""
+    with engine.connect() as conn:
+        for entity_id, metadata_id in entities.items():
+            conn.execute(
+                text("INSERT INTO states_meta (metadata_id, entity_id) VALUES (:id, :entity_id)"),
+                {"id": metadata_id, "entity_id": entity_id},
+            )
+        for metadata_id, values in timestamps.items():
+            for ts in values:
+                conn.execute(
+                    text("INSERT INTO states (metadata_id, state, last_updated_ts) VALUES (:id, '1', :ts)"),
+                    {"id": metadata_id, "ts": ts},
+                )
+        conn.commit()
+
+
+class TestGetMessageHistograms:
+    """Test get_message_histograms."""
+
+    def test_counts_per_entity_and_bucket(self, sqlite_engine: Engine):
+        """Test each entity gets its own zero-filled series aligned to the bucket size."""
+        _insert(
+            sqlite_engine,
+            {"sensor.a": 1, "sensor.b": 2},
+            {
+                1: [NOW - 60, NOW - 120, NOW - 3600 - 60],
+                2: [NOW - 3 * 3600, NOW - 30 * 3600],
+            },
+        )
+
+        result = get_message_histograms(sqlite_engine, ["sensor.a", "sensor.b"], 3600, 24, now=NOW)
+
+        assert result["buckets"] == 24
+        assert result["max_hours"] == MAX_HISTOGRAM_HOURS
+        assert result["end_ts"] == NOW - 600 + 3600
+        assert result["start_ts"] == result["end_ts"] - 24 * 3600
+        counts_a = result["histograms"]["sensor.a"]["counts"]
+        assert counts_a[-1] == 2
+        assert counts_a[-2] == 1
+        assert result["histograms"]["sensor.a"]["total_messages"] == 3
+        # The 30h-old state is outside the 24h range
+        assert result["histograms"]["sensor.b"]["counts"][-4] == 1
+        assert result["histograms"]["sensor.b"]["total_messages"] == 1
+
+    def test_five_minute_buckets(self, sqlite_engine: Engine):
+        """Test sub-hour buckets split the open hour."""
+        _insert(sqlite_engine, {"sensor.a": 1}, {1: [NOW - 60, NOW - 420, NOW - 430]})
+
+        result = get_message_histograms(sqlite_engine, ["sensor.a"], 300, 1, now=NOW)
+
+        assert result["buckets"] == 12
+        # NOW starts a 5 minute bucket, so the open bucket is still empty
+        assert result["histograms"]["sensor.a"]["counts"][-3:] == [2, 1, 0]
+
+    def test_unknown_entity_is_zero_filled(self, sqlite_engine: Engine):
+        """Test entities without states_meta rows get empty series."""
+        result = get_message_histograms(sqlite_engine, ["sensor.missing"], 86400, 240, now=NOW)
+
+        assert result["histograms"]["sensor.missing"] == {"counts": [0] * 10, "total_messages": 0}
+
+    def test_single_aggregate_query(self, sqlite_engine: Engine):
+        """Test all entities are counted by one GROUP BY query after the metadata lookup."""
+        _insert(
+            sqlite_engine,
+            {f"sensor.s{i}": i for i in range(1, 6)},
+            {i: [NOW - 60] for i in range(1, 6)},
+        )
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(sqlite_engine, "before_cursor_execute", capture)
+        try:
+            get_message_histograms(sqlite_engine, [f"sensor.s{i}" for i in range(1, 6)], 3600, 24, now=NOW)
+        finally:
+            event.remove(sqlite_engine, "before_cursor_execute", capture)
+
+        assert len(statements) == 2
+        assert "GROUP BY metadata_id, bucket" in statements[1]
+
+    def test_warm_cache_counts_only_new_buckets(self, sqlite_engine: Engine):
+        """Test a repeated request only queries the buckets after the cached closed ones."""
+        _insert(sqlite_engine, {"sensor.a": 1}, {1: [NOW - 5 * 3600, NOW - 60]})
+        cache = HistogramCache()
+        first = get_message_histograms(sqlite_engine, ["sensor.a"], 3600, 24, now=NOW, cache=cache)
+
+        # A state in the open hour and one late row in a cached closed hour
+        _insert(sqlite_engine, {}, {1: [NOW + 60, NOW - 5 * 3600 + 1]})
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(sqlite_engine, "before_cursor_execute", capture)
+        try:
+            second = get_message_histograms(sqlite_engine, ["sensor.a"], 3600, 24, now=NOW + 120, cache=cache)
+        finally:
+            event.remove(sqlite_engine, "before_cursor_execute", capture)
+
+        # Closed hours come from the cache, so the late row is not seen
+        assert second["histograms"]["sensor.a"]["counts"][:-1] == first["histograms"]["sensor.a"]["counts"][:-1]
+        assert second["histograms"]["sensor.a"]["counts"][-1] == 2
+        histogram_statement, parameters = statements[-1]
+        assert "GROUP BY metadata_id, bucket" in histogram_statement
+        assert (NOW - 600) in parameters
+        assert cache.stats()["hits"] == 1
+
+    def test_open_bucket_is_not_cached(self, sqlite_engine: Engine):
+        """Test only buckets that ended the settle time ago are stored."""
+        _insert(sqlite_engine, {"sensor.a": 1}, {1: [NOW - 60]})
+        cache = HistogramCache()
+
+        get_message_histograms(sqlite_engine, ["sensor.a"], 3600, 24, now=NOW, cache=cache)
+
+        assert cache.stats()["buckets"] == 23
+
+    def test_warm_cache_skips_metadata_lookup(self, sqlite_engine: Engine):
+        """Test a repeated request runs only the histogram range query."""
+        _insert(sqlite_engine, {"sensor.a": 1}, {1: [NOW - 60]})
+        cache = HistogramCache()
+        get_message_histograms(sqlite_engine, ["sensor.a", "sensor.none"], 3600, 24, now=NOW, cache=cache)
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(sqlite_engine, "before_cursor_execute", capture)
+        try:
+            result = get_message_histograms(
+                sqlite_engine, ["sensor.a", "sensor.none"], 3600, 24, now=NOW, cache=cache
+            )
+        finally:
+            event.remove(sqlite_engine, "before_cursor_execute", capture)
+
+        assert len(statements) == 1
+        assert "states_meta" not in statements[0]
+        assert result["histograms"]["sensor.a"]["total_messages"] == 1
+        assert result["histograms"]["sensor.none"]["total_messages"] == 0
+
+    def test_invalid_request_raises(self, sqlite_engine: Engine):
+        """Test out-of-range requests are rejected before querying."""
+        with pytest.raises(ValueError):
+            get_message_histograms(sqlite_engine, ["sensor.a"], 60, 24, now=NOW)
+
+
+class TestValidateHistogramRequest:
+    """Test validate_histogram_request."""
+
+    @pytest.mark.parametrize(
+        ("entity_ids", "bucket_seconds", "hours"),
+        [
+            ([], 3600, 24),
+            (["invalid"], 3600, 24),
+            ([f"sensor.s{i}" for i in range(MAX_HISTOGRAM_ENTITIES + 1)], 3600, 24),
+            (["sensor.a"], 120, 24),
+            (["sensor.a"], 3600, 0),
+            (["sensor.a"], 3600, 241),
+            (["sensor.a"], 86400, 36),
+        ],
+    )
+    def test_rejects_out_of_range(self, entity_ids, bucket_seconds, hours):
+        """Test unsupported parameters raise ValueError."""
+        with pytest.raises(ValueError):
+            validate_histogram_request(entity_ids, bucket_seconds, hours)
+
+    def test_error_names_the_retention_cap(self):
+        """Test a too-long range explains the cap."""
+        with pytest.raises(ValueError, match=f"between 1 and {MAX_HISTOGRAM_HOURS} .*10 days"):
+            validate_histogram_request(["sensor.a"], 3600, MAX_HISTOGRAM_HOURS + 1)
+
+    def test_accepts_purge_window_of_daily_buckets(self):
+        """Test the longest range with the largest bucket is accepted."""
+        validate_histogram_request(["sensor.a"], 86400, 240)
+
+
+class TestBucketExpression:
+    """Test the dialect-specific bucket index."""
+
+    @pytest.mark.parametrize("dialect", ["sqlite", "mysql", "postgresql"])
+    def test_expression_by_dialect(self, dialect):
+        """Test known dialects use integer division."""
+        conn = MagicMock()
+        conn.dialect.name = dialect
+
+        assert bucket_expression(conn) == BUCKET_EXPRESSIONS[dialect]
+
+    def test_unknown_dialect_uses_floor(self):
+        """Test unknown dialects fall back to FLOOR."""
+        conn = MagicMock()
+        conn.dialect.name = "mssql"
+
+        assert bucket_expression(conn) == DEFAULT_BUCKET_EXPRESSION
+
+    def test_sqlite_expression_floors_timestamps(self, sqlite_engine: Engine):
+        """Test SQLite integer division matches floor(ts / bucket)."""
+        with sqlite_engine.connect() as conn:
+            value = conn.execute(
+                text(f"SELECT {BUCKET_EXPRESSIONS['sqlite']} FROM (SELECT 7199.9 AS last_updated_ts)"),
+                {"bucket": 3600},
+            ).scalar()
+
+        assert value == 1
+
+
+class TestResolveMetadataIds:
+    """Test resolve_metadata_ids."""
+
+    def test_caches_found_and_missing_entities(self, sqlite_engine: Engine):
+        """Test lookups are cached, including entities without states_meta rows."""
+        _insert(sqlite_engine, {"sensor.a": 1}, {})
+        cache = HistogramCache()
+        with sqlite_engine.connect() as conn:
+            assert resolve_metadata_ids(conn, ["sensor.a", "sensor.none"], cache) == {1: "sensor.a"}
+
+        assert cache.get_metadata_ids(["sensor.a", "sensor.none"]) == {"sensor.a": (1,), "sensor.none": ()}
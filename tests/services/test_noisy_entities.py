@@ -0,0 +1,91 @@
+"""Tests for the noisy entity ranking."""
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from custom_components.statistics_orphan_finder.services.noisy_entities import (
+    PROJECTION_DAYS,
+    rank_noisy_entities,
+)
+from custom_components.statistics_orphan_finder.services.storage_constants import (
+    STATES_FIXED_ROW_BYTES,
+    STATES_INDEX_ROW_BYTES,
+)
+
+NOW = 1_700_000_000.0
+
+
+def _insert(engine: Engine, writes: dict[str, list[tuple[float, str]]]) -> None:
+    """Insert entities with (age in seconds, state) writes each."""
+    with engine.connect() as conn:
+        for metadata_id, (entity_id, rows) in enumerate(writes.items(), 1):
+            conn.execute(
+                text("INSERT INTO states_meta (metadata_id, entity_id) VALUES (:id, :entity_id)"),
+                {"id": metadata_id, "entity_id": entity_id},
+            )
+            for age, state in rows:
+                conn.execute(
+                    text("INSERT INTO states (metadata_id, state, last_updated_ts) VALUES (:id, :state, :ts)"),
+                    {"id": metadata_id, "state": state, "ts": NOW - age},
+                )
+        conn.commit()
+
+
+class TestRankNoisyEntities:
+    """Test rank_noisy_entities."""
+
+    def test_top_k_by_writes(self, sqlite_engine: Engine):
+        """Test only the limit busiest entities are returned, busiest first."""
+        _insert(sqlite_engine, {
+            "sensor.quiet": [(60, "1")],
+            "sensor.busy": [((i + 1) * 10, "1") for i in range(6)],
+            "sensor.medium": [((i + 1) * 10, "1") for i in range(3)],
+        })
+
+        result = rank_noisy_entities(sqlite_engine, "1h", 2, "writes", now=NOW)
+
+        assert [e["entity_id"] for e in result["entities"]] == ["sensor.busy", "sensor.medium"]
+        assert result["total_writes"] == 10
+        assert result["active_entities"] == 3
+        assert result["entities"][0]["share_of_writes"] == 0.6
+        assert result["entities"][0]["writes_per_hour"] == 6
+
+    def test_rank_by_bytes_uses_state_length(self, sqlite_engine: Engine):
+        """Test long states outrank frequent short ones when ranking by bytes."""
+        long_state = "x" * 2000
+        _insert(sqlite_engine, {
+            "sensor.chatty": [((i + 1) * 10, "1") for i in range(5)],
+            "sensor.bulky": [(60, long_state)],
+        })
+
+        result = rank_noisy_entities(sqlite_engine, "1h", 1, "bytes", now=NOW)
+
+        bulky = result["entities"][0]
+        assert bulky["entity_id"] == "sensor.bulky"
+        assert bulky["bytes"] == 2000 + STATES_FIXED_ROW_BYTES + STATES_INDEX_ROW_BYTES
+        assert bulky["bytes_per_day"] == bulky["bytes"] * 24
+        assert bulky["projected_bytes"] == bulky["bytes_per_day"] * PROJECTION_DAYS
+
+    def test_window_excludes_older_writes(self, sqlite_engine: Engine):
+        """Test writes before the window are not counted."""
+        _insert(sqlite_engine, {"sensor.a": [(60, "1"), (7200, "1"), (2 * 86400, "1")]})
+
+        assert rank_noisy_entities(sqlite_engine, "1h", 5, now=NOW)["total_writes"] == 1
+        assert rank_noisy_entities(sqlite_engine, "24h", 5, now=NOW)["total_writes"] == 2
+        assert rank_noisy_entities(sqlite_engine, "7d", 5, now=NOW)["total_writes"] == 3
+
+    def test_empty_window(self, sqlite_engine: Engine):
+        """Test an idle window returns no entities."""
+        result = rank_noisy_entities(sqlite_engine, "1h", 5, now=NOW)
+
+        assert result["entities"] == []
+        assert result["total_writes"] == 0
+
+    @pytest.mark.parametrize(
+        ("window", "limit", "rank_by"),
+        [("2h", 5, "writes"), ("1h", 0, "writes"), ("1h", 201, "writes"), ("1h", 5, "rows")],
+    )
+    def test_invalid_parameters(self, sqlite_engine: Engine, window, limit, rank_by):
+        """Test unsupported parameters raise ValueError."""
+        with pytest.raises(ValueError):
+            rank_noisy_entities(sqlite_engine, window, limit, rank_by, now=NOW)
@@ -0,0 +1,251 @@
+"""Tests for OverviewSnapshot and incremental repository scans."""
+from unittest.mock import patch
+
+from sqlalchemy import text
+
+from custom_components.statistics_orphan_finder.services.entity_repository import (
+    EntityRepository,
+)
+from custom_components.statistics_orphan_finder.services.overview_snapshot import (
+    RECOUNT_WINDOW,
+    OverviewSnapshot,
+    SCAN_MODE_CACHED,
+    SCAN_MODE_FULL,
+    SCAN_MODE_INCREMENTAL,
+)
+
+
+def _count_statements(engine):
+    """Attach a listener collecting executed statements."""
+    from sqlalchemy import event
+
+    statements = []
+
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    return statements
+
+
+class TestOverviewSnapshot:
+    """Test OverviewSnapshot planning, merging and serialization."""
+
+    def test_plan_full_without_previous_data(self):
+        """Test first refresh of a table is a full scan."""
+        snapshot = OverviewSnapshot("db")
+
+        assert snapshot.plan("states", 1, 100) == (SCAN_MODE_FULL, None)
+
+    def test_plan_incremental_and_cached(self):
+        """Test plan returns incremental when max id grows, cached when unchanged."""
+        snapshot = OverviewSnapshot("db")
+        snapshot.apply("states", SCAN_MODE_FULL, {1: (10, 100.0)}, 1, 100)
+
+        assert snapshot.plan("states", 1, 150) == (SCAN_MODE_INCREMENTAL, 100)
+        assert snapshot.plan("states", 1, 100) == (SCAN_MODE_CACHED, 100)
+
+    def test_plan_detects_purge(self):
+        """Test min id moving forward triggers a full correction pass."""
+        snapshot = OverviewSnapshot("db")
+        snapshot.apply("states", SCAN_MODE_FULL, {1: (10, 100.0)}, 1, 100)
+
+        assert snapshot.plan("states", 50, 150) == (SCAN_MODE_FULL, None)
+        assert snapshot.plan("states", 1, 90) == (SCAN_MODE_FULL, None)
+
+    def test_plan_detects_mid_range_deletes_from_estimate(self):
+        """Test an engine estimate well below the snapshot total triggers a correction pass."""
+        snapshot = OverviewSnapshot("db")
+        snapshot.apply("states", SCAN_MODE_FULL, {1: (600, 100.0), 2: (400, 90.0)}, 1, 1000)
+
+        assert snapshot.plan("states", 1, 1000, estimated_rows=900) == (SCAN_MODE_CACHED, 1000)
+        assert snapshot.plan("states", 1, 1000, estimated_rows=500) == (SCAN_MODE_FULL, None)
+
+    def test_plan_checks_each_estimate_once(self):
+        """Test a stale estimate that was already acted on does not force repeated full scans."""
+        snapshot = OverviewSnapshot("db")
+        snapshot.apply("states", SCAN_MODE_FULL, {1: (1000, 100.0)}, 1, 1000, estimated_rows=300)
+
+        assert snapshot.plan("states", 1, 1000, estimated_rows=300) == (SCAN_MODE_CACHED, 1000)
+
+    def test_invalidate_marks_recount_until_window_ends(self):
+        """Test invalidated metadata_ids stay pending for RECOUNT_WINDOW seconds."""
+        snapshot = OverviewSnapshot("db")
+        with patch("custom_components.statistics_orphan_finder.services.overview_snapshot.time.time", return_value=1000.0):
+            snapshot.invalidate("states", [1, 2])
+            assert sorted(snapshot.pending_recount("states")) == [1, 2]
+            assert snapshot.pending_recount("statistics") == []
+
+        with patch(
+            "custom_components.statistics_orphan_finder.services.overview_snapshot.time.time",
+            return_value=1000.0 + RECOUNT_WINDOW,
+        ):
+            assert snapshot.pending_recount("states") == []
+
+    def test_apply_recounted_replaces_and_drops(self):
+        """Test exact recounts override merged values and drop emptied ids."""
+        snapshot = OverviewSnapshot("db")
+        snapshot.apply("states", SCAN_MODE_FULL, {1: (10, 100.0), 2: (5, 50.0)}, 1, 100)
+
+        merged = snapshot.apply(
+            "states", SCAN_MODE_INCREMENTAL, {1: (2, 200.0)}, 1, 120,
+            recounted={1: (4, 200.0), 2: (0, None)},
+        )
+
+        assert merged == {1: (4, 200.0)}
+
+    def test_apply_merges_delta(self):
+        """Test incremental apply adds counts and keeps latest timestamp."""
+        snapshot = OverviewSnapshot("db")
+        snapshot.apply("states", SCAN_MODE_FULL, {1: (10, 100.0), 2: (5, 50.0)}, 1, 100)
+
+        merged = snapshot.apply(
+            "states", SCAN_MODE_INCREMENTAL, {1: (3, 200.0), 3: (1, 300.0)}, 1, 120
+        )
+
+        assert merged == {1: (13, 200.0), 2: (5, 50.0), 3: (1, 300.0)}
+
+    def test_round_trip_serialization(self):
+        """Test as_dict output loads back into an equivalent snapshot."""
+        snapshot = OverviewSnapshot("db")
+        snapshot.apply("statistics", SCAN_MODE_FULL, {7: (4, 12.5)}, 3, 40, estimated_rows=4)
+        snapshot.invalidate("statistics", [7])
+
+        restored = OverviewSnapshot("db", snapshot.as_dict())
+
+        assert restored.plan("statistics", 3, 40) == (SCAN_MODE_CACHED, 40)
+        assert restored.pending_recount("statistics") == [7]
+        assert restored.as_dict() == snapshot.as_dict()
+
+    def test_load_keeps_marks_set_before_load(self):
+        """Test recount marks set before the persisted snapshot loads survive the load."""
+        persisted = OverviewSnapshot("db")
+        persisted.apply("states", SCAN_MODE_FULL, {1: (10, 100.0), 2: (5, 50.0)}, 1, 100)
+        with patch("custom_components.statistics_orphan_finder.services.overview_snapshot.time.time", return_value=1000.0):
+            persisted.invalidate("states", [2])
+
+        snapshot = OverviewSnapshot("db")
+        with patch("custom_components.statistics_orphan_finder.services.overview_snapshot.time.time", return_value=5000.0):
+            snapshot.invalidate("states", [1, 2])
+        snapshot.load(persisted.as_dict())
+
+        assert snapshot.plan("states", 1, 100) == (SCAN_MODE_CACHED, 100)
+        # Marks from both sides, the later window end wins
+        assert snapshot.as_dict()["recount"]["states"] == {
+            "1": 5000.0 + RECOUNT_WINDOW, "2": 5000.0 + RECOUNT_WINDOW
+        }
+
+    def test_load_ignores_other_database(self):
+        """Test snapshot data from a different database is discarded."""
+        snapshot = OverviewSnapshot("db")
+        snapshot.apply("states", SCAN_MODE_FULL, {1: (10, 100.0)}, 1, 100)
+
+        other = OverviewSnapshot("other-db", snapshot.as_dict())
+
+        assert other.plan("states", 1, 100) == (SCAN_MODE_FULL, None)
+
+
+class TestIncrementalRepositoryScans:
+    """Test EntityRepository incremental scans driven by a snapshot."""
+
+    def test_states_incremental_matches_full_scan(self, populated_sqlite_engine):
+        """Test merged incremental results equal a fresh full scan."""
+        snapshot = OverviewSnapshot("db")
+        EntityRepository.fetch_states_with_counts(populated_sqlite_engine, snapshot=snapshot)
+
+        with populated_sqlite_engine.connect() as conn:
+            conn.execute(text("""
+                INSERT INTO states (metadata_id, state, last_updated_ts)
+                VALUES (1, '22.0', strftime('%s', 'now')), (4, 'on', strftime('%s', 'now'))
+            """))
+            conn.commit()
+
+        incremental = EntityRepository.fetch_states_with_counts(populated_sqlite_engine, snapshot=snapshot)
+        full = EntityRepository.fetch_states_with_counts(populated_sqlite_engine)
+
+        assert incremental == full
+        assert incremental[0]["sensor.temperature"]["count"] == 3
+        assert incremental[0]["switch.test_switch"]["count"] == 1
+
+    def test_states_incremental_only_scans_new_rows(self, populated_sqlite_engine):
+        """Test incremental refresh bounds the aggregation by the watermark."""
+        snapshot = OverviewSnapshot("db")
+        EntityRepository.fetch_states_with_counts(populated_sqlite_engine, snapshot=snapshot)
+
+        statements = _count_statements(populated_sqlite_engine)
+        EntityRepository.fetch_states_with_counts(populated_sqlite_engine, snapshot=snapshot)
+
+        aggregations = [s for s in statements if "COUNT(*) as count," in s]
+        assert aggregations == []
+
+    def test_states_purge_triggers_correction(self, populated_sqlite_engine):
+        """Test deleting the oldest rows triggers a full recount."""
+        snapshot = OverviewSnapshot("db")
+        EntityRepository.fetch_states_with_counts(populated_sqlite_engine, snapshot=snapshot)
+
+        with populated_sqlite_engine.connect() as conn:
+            conn.execute(text("DELETE FROM states WHERE state_id = 1"))
+            conn.commit()
+
+        states_data, _ = EntityRepository.fetch_states_with_counts(
+            populated_sqlite_engine, snapshot=snapshot
+        )
+
+        assert states_data["sensor.temperature"]["count"] == 1
+
+    def test_states_mid_range_delete_detected_by_estimate(self, populated_sqlite_engine):
+        """Test deletes that keep the id bounds are corrected once the estimate drops."""
+        snapshot = OverviewSnapshot("db")
+        EntityRepository.fetch_states_with_counts(populated_sqlite_engine, snapshot=snapshot)
+
+        with populated_sqlite_engine.connect() as conn:
+            conn.execute(text("DELETE FROM states WHERE state_id IN (2, 3)"))
+            conn.execute(text("ANALYZE"))
+            conn.commit()
+
+        states_data, _ = EntityRepository.fetch_states_with_counts(
+            populated_sqlite_engine, snapshot=snapshot
+        )
+
+        assert states_data["sensor.temperature"]["count"] == 1
+        assert "sensor.humidity" not in states_data
+
+    def test_invalidated_ids_are_recounted(self, populated_sqlite_engine):
+        """Test metadata_ids marked by delete SQL generation are recounted exactly."""
+        snapshot = OverviewSnapshot("db")
+        EntityRepository.fetch_states_with_counts(populated_sqlite_engine, snapshot=snapshot)
+        EntityRepository.fetch_statistics_long_term(populated_sqlite_engine, snapshot=snapshot)
+        snapshot.invalidate("states", [1])
+        snapshot.invalidate("statistics", [1])
+
+        with populated_sqlite_engine.connect() as conn:
+            conn.execute(text("DELETE FROM states WHERE state_id = 2"))
+            conn.execute(text("DELETE FROM statistics WHERE metadata_id = 1"))
+            conn.commit()
+
+        states_data, _ = EntityRepository.fetch_states_with_counts(
+            populated_sqlite_engine, snapshot=snapshot
+        )
+
+        assert states_data["sensor.temperature"]["count"] == 1
+        assert EntityRepository.fetch_statistics_long_term(
+            populated_sqlite_engine, snapshot=snapshot
+        ) == EntityRepository.fetch_statistics_long_term(populated_sqlite_engine)
+
+    def test_statistics_incremental_matches_full_scan(self, populated_sqlite_engine):
+        """Test statistics incremental scans merge new rows correctly."""
+        snapshot = OverviewSnapshot("db")
+        EntityRepository.fetch_statistics_long_term(populated_sqlite_engine, snapshot=snapshot)
+        EntityRepository.fetch_statistics_short_term(populated_sqlite_engine, snapshot=snapshot)
+
+        with populated_sqlite_engine.connect() as conn:
+            conn.execute(text("INSERT INTO statistics (metadata_id, start_ts, mean) VALUES (3, 1.0, 1.0)"))
+            conn.execute(text("INSERT INTO statistics_short_term (metadata_id, start_ts, mean) VALUES (1, 2.0, 1.0)"))
+            conn.commit()
+
+        assert EntityRepository.fetch_statistics_long_term(
+            populated_sqlite_engine, snapshot=snapshot
+        ) == EntityRepository.fetch_statistics_long_term(populated_sqlite_engine)
+        assert EntityRepository.fetch_statistics_short_term(
+            populated_sqlite_engine, snapshot=snapshot
+        ) == EntityRepository.fetch_statistics_short_term(populated_sqlite_engine)
@@ -17,26 +17,6 @@ class TestRegistryAdapter:
         adapter = RegistryAdapter(mock_hass)
         assert adapter.hass == mock_hass
 
-    def test_get_entity_state_returns_state(self, mock_hass):
-        """Test _get_entity_state returns state from hass."""
-        mock_state = Mock()
-        mock_hass.states.get.return_value = mock_state
-
-        adapter = RegistryAdapter(mock_hass)
-        result = adapter._get_entity_state("sensor.test")
-
-        mock_hass.states.get.assert_called_once_with("sensor.test")
-        assert result == mock_state
-
-    def test_get_entity_state_returns_none_when_not_found(self, mock_hass):
-        """Test _get_entity_state returns None for missing entity."""
-        mock_hass.states.get.return_value = None
-
-        adapter = RegistryAdapter(mock_hass)
-        result = adapter._get_entity_state("sensor.missing")
-
-        assert result is None
-
     def test_determine_registry_status_enabled(self):
         """Test _determine_registry_status returns Enabled for active entities."""
         adapter = RegistryAdapter(Mock())
@@ -91,87 +71,61 @@ class TestRegistryAdapter:
         result = adapter._determine_state_status(None)
         assert result == "Not Present"
 
-    def test_get_device_info_with_device(self):
-        """Test _get_device_info returns device name and status."""
+    def test_get_device_entry_with_device(self):
+        """Test _get_device_entry returns the indexed device."""
         adapter = RegistryAdapter(Mock())
-        device_registry = Mock()
         device_entry = Mock()
         device_entry.name = "Test Device"
-        device_entry.disabled = True
-        device_registry.async_get.return_value = device_entry
 
         registry_entry = Mock(device_id="device_123")
 
-        name, disabled = adapter._get_device_info(registry_entry, device_registry)
+        result = adapter._get_device_entry(registry_entry, {"device_123": device_entry})
 
-        assert name == "Test Device"
-        assert disabled is True
-        device_registry.async_get.assert_called_once_with("device_123")
+        assert result is device_entry
 
-    def test_get_device_info_without_device(self):
-        """Test _get_device_info returns None when no device."""
+    def test_get_device_entry_without_device(self):
+        """Test _get_device_entry returns None when no device."""
         adapter = RegistryAdapter(Mock())
-        device_registry = Mock()
 
         registry_entry = Mock(device_id=None)
 
-        name, disabled = adapter._get_device_info(registry_entry, device_registry)
-
-        assert name is None
-        assert disabled is False
+        assert adapter._get_device_entry(registry_entry, {}) is None
+        assert adapter._get_device_entry(None, {}) is None
 
-    def test_get_device_info_device_not_found(self):
-        """Test _get_device_info handles missing device gracefully."""
+    def test_get_device_entry_device_not_found(self):
+        """Test _get_device_entry handles missing device gracefully."""
         adapter = RegistryAdapter(Mock())
-        device_registry = Mock()
-        device_registry.async_get.return_value = None
 
         registry_entry = Mock(device_id="missing_device")
 
-        name, disabled = adapter._get_device_info(registry_entry, device_registry)
+        assert adapter._get_device_entry(registry_entry, {}) is None
 
-        assert name is None
-        assert disabled is False
-
-    def test_get_config_entry_info_with_entry(self):
-        """Test _get_config_entry_info returns entry state and title."""
+    def test_get_config_entry_with_entry(self):
+        """Test _get_config_entry returns the indexed config entry."""
         adapter = RegistryAdapter(Mock())
         config_entry = Mock()
-        config_entry.state = Mock()
-        config_entry.state.name = "LOADED"
         config_entry.title = "Test Integration"
         config_entries_map = {"entry_123": config_entry}
 
         registry_entry = Mock(config_entry_id="entry_123")
 
-        state, title = adapter._get_config_entry_info(registry_entry, config_entries_map)
-
-        assert state == "LOADED"
-        assert title == "Test Integration"
+        assert adapter._get_config_entry(registry_entry, config_entries_map) is config_entry
 
-    def test_get_config_entry_info_without_entry(self):
-        """Test _get_config_entry_info returns None when no config entry."""
+    def test_get_config_entry_without_entry(self):
+        """Test _get_config_entry returns None when no config entry."""
         adapter = RegistryAdapter(Mock())
-        config_entries_map = {}
 
         registry_entry = Mock(config_entry_id=None)
 
-        state, title = adapter._get_config_entry_info(registry_entry, config_entries_map)
-
-        assert state is None
-        assert title is None
+        assert adapter._get_config_entry(registry_entry, {}) is None
 
-    def test_get_config_entry_info_entry_not_found(self):
-        """Test _get_config_entry_info handles missing entry gracefully."""
+    def test_get_config_entry_entry_not_found(self):
+        """Test _get_config_entry handles missing entry gracefully."""
         adapter = RegistryAdapter(Mock())
-        config_entries_map = {}
 
         registry_entry = Mock(config_entry_id="missing_entry")
 
-        state, title = adapter._get_config_entry_info(registry_entry, config_entries_map)
-
-        assert state is None
-        assert title is None
+        assert adapter._get_config_entry(registry_entry, {}) is None
 
     def test_calculate_unavailable_duration_unavailable(self):
         """Test _calculate_unavailable_duration for unavailable entity."""
@@ -318,10 +272,11 @@ class TestRegistryAdapter:
              patch('custom_components.statistics_orphan_finder.services.registry_adapter.dr') as mock_dr:
             # Setup registry mocks
             mock_entity_registry = Mock()
-            mock_entity_registry.async_get.return_value = None
+            mock_entity_registry.entities = {}
             mock_er.async_get.return_value = mock_entity_registry
 
             mock_device_registry = Mock()
+            mock_device_registry.devices = {}
             mock_dr.async_get.return_value = mock_device_registry
 
             adapter = RegistryAdapter(mock_hass)
@@ -355,9 +310,11 @@ class TestRegistryAdapter:
         with patch('custom_components.statistics_orphan_finder.services.registry_adapter.er') as mock_er, \
              patch('custom_components.statistics_orphan_finder.services.registry_adapter.dr') as mock_dr:
             mock_entity_registry = Mock()
+            mock_entity_registry.entities = {}
             mock_er.async_get.return_value = mock_entity_registry
 
             mock_device_registry = Mock()
+            mock_device_registry.devices = {}
             mock_dr.async_get.return_value = mock_device_registry
 
             adapter = RegistryAdapter(mock_hass)
@@ -366,3 +323,154 @@ class TestRegistryAdapter:
 
             assert isinstance(result, list)
             assert len(result) == 0
+
+
+class TestRegistrySnapshot:
+    """Test enrichment from prebuilt registry indexes."""
+
+    @staticmethod
+    def _info(**overrides):
+        info = {
+            'in_states_meta': True, 'in_states': True, 'in_statistics_meta': False,
+            'in_statistics_short_term': False, 'in_statistics_long_term': False,
+            'states_count': 1, 'stats_short_count': 0, 'stats_long_count': 0,
+            'last_state_update': None, 'last_stats_update': None,
+        }
+        info.update(overrides)
+        return info
+
+    def test_build_snapshot_indexes_registries_and_states(self, mock_hass):
+        """Test the snapshot holds dict indexes of every source."""
+        entry = Mock(entity_id="sensor.a")
+        device = Mock()
+        state = Mock(entity_id="sensor.a")
+        config_entry = Mock(entry_id="entry_1")
+        mock_hass.states.async_all.return_value = [state]
+        mock_hass.config_entries.async_entries.return_value = [config_entry]
+
+        with patch('custom_components.statistics_orphan_finder.services.registry_adapter.er') as mock_er, \
+             patch('custom_components.statistics_orphan_finder.services.registry_adapter.dr') as mock_dr:
+            mock_er.async_get.return_value = Mock(entities={"sensor.a": entry})
+            mock_dr.async_get.return_value = Mock(devices={"device_1": device})
+
+            snapshot = RegistryAdapter(mock_hass).build_snapshot()
+
+        assert snapshot.entries == {"sensor.a": entry}
+        assert snapshot.devices == {"device_1": device}
+        assert snapshot.config_entries == {"entry_1": config_entry}
+        assert snapshot.states == {"sensor.a": state}
+        assert snapshot.now.tzinfo is not None
+
+    async def test_async_build_snapshot_matches_build_snapshot(self, mock_hass):
+        """Test the loop snapshot holds the same indexes as the one-pass snapshot."""
+        entries = {f"sensor.s{i}": Mock(entity_id=f"sensor.s{i}") for i in range(5)}
+        devices = {"device_1": Mock()}
+        mock_hass.states.async_all.return_value = [Mock(entity_id=f"sensor.s{i}") for i in range(3)]
+        mock_hass.config_entries.async_entries.return_value = [Mock(entry_id="entry_1")]
+
+        with patch('custom_components.statistics_orphan_finder.services.registry_adapter.er') as mock_er, \
+             patch('custom_components.statistics_orphan_finder.services.registry_adapter.dr') as mock_dr:
+            mock_er.async_get.return_value = Mock(entities=entries)
+            mock_dr.async_get.return_value = Mock(devices=devices)
+            adapter = RegistryAdapter(mock_hass)
+
+            expected = adapter.build_snapshot()
+            snapshot = await adapter.async_build_snapshot()
+
+        assert snapshot.entries == expected.entries
+        assert snapshot.devices == expected.devices
+        assert snapshot.config_entries == expected.config_entries
+        assert snapshot.states == expected.states
+
+    async def test_async_build_snapshot_yields_to_loop(self, mock_hass):
+        """Test indexing yields every SNAPSHOT_YIELD_EVERY items once the time slice is used."""
+        module = 'custom_components.statistics_orphan_finder.services.registry_adapter'
+        entries = {f"sensor.s{i}": Mock() for i in range(10)}
+        mock_hass.states.async_all.return_value = []
+        mock_hass.config_entries.async_entries.return_value = []
+
+        with patch(f'{module}.er') as mock_er, patch(f'{module}.dr') as mock_dr, \
+             patch(f'{module}.SNAPSHOT_YIELD_EVERY', 3), patch(f'{module}.SNAPSHOT_TIME_SLICE', 0), \
+             patch(f'{module}.asyncio.sleep') as mock_sleep:
+            mock_er.async_get.return_value = Mock(entities=entries)
+            mock_dr.async_get.return_value = Mock(devices={})
+
+            snapshot = await RegistryAdapter(mock_hass).async_build_snapshot()
+
+        assert len(snapshot.entries) == 10
+        assert mock_sleep.await_count == 3
+        mock_sleep.assert_awaited_with(0)
+
+    async def test_async_build_snapshot_skips_entries_removed_while_yielded(self, mock_hass):
+        """Test an entity removed from the registry during a yield is left out."""
+        module = 'custom_components.statistics_orphan_finder.services.registry_adapter'
+        entries = {f"sensor.s{i}": Mock() for i in range(4)}
+        mock_hass.states.async_all.return_value = []
+        mock_hass.config_entries.async_entries.return_value = []
+
+        async def remove_entity(_delay):
+            entries.pop("sensor.s3", None)
+
+        with patch(f'{module}.er') as mock_er, patch(f'{module}.dr') as mock_dr, \
+             patch(f'{module}.SNAPSHOT_YIELD_EVERY', 2), patch(f'{module}.SNAPSHOT_TIME_SLICE', 0), \
+             patch(f'{module}.asyncio.sleep', side_effect=remove_entity):
+            mock_er.async_get.return_value = Mock(entities=entries)
+            mock_dr.async_get.return_value = Mock(devices={})
+
+            snapshot = await RegistryAdapter(mock_hass).async_build_snapshot()
+
+        assert set(snapshot.entries) == {"sensor.s0", "sensor.s1", "sensor.s2"}
+
+    def test_enrich_from_snapshot_shares_devices_and_entries(self, mock_hass):
+        """Test entities sharing a device and config entry resolve them from the index."""
+        from custom_components.statistics_orphan_finder.services.registry_adapter import (
+            RegistrySnapshot,
+        )
+
+        now = datetime.now(timezone.utc)
+        device = Mock(disabled=True)
+        device.name = "Hub"
+        config_entry = Mock(title="Hub integration")
+        config_entry.state.name = "SETUP_ERROR"
+        entries = {
+            f"sensor.hub_{i}": Mock(
+                disabled=False, disabled_by=None, platform="hub",
+                device_id="device_1", config_entry_id="entry_1",
+            )
+            for i in range(3)
+        }
+        entries["sensor.orphan"] = Mock(
+            disabled=False, disabled_by=None, platform="hub", device_id=None, config_entry_id="entry_1"
+        )
+        offline = Mock(state="unavailable", last_changed=now - timedelta(hours=3))
+        snapshot = RegistrySnapshot(
+            entries=entries,
+            devices={"device_1": device},
+            config_entries={"entry_1": config_entry},
+            states={"sensor.orphan": offline},
+            now=now,
+        )
+        entity_map = {entity_id: self._info() for entity_id in [*entries, "sensor.deleted"]}
+
+        result = {
+            e['entity_id']: e
+            for e in RegistryAdapter(mock_hass).enrich_entities(entity_map, snapshot)
+        }
+
+        hub = result["sensor.hub_0"]
+        assert hub['device_name'] == "Hub"
+        assert hub['device_disabled'] is True
+        assert hub['config_entry_state'] == "SETUP_ERROR"
+        assert hub['config_entry_title'] == "Hub integration"
+        assert hub['availability_reason'] == "Parent device 'Hub' is disabled"
+        orphan = result["sensor.orphan"]
+        assert orphan['availability_reason'] == "Integration failed to load (hub)"
+        assert orphan['unavailable_duration_seconds'] == 3 * 3600
+        deleted = result["sensor.deleted"]
+        assert deleted['in_entity_registry'] is False
+        assert deleted['availability_reason'] == (
+            "Entity has been deleted - no longer exists in Home Assistant"
+        )
+        # No registry or state machine calls: everything came from the snapshot
+        mock_hass.states.get.assert_not_called()
+        mock_hass.config_entries.async_get_entry.assert_not_called()
@@ -167,16 +167,18 @@ class TestSessionManager:
         assert manager.validate_session(session2) is False
         assert manager.validate_session(session3) is False
 
-    def test_create_session_cleans_up_stale(self):
-        """Test create_session automatically cleans up stale sessions."""
+    def test_create_session_leaves_cleanup_to_timer(self):
+        """Test create_session no longer cleans up; the periodic cleanup does."""
         manager = SessionManager()
 
         # Create initial session and make it stale
         old_session = manager.create_session()
         manager._sessions[old_session]['timestamp'] = time.time() - SESSION_TIMEOUT - 10
 
-        # Create new session (should trigger cleanup)
         new_session = manager.create_session()
+        assert manager.validate_session(old_session) is True
+
+        manager.cleanup_stale_sessions()
 
         # Verify old session was cleaned up
         assert manager.validate_session(old_session) is False
@@ -337,3 +339,188 @@ class TestSessionManager:
             assert access_order == ["start-1", "end-1", "start-2", "end-2"]
         else:
             assert access_order == ["start-2", "end-2", "start-1", "end-1"]
+
+
+class TestEntityRecord:
+    """Test the slotted per-entity session record."""
+
+    def test_mapping_interface(self):
+        """Test item access, get and containment on known and extra fields."""
+        from custom_components.statistics_orphan_finder.services.session_manager import (
+            ENTITY_FIELDS,
+            EntityRecord,
+        )
+
+        record = EntityRecord()
+        record['states_count'] = 5
+        record['custom_field'] = 'value'
+
+        assert record['states_count'] == 5
+        assert record.get('update_frequency') is None
+        assert record.get('missing', 'default') == 'default'
+        assert 'custom_field' in record
+        assert 'missing' not in record
+        with pytest.raises(KeyError):
+            record['missing']
+        assert record.as_dict() == {**ENTITY_FIELDS, 'states_count': 5, 'custom_field': 'value'}
+
+    def test_records_have_no_instance_dict(self):
+        """Test records are slotted so they carry no per-instance dict."""
+        from custom_components.statistics_orphan_finder.services.session_manager import (
+            EntityRecord,
+        )
+
+        assert not hasattr(EntityRecord(), '__dict__')
+
+    def test_entity_map_materializes_dicts(self):
+        """Test EntityMap creates records on access and serializes to dicts."""
+        manager = SessionManager()
+        session_id = manager.create_session()
+        entity_map = manager.get_session_data(session_id)['entity_map']
+
+        entity_map['sensor.a']['in_states'] = True
+
+        serialized = entity_map.as_dict()
+        assert list(serialized) == ['sensor.a']
+        assert type(serialized['sensor.a']) is dict
+        assert serialized['sensor.a']['in_states'] is True
+
+
+def _fill_session(manager: SessionManager, session_id: str, entity_count: int) -> None:
+    """Add entity_map entries to a session."""
+    entity_map = manager.get_session_data(session_id)['entity_map']
+    for i in range(entity_count):
+        entity_map[f"sensor.e{i}"]['states_count'] = i
+
+
+class TestSessionMemoryBudget:
+    """Test LRU eviction and spill-to-disk under a memory budget."""
+
+    def test_no_budget_keeps_everything(self):
+        """Test a zero budget never evicts."""
+        manager = SessionManager()
+        sessions = [manager.create_session() for _ in range(3)]
+        for session_id in sessions:
+            _fill_session(manager, session_id, 100)
+
+        assert manager.enforce_memory_budget() == 0
+        assert all(manager.validate_session(session_id) for session_id in sessions)
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest idle session is dropped first and the active one is kept."""
+        from custom_components.statistics_orphan_finder.services.session_manager import (
+            ENTITY_RECORD_BYTES,
+        )
+
+        manager = SessionManager(memory_budget=150 * ENTITY_RECORD_BYTES)
+        oldest, middle, active = (manager.create_session() for _ in range(3))
+        for offset, session_id in enumerate((oldest, middle, active)):
+            _fill_session(manager, session_id, 60)
+            manager._sessions[session_id]['timestamp'] = 1000.0 + offset
+
+        manager.update_timestamp(oldest)
+
+        # oldest was just used, so middle is now least recently used
+        assert manager.validate_session(middle) is False
+        assert manager.validate_session(oldest) is True
+        assert manager.validate_session(active) is True
+        assert manager.resident_bytes() <= 150 * ENTITY_RECORD_BYTES
+
+    async def test_locked_sessions_are_not_evicted(self):
+        """Test a session with a running step stays resident."""
+        from custom_components.statistics_orphan_finder.services.session_manager import (
+            ENTITY_RECORD_BYTES,
+        )
+
+        manager = SessionManager(memory_budget=ENTITY_RECORD_BYTES)
+        busy = manager.create_session()
+        _fill_session(manager, busy, 10)
+
+        async with manager.get_lock(busy):
+            assert manager.enforce_memory_budget() == 0
+        assert manager.validate_session(busy) is True
+
+    def test_spill_and_restore(self):
+        """Test evicted sessions are spilled to disk and loaded back on access."""
+        import os
+
+        from custom_components.statistics_orphan_finder.services.session_manager import (
+            ENTITY_RECORD_BYTES,
+        )
+
+        manager = SessionManager(memory_budget=50 * ENTITY_RECORD_BYTES, spill_to_disk=True)
+        idle = manager.create_session()
+        _fill_session(manager, idle, 40)
+        manager._sessions[idle]['timestamp'] = 1000.0
+        active = manager.create_session()
+        _fill_session(manager, active, 40)
+        manager.update_timestamp(active)
+
+        spill_path = manager._sessions[idle]['spill_path']
+        assert manager._sessions[idle]['data'] is None
+        assert os.path.exists(spill_path)
+        assert manager.validate_session(idle) is True
+
+        data = manager.get_session_data(idle)
+
+        assert data['entity_map']['sensor.e39']['states_count'] == 39
+        assert not os.path.exists(spill_path)
+        # Loading idle back pushed active (now least recently used) out
+        assert manager._sessions[active]['data'] is None
+
+        spill_dir = manager._spill_dir
+        manager.clear_all_sessions()
+        assert not os.path.exists(spill_dir)
+
+    def test_estimate_counts_every_pickled_field(self):
+        """Test overflow fields and a bound cached overview add to the estimate."""
+        from custom_components.statistics_orphan_finder.services.session_manager import (
+            ENRICHED_ENTITY_BYTES,
+            ENTITY_RECORD_BYTES,
+            OVERFLOW_FIELD_BYTES,
+        )
+
+        manager = SessionManager()
+        session_id = manager.create_session()
+        _fill_session(manager, session_id, 2)
+        data = manager.get_session_data(session_id)
+        data['entity_map']['sensor.e0']['custom'] = 1
+        data['cached_overview'] = ({'entities': [{}, {}, {}]}, 0.0)
+
+        assert manager.estimate_session_bytes(data) == (
+            2 * ENTITY_RECORD_BYTES + OVERFLOW_FIELD_BYTES + 3 * ENRICHED_ENTITY_BYTES
+        )
+
+    def test_default_budget_fits_two_large_sessions(self):
+        """Test the default budget holds two enriched 30,000-entity sessions."""
+        from custom_components.statistics_orphan_finder.const import DEFAULT_SESSION_MEMORY_BUDGET
+        from custom_components.statistics_orphan_finder.services.session_manager import (
+            ENRICHED_ENTITY_BYTES,
+            ENTITY_RECORD_BYTES,
+        )
+
+        large_session = 30000 * (ENTITY_RECORD_BYTES + ENRICHED_ENTITY_BYTES)
+
+        assert DEFAULT_SESSION_MEMORY_BUDGET * 1024 * 1024 >= 2 * large_session
+
+    def test_stale_cleanup_removes_spill_files(self):
+        """Test expiring a spilled session deletes its file."""
+        import os
+
+        from custom_components.statistics_orphan_finder.services.session_manager import (
+            ENTITY_RECORD_BYTES,
+        )
+
+        manager = SessionManager(memory_budget=ENTITY_RECORD_BYTES, spill_to_disk=True)
+        session_id = manager.create_session()
+        _fill_session(manager, session_id, 10)
+        manager.enforce_memory_budget()
+        spill_path = manager._sessions[session_id]['spill_path']
+        assert os.path.exists(spill_path)
+
+        manager._sessions[session_id]['timestamp'] = time.time() - SESSION_TIMEOUT - 10
+        manager.cleanup_stale_sessions()
+
+        assert manager.validate_session(session_id) is False
+        assert not os.path.exists(spill_path)
+        manager.clear_all_sessions()
@@ -0,0 +1,76 @@
+"""Tests for SingleFlight request coalescing."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from custom_components.statistics_orphan_finder.services.single_flight import SingleFlight
+
+
+
+
+class TestSingleFlight:
+    """Test SingleFlight."""
+
+    def test_concurrent_calls_share_one_run(self):
+        """Test callers arriving while a call runs get its result without running it."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            release.wait(5)
+            return {"rows": 42}
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            leader = pool.submit(flight.do, "key", slow)
+            while not calls:
+                pass
+            followers = [pool.submit(flight.do, "key", slow) for _ in range(2)]
+            while flight.shared_calls < 2:
+                pass
+            release.set()
+            results = [leader.result(5)] + [f.result(5) for f in followers]
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.shared_calls == 2
+
+    def test_error_is_raised_in_every_caller(self):
+        """Test an exception in the shared call reaches all waiting callers."""
+        flight = SingleFlight()
+        release = threading.Event()
+        started = threading.Event()
+
+        def failing():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("database gone")
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "key", failing)
+            started.wait(5)
+            follower = pool.submit(flight.do, "key", failing)
+            while flight.shared_calls < 1:
+                pass
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(RuntimeError, match="database gone"):
+                    future.result(5)
+
+    def test_sequential_calls_are_not_cached(self):
+        """Test a call after the previous one finished runs again."""
+        flight = SingleFlight()
+        counter = iter(range(10))
+
+        assert flight.do("key", lambda: next(counter)) == 0
+        assert flight.do("key", lambda: next(counter)) == 1
+        assert flight.shared_calls == 0
+
+    def test_different_keys_run_independently(self):
+        """Test calls with different keys do not wait for each other."""
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda x: x * 2, 2) == 4
+        assert flight.do("b", lambda x: x * 3, 2) == 6
@@ -965,3 +965,380 @@ class TestBatchStorageCalculation:
             assert entity_id in result
             # Values might be 0 if entities don't exist in test data
             assert isinstance(result[entity_id], int)
+
+
+class TestPreciseStatesAttribution:
+    """Test per-entity states bytes from real column lengths."""
+
+    @pytest.fixture
+    def attributes_engine(self, sqlite_engine: Engine) -> Engine:
+        """Engine with state_attributes shared between rows of two entities."""
+        from sqlalchemy import text
+
+        with sqlite_engine.connect() as conn:
+            conn.execute(text("ALTER TABLE states ADD COLUMN attributes_id INTEGER"))
+            conn.execute(text("""
+                CREATE TABLE state_attributes (
+                    attributes_id INTEGER PRIMARY KEY,
+                    hash BIGINT,
+                    shared_attrs TEXT
+                )
+            """))
+            conn.execute(text("""
+                INSERT INTO states_meta (metadata_id, entity_id)
+                VALUES (1, 'sensor.big'), (2, 'sensor.small')
+            """))
+            # 1000 bytes shared by all 20 rows of sensor.big, 10 bytes for sensor.small
+            conn.execute(text("INSERT INTO state_attributes VALUES (1, 1, :a)"), {"a": "x" * 1000})
+            conn.execute(text("INSERT INTO state_attributes VALUES (2, 2, :a)"), {"a": "y" * 10})
+            for state_id in range(1, 21):
+                conn.execute(
+                    text("INSERT INTO states (state_id, metadata_id, state, last_updated_ts, attributes_id) "
+                         "VALUES (:id, 1, :state, 1.0, 1)"),
+                    {"id": state_id, "state": "s" * 100},
+                )
+            for state_id in range(21, 24):
+                conn.execute(
+                    text("INSERT INTO states (state_id, metadata_id, state, last_updated_ts, attributes_id) "
+                         "VALUES (:id, 2, 'on', 1.0, 2)"),
+                    {"id": state_id},
+                )
+            conn.commit()
+        return sqlite_engine
+
+    def test_precise_counts_state_and_shared_attribute_bytes(
+        self, mock_config_entry: MagicMock, attributes_engine: Engine
+    ):
+        """Test unsampled attribution is exact."""
+        from custom_components.statistics_orphan_finder.services.storage_constants import (
+            STATES_FIXED_ROW_BYTES,
+            STATES_INDEX_ROW_BYTES,
+            STATES_META_ROW_SIZE,
+        )
+
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        calculator = StorageCalculator(mock_config_entry)
+        overhead = STATES_FIXED_ROW_BYTES + STATES_INDEX_ROW_BYTES
+
+        with attributes_engine.connect() as conn:
+            sizes = calculator._batch_calculate_states_size_precise(
+                conn, [{"entity_id": "sensor.big"}, {"entity_id": "sensor.small"}], sample_rows=None
+            )
+
+        # Attributes row is counted once per entity, not once per referencing row
+        assert sizes["sensor.big"] == 20 * (100 + overhead) + 1000 + STATES_META_ROW_SIZE
+        assert sizes["sensor.small"] == 3 * (2 + overhead) + 10 + STATES_META_ROW_SIZE
+
+    def test_sampled_estimate_scales_to_row_count(
+        self, mock_config_entry: MagicMock, attributes_engine: Engine
+    ):
+        """Test sampling reads fewer rows but scales to the full count."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        calculator = StorageCalculator(mock_config_entry)
+
+        with attributes_engine.connect() as conn:
+            exact = calculator._batch_calculate_states_size_precise(conn, [{"entity_id": "sensor.big"}], None)
+            sampled = calculator._batch_calculate_states_size_precise(conn, [{"entity_id": "sensor.big"}], 5)
+
+        assert sampled["sensor.big"] == exact["sensor.big"]
+
+    def test_entities_below_sample_size_are_measured_in_full(
+        self, mock_config_entry: MagicMock, attributes_engine: Engine
+    ):
+        """Test entities with fewer rows than the sample are read completely."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        calculator = StorageCalculator(mock_config_entry)
+
+        with attributes_engine.connect() as conn:
+            exact = calculator._batch_calculate_states_size_precise(conn, [{"entity_id": "sensor.small"}], None)
+            sampled = calculator._batch_calculate_states_size_precise(conn, [{"entity_id": "sensor.small"}], 50)
+
+        assert sampled == exact
+
+    def test_sample_reads_latest_rows_only(
+        self, mock_config_entry: MagicMock, attributes_engine: Engine
+    ):
+        """Test the sample is limited to the most recent rows of the entity."""
+        from sqlalchemy import text
+
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        calculator = StorageCalculator(mock_config_entry)
+
+        with attributes_engine.connect() as conn:
+            # Newer rows of sensor.big have short states
+            conn.execute(text("UPDATE states SET state = 'x', last_updated_ts = 2.0 WHERE state_id > 15"))
+            samples = calculator._sample_states_bytes(conn, [1, 2], 5)
+
+        assert samples[1]["rows"] == 5
+        assert samples[1]["state_bytes"] == 5
+        # Each entity is limited separately
+        assert samples[2]["rows"] == 3
+
+    def test_one_sample_query_for_many_entities(
+        self, mock_config_entry: MagicMock, attributes_engine: Engine
+    ):
+        """Test the query count does not grow with the number of entities."""
+        from sqlalchemy import event, text
+
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        calculator = StorageCalculator(mock_config_entry)
+        with attributes_engine.connect() as conn:
+            for metadata_id in range(3, 53):
+                conn.execute(
+                    text("INSERT INTO states_meta (metadata_id, entity_id) VALUES (:id, :entity_id)"),
+                    {"id": metadata_id, "entity_id": f"sensor.extra_{metadata_id}"},
+                )
+                conn.execute(
+                    text("INSERT INTO states (metadata_id, state, last_updated_ts, attributes_id) "
+                         "VALUES (:id, 'on', 1.0, 2)"),
+                    {"id": metadata_id},
+                )
+            conn.commit()
+
+        entities = [{"entity_id": "sensor.big"}, {"entity_id": "sensor.small"}] + [
+            {"entity_id": f"sensor.extra_{metadata_id}"} for metadata_id in range(3, 53)
+        ]
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with attributes_engine.connect() as conn:
+            event.listen(attributes_engine, "before_cursor_execute", before_execute)
+            try:
+                sizes = calculator._batch_calculate_states_size_precise(conn, entities, 5)
+            finally:
+                event.remove(attributes_engine, "before_cursor_execute", before_execute)
+
+        assert len(sizes) == 52
+        # states_meta lookup, row counts, one sample, attribute references
+        assert len(statements) == 4
+
+    def test_lengths_are_bytes_not_characters(
+        self, mock_config_entry: MagicMock, attributes_engine: Engine
+    ):
+        """Test multi-byte states and attributes are measured in stored bytes."""
+        from sqlalchemy import text
+
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        calculator = StorageCalculator(mock_config_entry)
+
+        with attributes_engine.connect() as conn:
+            conn.execute(text("UPDATE states SET state = :state WHERE metadata_id = 2"), {"state": "\u00e9t\u00e9"})
+            conn.execute(text("UPDATE state_attributes SET shared_attrs = :a WHERE attributes_id = 2"), {"a": "\u20ac" * 10})
+            samples = calculator._sample_states_bytes(conn, [2], None)
+
+        # "été" is 5 bytes in UTF-8, each euro sign 3 bytes
+        assert samples[2]["state_bytes"] == 3 * 5
+        assert samples[2]["attributes"] == {2: (3, 30)}
+
+    def test_sample_searches_metadata_id_index(
+        self, mock_config_entry: MagicMock, attributes_engine: Engine
+    ):
+        """Test the sample reads the sampled entities through the index, not a table scan."""
+        from sqlalchemy import event, text
+
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        calculator = StorageCalculator(mock_config_entry)
+        executed = []
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            executed.append((statement, parameters))
+
+        with attributes_engine.connect() as conn:
+            conn.execute(text(
+                "CREATE INDEX ix_states_metadata_id_last_updated_ts ON states (metadata_id, last_updated_ts)"
+            ))
+            event.listen(attributes_engine, "before_cursor_execute", before_execute)
+            try:
+                calculator._sample_states_bytes(conn, [1, 2], 5)
+            finally:
+                event.remove(attributes_engine, "before_cursor_execute", before_execute)
+
+            sql, params = executed[0]
+            plan = " / ".join(
+                row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, params)
+            )
+
+        assert "SEARCH states USING INDEX ix_states_metadata_id_last_updated_ts (metadata_id=?)" in plan
+        assert "SCAN states" not in plan
+
+    def test_batch_storage_precise_flag(
+        self, mock_config_entry: MagicMock, attributes_engine: Engine
+    ):
+        """Test calculate_batch_storage uses precise attribution when asked."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        calculator = StorageCalculator(mock_config_entry)
+        entities = [{"entity_id": "sensor.big", "origin": "States", "in_states_meta": True}]
+
+        estimated = calculator.calculate_batch_storage(attributes_engine, entities)
+        precise = calculator.calculate_batch_storage(attributes_engine, entities, precise=True)
+
+        # Long states and a 1 KB attributes blob exceed the default row size estimate
+        assert precise["sensor.big"] > estimated["sensor.big"]
+        assert calculator.calculate_entity_storage(
+            attributes_engine, "sensor.big", "States", in_states_meta=True, precise=True
+        ) > 0
+
+
+class TestTableStatsCache:
+    """Test the shared table-level average row size cache."""
+
+    @staticmethod
+    def _catalog_connection(rows: list[tuple]) -> MagicMock:
+        conn = MagicMock()
+        conn.execute.return_value.fetchall.return_value = rows
+        return conn
+
+    def test_single_query_serves_all_tables(self, mock_config_entry: MagicMock):
+        """Test one catalog query fills sizes for every table and is reused."""
+        calculator = StorageCalculator(mock_config_entry)
+        conn = self._catalog_connection([("states", 310), ("statistics", 90), ("statistics_short_term", 70)])
+
+        first = calculator._get_avg_row_sizes(conn, False, True, False)
+        second = calculator._get_avg_row_sizes(conn, False, True, False)
+
+        assert first == {"states": 310, "statistics": 90, "statistics_short_term": 70}
+        assert second is first
+        assert conn.execute.call_count == 1
+
+    def test_postgres_uses_reltuples_not_count(self, mock_config_entry: MagicMock):
+        """Test PostgreSQL row sizes come from pg_class without scanning tables."""
+        calculator = StorageCalculator(mock_config_entry)
+        conn = self._catalog_connection([("states", 250)])
+
+        sizes = calculator._get_avg_row_sizes(conn, False, False, True)
+
+        query = str(conn.execute.call_args.args[0])
+        assert "reltuples" in query
+        assert "COUNT(*)" not in query
+        assert "pg_table_is_visible" in query
+        assert "'public'" not in query
+        assert sizes["states"] == 250
+        # Tables without statistics keep the default
+        assert sizes["statistics"] == 100
+
+    def test_cache_expires_after_ttl(self, mock_config_entry: MagicMock):
+        """Test sizes are re-read once the TTL has passed."""
+        from custom_components.statistics_orphan_finder.services.storage_constants import TABLE_STATS_TTL
+
+        calculator = StorageCalculator(mock_config_entry)
+        conn = self._catalog_connection([("states", 310)])
+        calculator._get_avg_row_sizes(conn, False, True, False)
+
+        fetched_at, sizes = calculator._table_stats
+        calculator._table_stats = (fetched_at - TABLE_STATS_TTL - 1, sizes)
+        calculator._get_avg_row_sizes(conn, False, True, False)
+
+        assert conn.execute.call_count == 2
+
+    def test_failed_refresh_is_not_cached(self, mock_config_entry: MagicMock):
+        """Test a failing catalog query falls back to defaults and retries next time."""
+        calculator = StorageCalculator(mock_config_entry)
+        conn = MagicMock()
+        conn.execute.side_effect = Exception("permission denied")
+
+        sizes = calculator._get_avg_row_sizes(conn, False, True, False)
+
+        assert sizes["states"] == 150
+        assert calculator._table_stats is None
+
+    def test_batch_storage_reuses_cached_sizes(
+        self, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test repeated batch calculations do not refresh table statistics."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        calculator = StorageCalculator(mock_config_entry)
+        entities = [{"entity_id": "sensor.temperature", "origin": "States", "in_states_meta": True}]
+
+        calculator.calculate_batch_storage(populated_sqlite_engine, entities)
+        cached = calculator._table_stats
+        calculator.calculate_batch_storage(populated_sqlite_engine, entities)
+
+        assert cached is not None
+        assert calculator._table_stats is cached
+
+
+class TestStorageFromCounts:
+    """Test storage estimation from counts already in the entity map."""
+
+    def test_matches_batch_storage(
+        self, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test estimates from counts equal the query-based batch calculation."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        calculator = StorageCalculator(mock_config_entry)
+        entities = [
+            {"entity_id": "sensor.temperature", "origin": "States+Statistics",
+             "in_states_meta": True, "in_statistics_meta": True,
+             "states_count": 2, "stats_short_count": 1, "stats_long_count": 2},
+            {"entity_id": "sensor.deleted_entity", "origin": "States",
+             "in_states_meta": True, "in_statistics_meta": False,
+             "states_count": 1, "stats_short_count": 0, "stats_long_count": 0},
+            {"entity_id": "sensor.deleted_stats", "origin": "Short-term",
+             "in_states_meta": False, "in_statistics_meta": True,
+             "states_count": 0, "stats_short_count": 1, "stats_long_count": 0},
+        ]
+
+        expected = calculator.calculate_batch_storage(populated_sqlite_engine, entities)
+        engine = MagicMock()
+        result = calculator.calculate_storage_from_counts(engine, entities)
+
+        assert result == expected
+        # SQLite has no table statistics to refresh, so no connection is opened
+        engine.connect.assert_not_called()
+
+    def test_remote_database_only_reads_catalog(self, mock_config_entry: MagicMock):
+        """Test MySQL/PostgreSQL only refresh cached row sizes, never count rows."""
+        mock_config_entry.data["db_url"] = "postgresql://localhost/homeassistant"
+        calculator = StorageCalculator(mock_config_entry)
+        conn = MagicMock()
+        conn.execute.return_value.fetchall.return_value = [("states", 200), ("statistics", 80)]
+        engine = MagicMock()
+        engine.connect.return_value.__enter__.return_value = conn
+        entities = [{"entity_id": "sensor.a", "origin": "States", "in_states_meta": True,
+                     "in_statistics_meta": False, "states_count": 10}]
+
+        first = calculator.calculate_storage_from_counts(engine, entities)
+        second = calculator.calculate_storage_from_counts(engine, entities)
+
+        assert first == second == {"sensor.a": 10 * 200 + 100}
+        assert conn.execute.call_count == 1
+        assert "COUNT(*)" not in str(conn.execute.call_args.args[0])
+
+    def test_empty_entities(self, mock_config_entry: MagicMock):
+        """Test an empty list needs no work."""
+        assert StorageCalculator(mock_config_entry).calculate_storage_from_counts(MagicMock(), []) == {}
+
+    def test_breakdown_by_table(self, mock_config_entry: MagicMock):
+        """Test the per-table split and where the metadata rows are counted."""
+        from custom_components.statistics_orphan_finder.services.storage_calculator import (
+            DEFAULT_ROW_SIZES,
+            STATES_META_ROW_SIZE,
+            STATISTICS_META_ROW_SIZE,
+        )
+
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        calculator = StorageCalculator(mock_config_entry)
+        states_row = DEFAULT_ROW_SIZES["states"]
+        stats_row = DEFAULT_ROW_SIZES["statistics"]
+        entities = [
+            # Active entity: no origin, every table with rows is included
+            {"entity_id": "sensor.active", "in_states_meta": True, "in_statistics_meta": True,
+             "states_count": 10, "stats_short_count": 3, "stats_long_count": 2},
+            {"entity_id": "sensor.short_only", "origin": "Short-term", "in_states_meta": False,
+             "in_statistics_meta": True, "stats_short_count": 4},
+            {"entity_id": "sensor.no_rows", "in_states_meta": False, "in_statistics_meta": False},
+        ]
+
+        breakdown = calculator.calculate_breakdown_from_counts(MagicMock(), entities)
+
+        assert breakdown["sensor.active"] == (
+            10 * states_row + STATES_META_ROW_SIZE,
+            3 * stats_row,
+            2 * stats_row + STATISTICS_META_ROW_SIZE,
+        )
+        assert breakdown["sensor.short_only"] == (0, 4 * stats_row + STATISTICS_META_ROW_SIZE, 0)
+        assert breakdown["sensor.no_rows"] == (0, 0, 0)
+        totals = calculator.calculate_storage_from_counts(MagicMock(), entities)
+        assert totals == {entity_id: sum(parts) for entity_id, parts in breakdown.items()}
@@ -9,6 +9,7 @@ from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.statistics_orphan_finder.config_flow import (
     StatisticsOrphanFinderConfigFlow,
+    StatisticsOrphanFinderOptionsFlow,
     validate_db_connection,
 )
 from custom_components.statistics_orphan_finder.const import (
@@ -16,6 +17,8 @@ from custom_components.statistics_orphan_finder.const import (
     CONF_DB_URL,
     CONF_USERNAME,
     CONF_PASSWORD,
+    CONF_OVERVIEW_CACHE_TTL,
+    DEFAULT_OVERVIEW_CACHE_TTL,
 )
 
 
@@ -204,3 +207,37 @@ class TestConfigFlow:
 
             assert result["type"] == FlowResultType.FORM
             assert result["errors"] == {"base": "unknown"}
+
+
+class TestOptionsFlow:
+    """Test StatisticsOrphanFinderOptionsFlow."""
+
+    def test_config_flow_returns_options_flow(self, mock_config_entry: MagicMock):
+        """Test config flow exposes the options flow."""
+        flow = StatisticsOrphanFinderConfigFlow.async_get_options_flow(mock_config_entry)
+
+        assert isinstance(flow, StatisticsOrphanFinderOptionsFlow)
+
+    @pytest.mark.asyncio
+    async def test_options_form_uses_defaults(self, mock_hass: MagicMock, mock_config_entry: MagicMock):
+        """Test options form shows the default cache TTL."""
+        flow = StatisticsOrphanFinderOptionsFlow(mock_config_entry)
+        flow.hass = mock_hass
+
+        result = await flow.async_step_init(user_input=None)
+
+        assert result["type"] == FlowResultType.FORM
+        assert result["step_id"] == "init"
+        defaults = {str(key): key.default() for key in result["data_schema"].schema}
+        assert defaults[CONF_OVERVIEW_CACHE_TTL] == DEFAULT_OVERVIEW_CACHE_TTL
+
+    @pytest.mark.asyncio
+    async def test_options_saved(self, mock_hass: MagicMock, mock_config_entry: MagicMock):
+        """Test submitted options create an entry."""
+        flow = StatisticsOrphanFinderOptionsFlow(mock_config_entry)
+        flow.hass = mock_hass
+
+        result = await flow.async_step_init(user_input={CONF_OVERVIEW_CACHE_TTL: 60})
+
+        assert result["type"] == FlowResultType.CREATE_ENTRY
+        assert result["data"] == {CONF_OVERVIEW_CACHE_TTL: 60}
@@ -1,6 +1,8 @@
 """Tests for StatisticsOrphanCoordinator."""
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -281,6 +283,23 @@ class TestCoordinatorStepProcessing:
             # Verify it used async_add_executor_job
             mock_hass.async_add_executor_job.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_async_execute_step_6_snapshots_registry_on_loop(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test step 6 takes the registry snapshot before handing off to the executor."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        snapshot = MagicMock()
+        coordinator.registry_adapter.async_build_snapshot = AsyncMock(return_value=snapshot)
+
+        with patch.object(coordinator, "_execute_overview_step") as mock_execute:
+            mock_execute.return_value = {"status": "complete", "total_entities": 0}
+
+            await coordinator.async_execute_overview_step(6, "test-session-123")
+
+        coordinator.registry_adapter.async_build_snapshot.assert_awaited_once()
+        mock_execute.assert_called_once_with(6, "test-session-123", False, snapshot)
+
     def test_execute_overview_step_invalid_step(
         self, mock_hass: MagicMock, mock_config_entry: MagicMock
     ):
@@ -347,6 +366,23 @@ class TestCoordinatorServiceDelegation:
             assert result == "DELETE FROM states WHERE..."
             mock_gen.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_async_generate_delete_sql_runs_in_executor(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test SQL and the precise storage estimate are computed in one executor job."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+
+        with patch.object(coordinator, "generate_delete_sql", return_value="DELETE ...;"), \
+             patch.object(coordinator, "_calculate_entity_storage", return_value=1234) as mock_calc:
+            result = await coordinator.async_generate_delete_sql(
+                "sensor.test", "States", in_states_meta=True, precise=True
+            )
+
+        assert result == {"sql": "DELETE ...;", "storage_saved": 1234}
+        mock_hass.async_add_executor_job.assert_called_once()
+        assert mock_calc.call_args.kwargs["precise"] is True
+
     @pytest.mark.asyncio
     async def test_async_shutdown(
         self, mock_hass: MagicMock, mock_config_entry: MagicMock
@@ -383,6 +419,7 @@ class TestCoordinatorIntegration:
         """Test executing all steps in sequence with session tracking."""
         coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
         coordinator.db_service._engine = populated_sqlite_engine
+        coordinator._snapshot_store = MagicMock(async_load=AsyncMock(return_value=None))
 
         with patch("custom_components.statistics_orphan_finder.services.registry_adapter.er.async_get") as mock_er:
             with patch("custom_components.statistics_orphan_finder.services.registry_adapter.dr.async_get") as mock_dr:
@@ -468,10 +505,10 @@ class TestSessionIsolation:
 class TestSessionTimeout:
     """Test session timeout and cleanup features."""
 
-    def test_stale_session_cleanup(
+    async def test_stale_session_cleanup(
         self, mock_hass: MagicMock, mock_config_entry: MagicMock
     ):
-        """Test that stale sessions are cleaned up."""
+        """Test that stale sessions are cleaned up by the periodic cleanup."""
         coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
 
         # Create a session
@@ -481,11 +518,11 @@ class TestSessionTimeout:
 
         assert session_id1 in coordinator.session_manager._sessions
 
-        # Create another session after SESSION_TIMEOUT has passed
-        # This should trigger cleanup of the first session
+        # Create another session after SESSION_TIMEOUT has passed, then run the timer
         with patch("time.time", return_value=1000.0 + SESSION_TIMEOUT + 1):
             result2 = coordinator._init_step_data()
             session_id2 = result2["session_id"]
+            await coordinator.async_cleanup_sessions()
 
         # First session should be cleaned up
         assert session_id1 not in coordinator.session_manager._sessions
@@ -515,7 +552,7 @@ class TestSessionTimeout:
         # Timestamp should be updated
         assert updated_timestamp == 1010.0
 
-    def test_cleanup_only_stale_sessions(
+    async def test_cleanup_only_stale_sessions(
         self, mock_hass: MagicMock, mock_config_entry: MagicMock
     ):
         """Test that cleanup only removes stale sessions, not recent ones."""
@@ -531,10 +568,11 @@ class TestSessionTimeout:
             result2 = coordinator._init_step_data()
             session_id2 = result2["session_id"]
 
-        # Create third session (after timeout, triggers cleanup)
+        # Create third session after the timeout, then run the timer
         with patch("time.time", return_value=1000.0 + SESSION_TIMEOUT + 1):
             result3 = coordinator._init_step_data()
             session_id3 = result3["session_id"]
+            await coordinator.async_cleanup_sessions()
 
         # First session should be cleaned (stale)
         assert session_id1 not in coordinator.session_manager._sessions
@@ -544,6 +582,590 @@ class TestSessionTimeout:
         assert session_id3 in coordinator.session_manager._sessions
 
 
+class TestSharedStepQueries:
+    """Test concurrent sessions share in-flight step queries."""
+
+    def test_concurrent_sessions_scan_once(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test two sessions running step 2 together run one states scan."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from custom_components.statistics_orphan_finder.services import single_flight
+
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = MagicMock()
+        session_a = coordinator._init_step_data()["session_id"]
+        session_b = coordinator._init_step_data()["session_id"]
+
+        scan_started = threading.Event()
+        joined = threading.Event()
+        release = threading.Event()
+        scans = []
+
+        class JoinSignallingEvent(threading.Event):
+            """Signal when a second caller starts waiting for the in-flight scan."""
+
+            def wait(self, timeout=None):
+                joined.set()
+                return super().wait(timeout)
+
+        class SignallingCall(single_flight._Call):
+            def __init__(self):
+                super().__init__()
+                self.done = JoinSignallingEvent()
+
+        def slow_fetch(*args, **kwargs):
+            scans.append(1)
+            scan_started.set()
+            release.wait(5)
+            return {"sensor.temperature": {"count": 2, "last_update": None}}, {}
+
+        with patch.object(coordinator.entity_repository, "fetch_states_with_counts", side_effect=slow_fetch), \
+             patch.object(single_flight, "_Call", SignallingCall):
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                first = pool.submit(coordinator._execute_overview_step, 2, session_a)
+                assert scan_started.wait(5)
+                second = pool.submit(coordinator._execute_overview_step, 2, session_b)
+                assert joined.wait(5)
+                release.set()
+                results = [first.result(5), second.result(5)]
+
+        assert len(scans) == 1
+        assert coordinator._single_flight.shared_calls == 1
+        assert results[0] == results[1]
+        for session_id in (session_a, session_b):
+            entity_map = coordinator.session_manager.get_session_data(session_id)["entity_map"]
+            assert entity_map["sensor.temperature"]["states_count"] == 2
+
+
+class TestSessionMemoryBudget:
+    """Test session memory options and the cleanup timer."""
+
+    def test_options_configure_session_manager(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test the memory budget (MB) and spill options reach the SessionManager."""
+        mock_config_entry.options = {"session_memory_budget": 2, "session_spill_to_disk": True}
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+
+        assert coordinator.session_manager._memory_budget == 2 * 1024 * 1024
+        assert coordinator.session_manager._spill_to_disk is True
+
+    async def test_cleanup_skipped_during_shutdown(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test the timer does nothing once the coordinator is shutting down."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._is_shutting_down = True
+
+        with patch.object(coordinator.session_manager, "cleanup_stale_sessions") as cleanup:
+            await coordinator.async_cleanup_sessions()
+
+        cleanup.assert_not_called()
+
+
+class TestOverviewSnapshotPersistence:
+    """Test persistent overview snapshot handling in the coordinator."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_loaded_once_on_step_0(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test persisted snapshot is loaded on the first step 0 only."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        persisted = {
+            "source": coordinator.overview_snapshot.source,
+            "tables": {"states": {"min_id": 1, "max_id": 10, "rows": {"1": [10, 5.0]}}},
+        }
+        coordinator._snapshot_store = MagicMock(async_load=AsyncMock(return_value=persisted))
+
+        await coordinator.async_execute_overview_step(0)
+        await coordinator.async_execute_overview_step(0)
+
+        coordinator._snapshot_store.async_load.assert_awaited_once()
+        assert coordinator.overview_snapshot.plan("states", 1, 10) == ("cached", 10)
+
+    @pytest.mark.asyncio
+    async def test_snapshot_load_failure_is_not_fatal(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test a failing snapshot load still initializes the session."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._snapshot_store = MagicMock(async_load=AsyncMock(side_effect=ValueError("corrupt")))
+
+        result = await coordinator.async_execute_overview_step(0)
+
+        assert result["status"] == "initialized"
+
+    @pytest.mark.asyncio
+    async def test_snapshot_save_scheduled_after_aggregation_steps(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test steps 2, 4 and 5 schedule a delayed snapshot save."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = populated_sqlite_engine
+        coordinator._snapshot_store = MagicMock(async_load=AsyncMock(return_value=None))
+
+        session_id = (await coordinator.async_execute_overview_step(0))["session_id"]
+        for step in range(1, 6):
+            await coordinator.async_execute_overview_step(step, session_id)
+
+        assert coordinator._snapshot_store.async_delay_save.call_count == 3
+        data_func = coordinator._snapshot_store.async_delay_save.call_args[0][0]
+        assert set(data_func()["tables"]) == {"states", "statistics", "statistics_short_term"}
+
+
+class TestOverviewResultCache:
+    """Test caching of the finalized overview."""
+
+    def _run_all_steps(self, coordinator, force_refresh: bool = False) -> list[dict]:
+        """Run steps 0-8 synchronously and return all step results."""
+        results = [coordinator._execute_overview_step(0, None, force_refresh)]
+        session_id = results[0]["session_id"]
+        for step in range(1, 9):
+            results.append(coordinator._execute_overview_step(step, session_id))
+        return results
+
+    def test_second_run_served_from_cache(
+        self,
+        mock_hass: MagicMock,
+        mock_config_entry: MagicMock,
+        populated_sqlite_engine: Engine,
+        mock_entity_registry: MagicMock,
+        mock_device_registry: MagicMock,
+    ):
+        """Test a second overview returns the cached result without DB access."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = populated_sqlite_engine
+
+        with patch("custom_components.statistics_orphan_finder.services.registry_adapter.er.async_get", return_value=mock_entity_registry):
+            with patch("custom_components.statistics_orphan_finder.services.registry_adapter.dr.async_get", return_value=mock_device_registry):
+                first = self._run_all_steps(coordinator)
+
+                with patch.object(coordinator, "_get_engine", side_effect=AssertionError("DB used")):
+                    second = self._run_all_steps(coordinator)
+
+        assert first[0]["cached"] is False
+        assert first[8]["cached"] is False
+        assert second[0]["cached"] is True
+        assert second[0]["cache_age_seconds"] >= 0
+        assert all(r == {"status": "complete", "cached": True} for r in second[1:8])
+        assert second[8]["cached"] is True
+        assert second[8]["entities"] == first[8]["entities"]
+        assert second[8]["summary"] == first[8]["summary"]
+        assert second[0]["session_id"] not in coordinator.session_manager._sessions
+
+    def test_force_refresh_bypasses_cache(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test force_refresh drops the cached overview."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._overview_cache = {"entities": [], "summary": {}}
+        coordinator._overview_cache_time = time.time()
+
+        result = coordinator._init_step_data(force_refresh=True)
+
+        assert result["cached"] is False
+        assert coordinator._overview_cache is None
+
+    def test_cache_expires_after_ttl(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test cached overview older than the TTL is not served."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._overview_cache = {"entities": [], "summary": {}}
+        coordinator._overview_cache_time = time.time() - coordinator._overview_cache_ttl - 1
+
+        result = coordinator._init_step_data()
+
+        assert result["cached"] is False
+
+    def test_cache_disabled_with_zero_ttl(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test a TTL of 0 from options disables caching."""
+        mock_config_entry.options = {"overview_cache_ttl": 0}
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._overview_cache = {"entities": [], "summary": {}}
+        coordinator._overview_cache_time = time.time()
+
+        assert coordinator._init_step_data()["cached"] is False
+
+    def test_registry_update_invalidates_cache(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test entity registry updates drop the cached overview."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._overview_cache = {"entities": [], "summary": {}}
+        coordinator._overview_cache_time = time.time()
+
+        coordinator.async_handle_entity_registry_updated(MagicMock())
+
+        assert coordinator._init_step_data()["cached"] is False
+
+
+class TestStorageStepsReuseCounts:
+    """Test steps 7 and 8 estimate storage without scanning fact tables."""
+
+    def test_no_fact_table_queries_after_step_5(
+        self,
+        mock_hass: MagicMock,
+        mock_config_entry: MagicMock,
+        populated_sqlite_engine: Engine,
+        mock_entity_registry: MagicMock,
+        mock_device_registry: MagicMock,
+    ):
+        """Test steps 7-8 reuse session counts instead of COUNT(*) queries."""
+        from sqlalchemy import event
+
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = populated_sqlite_engine
+
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        with patch("custom_components.statistics_orphan_finder.services.registry_adapter.er.async_get", return_value=mock_entity_registry):
+            with patch("custom_components.statistics_orphan_finder.services.registry_adapter.dr.async_get", return_value=mock_device_registry):
+                session_id = coordinator._execute_overview_step(0)["session_id"]
+                for step in range(1, 7):
+                    coordinator._execute_overview_step(step, session_id)
+
+                event.listen(populated_sqlite_engine, "before_cursor_execute", before_execute)
+                try:
+                    step_7 = coordinator._execute_overview_step(7, session_id)
+                    step_8 = coordinator._execute_overview_step(8, session_id)
+                finally:
+                    event.remove(populated_sqlite_engine, "before_cursor_execute", before_execute)
+
+        assert step_7["deleted_storage_bytes"] > 0
+        assert statements == []
+
+        # Every entity carries its storage estimate split by table
+        entities = {e["entity_id"]: e for e in step_8["entities"]}
+        for entity in entities.values():
+            assert entity["estimated_bytes"] == (
+                entity["estimated_states_bytes"]
+                + entity["estimated_short_term_bytes"]
+                + entity["estimated_long_term_bytes"]
+            )
+        temperature = entities["sensor.temperature"]
+        assert temperature["estimated_states_bytes"] > 0
+        assert temperature["estimated_short_term_bytes"] > 0
+        assert temperature["estimated_long_term_bytes"] > temperature["estimated_short_term_bytes"]
+        deleted_total = sum(
+            e["estimated_bytes"] for e in entities.values()
+            if not e["in_entity_registry"] and not e["in_state_machine"]
+            and (e["in_states_meta"] or e["in_statistics_meta"])
+        )
+        assert deleted_total == step_7["deleted_storage_bytes"]
+
+        page = coordinator._entity_page_index.get_page(sort_key="estimated_bytes", direction="desc")
+        sizes = [e["estimated_bytes"] for e in page["entities"]]
+        assert sizes == sorted(sizes, reverse=True)
+
+
+def _remote_engine() -> MagicMock:
+    """Return a stand-in engine for a PostgreSQL recorder database."""
+    engine = MagicMock()
+    engine.dialect.name = "postgresql"
+    return engine
+
+
+class TestParallelSteps:
+    """Test running steps 1-5 concurrently."""
+
+    async def test_parallel_matches_sequential(
+        self,
+        mock_hass: MagicMock,
+        mock_config_entry: MagicMock,
+        populated_sqlite_engine: Engine,
+        mock_entity_registry: MagicMock,
+        mock_device_registry: MagicMock,
+    ):
+        """Test parallel mode produces the same overview as sequential steps."""
+        sequential = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        sequential.db_service._engine = populated_sqlite_engine
+        parallel = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        parallel.db_service._engine = populated_sqlite_engine
+
+        with patch("custom_components.statistics_orphan_finder.services.registry_adapter.er.async_get", return_value=mock_entity_registry):
+            with patch("custom_components.statistics_orphan_finder.services.registry_adapter.dr.async_get", return_value=mock_device_registry):
+                seq_session = sequential._execute_overview_step(0)["session_id"]
+                seq_results = [sequential._execute_overview_step(step, seq_session) for step in range(1, 9)]
+
+                par_session = parallel._execute_overview_step(0)["session_id"]
+                with patch.object(parallel, "_async_schedule_snapshot_save") as mock_save:
+                    par_result = await parallel.async_execute_parallel_steps(par_session)
+
+                # Steps 1-5 are answered from the session without querying again
+                with patch.object(parallel.entity_repository, "fetch_states_meta", side_effect=AssertionError("re-queried")):
+                    replayed = [parallel._execute_overview_step(step, par_session) for step in range(1, 6)]
+                par_final = [parallel._execute_overview_step(step, par_session) for step in range(6, 9)]
+
+        assert par_result["status"] == "complete"
+        assert par_result["completed_steps"] == [1, 2, 3, 4, 5]
+        assert [par_result["steps"][step] for step in range(1, 6)] == seq_results[:5]
+        assert replayed == seq_results[:5]
+        assert par_final[-1]["entities"] == seq_results[-1]["entities"]
+        assert par_final[-1]["summary"] == seq_results[-1]["summary"]
+        mock_save.assert_called_once()
+
+    async def test_remote_database_queries_run_concurrently(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test the five reads overlap on a non-SQLite database."""
+        async def run_in_thread(func, *args):
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+        mock_hass.async_add_executor_job = AsyncMock(side_effect=run_in_thread)
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._get_engine = MagicMock(return_value=_remote_engine())
+        coordinator.db_service.get_db_type = MagicMock(side_effect=AssertionError("resolved on the loop"))
+        session_id = coordinator._init_step_data()["session_id"]
+
+        # Every query waits until all five are running at the same time
+        barrier = threading.Barrier(5, timeout=5)
+        raw = {
+            1: {"sensor.a"},
+            2: ({"sensor.a": {"count": 3, "last_update": None}}, {}),
+            3: {"sensor.a": 7},
+            4: {},
+            5: {"sensor.a": {"count": 2, "last_update": "2026-01-01T00:00:00+00:00"}},
+        }
+
+        def make_query(step):
+            def query():
+                barrier.wait()
+                return raw[step]
+            return query
+
+        with patch.object(coordinator, "_parallel_step_queries", return_value={step: make_query(step) for step in raw}):
+            with patch.object(coordinator, "_async_schedule_snapshot_save"):
+                result = await coordinator.async_execute_parallel_steps(session_id)
+
+        assert result["status"] == "complete"
+        entity = coordinator.session_manager.get_session_data(session_id)["entity_map"]["sensor.a"]
+        assert entity["in_states_meta"] and entity["in_states"]
+        assert entity["states_count"] == 3
+        assert entity["metadata_id"] == 7
+        assert entity["stats_long_count"] == 2
+
+    async def test_remote_reads_bounded_by_pool_size(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test parallel reads of concurrent sessions never exceed the query slots."""
+        async def run_in_thread(func, *args):
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+        mock_hass.async_add_executor_job = AsyncMock(side_effect=run_in_thread)
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._get_engine = MagicMock(return_value=_remote_engine())
+        coordinator._parallel_query_slots = asyncio.Semaphore(2)
+        sessions = [coordinator._init_step_data()["session_id"] for _ in range(2)]
+
+        running = 0
+        peak = 0
+        counter_lock = threading.Lock()
+        raw = {1: set(), 2: ({}, {}), 3: {}, 4: {}, 5: {}}
+
+        def make_query(step):
+            def query():
+                nonlocal running, peak
+                with counter_lock:
+                    running += 1
+                    peak = max(peak, running)
+                time.sleep(0.01)
+                with counter_lock:
+                    running -= 1
+                return raw[step]
+            return query
+
+        with patch.object(coordinator, "_parallel_step_queries", side_effect=lambda engine: {step: make_query(step) for step in raw}):
+            with patch.object(coordinator, "_async_schedule_snapshot_save"):
+                results = await asyncio.gather(
+                    *(coordinator.async_execute_parallel_steps(session_id) for session_id in sessions)
+                )
+
+        assert [result["status"] for result in results] == ["complete", "complete"]
+        assert peak == 2
+
+    async def test_parallel_requires_valid_session(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test parallel mode rejects unknown sessions."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+
+        with pytest.raises(ValueError):
+            await coordinator.async_execute_parallel_steps("missing")
+
+
+class TestStreamOverview:
+    """Test the one-shot overview with progress events."""
+
+    async def _collect(self, coordinator, **kwargs) -> list[tuple[str, dict]]:
+        return [event async for event in coordinator.async_stream_overview(**kwargs)]
+
+    async def test_stream_reports_each_step_then_result(
+        self,
+        mock_hass: MagicMock,
+        mock_config_entry: MagicMock,
+        populated_sqlite_engine: Engine,
+        mock_entity_registry: MagicMock,
+        mock_device_registry: MagicMock,
+    ):
+        """Test one progress event per step followed by the final result."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = populated_sqlite_engine
+        coordinator._snapshot_store = MagicMock(async_load=AsyncMock(return_value=None))
+
+        with patch("custom_components.statistics_orphan_finder.services.registry_adapter.er.async_get", return_value=mock_entity_registry):
+            with patch("custom_components.statistics_orphan_finder.services.registry_adapter.dr.async_get", return_value=mock_device_registry):
+                events = await self._collect(coordinator)
+
+        progress = [payload for name, payload in events if name == "progress"]
+        assert [p["step"] for p in progress] == list(range(1, 9))
+        assert all(p["elapsed_ms"] >= 0 and p["total_steps"] == 8 for p in progress)
+        assert progress[0]["entities_found"] == 4
+
+        name, result = events[-1]
+        assert name == "result"
+        assert result["cached"] is False
+        assert len(result["entities"]) == progress[-1]["total_entities"]
+        assert coordinator.session_manager._sessions == {}
+
+    async def test_stream_serves_cached_overview(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test a fresh cached overview is returned without running steps."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._overview_cache = {"entities": [], "summary": {}}
+        coordinator._overview_cache_time = time.time()
+
+        events = await self._collect(coordinator)
+
+        assert len(events) == 1
+        assert events[0][0] == "result"
+        assert events[0][1]["cached"] is True
+
+    async def test_stream_error_cleans_up_session(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test a failing step propagates and leaves no session behind."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._snapshot_store = MagicMock(async_load=AsyncMock(return_value=None))
+        coordinator.registry_adapter.async_build_snapshot = AsyncMock(return_value=None)
+
+        with patch.object(coordinator, "_fetch_step_3_statistics_meta", side_effect=RuntimeError("boom")):
+            with patch.object(coordinator, "_fetch_step_1_states_meta", return_value={"status": "complete"}):
+                with patch.object(coordinator, "_fetch_step_2_states", return_value={"status": "complete"}):
+                    with pytest.raises(RuntimeError, match="boom"):
+                        await self._collect(coordinator)
+
+        assert coordinator.session_manager._sessions == {}
+
+
+    async def test_stream_session_survives_memory_budget(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test the running pipeline's session is locked, so the budget cannot evict it."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._snapshot_store = MagicMock(async_load=AsyncMock(return_value=None))
+        coordinator.registry_adapter.async_build_snapshot = AsyncMock(return_value=None)
+        coordinator.session_manager._memory_budget = 1
+
+        def fill_and_enforce(session_id):
+            entity_map = coordinator.session_manager.get_session_data(session_id)["entity_map"]
+            entity_map["sensor.a"]["in_states_meta"] = True
+            assert coordinator.session_manager.get_lock(session_id).locked()
+            # Another tab's cleanup or step 0 enforcing the budget
+            coordinator.session_manager.enforce_memory_budget()
+            assert coordinator.session_manager.validate_session(session_id)
+            return {"status": "complete"}
+
+        final = {"entities": [], "summary": {}}
+        with patch.object(coordinator, "_fetch_step_1_states_meta", side_effect=fill_and_enforce), \
+             patch.object(coordinator, "_fetch_step_2_states", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_3_statistics_meta", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_4_statistics_short_term", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_5_statistics_long_term", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_6_enrich_with_registry", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_7_calculate_deleted_storage", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_8_finalize", return_value=final):
+            events = await self._collect(coordinator)
+
+        assert events[-1] == ("result", final)
+        assert coordinator.session_manager._sessions == {}
+
+    async def test_stream_enriches_from_loop_snapshot(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test the registry snapshot is taken before the executor job and used by step 6."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator._snapshot_store = MagicMock(async_load=AsyncMock(return_value=None))
+        snapshot = MagicMock()
+        coordinator.registry_adapter.async_build_snapshot = AsyncMock(return_value=snapshot)
+        coordinator.registry_adapter.enrich_entities = MagicMock(return_value=[])
+        final = {"entities": [], "summary": {}}
+
+        with patch.object(coordinator, "_fetch_step_1_states_meta", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_2_states", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_3_statistics_meta", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_4_statistics_short_term", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_5_statistics_long_term", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_7_calculate_deleted_storage", return_value={"status": "complete"}), \
+             patch.object(coordinator, "_fetch_step_8_finalize", return_value=final):
+            events = await self._collect(coordinator)
+
+        assert events[-1] == ("result", final)
+        coordinator.registry_adapter.async_build_snapshot.assert_awaited_once()
+        assert coordinator.registry_adapter.enrich_entities.call_args.args[1] is snapshot
+
+
+class TestEntitiesPage:
+    """Test paged access to the finalized overview."""
+
+    async def test_no_page_before_overview(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Test entities_page has nothing to serve before step 8 ran."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+
+        assert await coordinator.async_get_entities_page(0, 10, "entity_id", "asc", {}) is None
+
+    async def test_page_served_from_finalized_overview(
+        self,
+        mock_hass: MagicMock,
+        mock_config_entry: MagicMock,
+        populated_sqlite_engine: Engine,
+        mock_entity_registry: MagicMock,
+        mock_device_registry: MagicMock,
+    ):
+        """Test step 8 builds the page index over the finalized entities."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = populated_sqlite_engine
+
+        with patch("custom_components.statistics_orphan_finder.services.registry_adapter.er.async_get", return_value=mock_entity_registry):
+            with patch("custom_components.statistics_orphan_finder.services.registry_adapter.dr.async_get", return_value=mock_device_registry):
+                session_id = coordinator._execute_overview_step(0)["session_id"]
+                for step in range(1, 9):
+                    result = coordinator._execute_overview_step(step, session_id)
+
+        with patch.object(coordinator, "_get_engine", side_effect=AssertionError("DB used")):
+            page = await coordinator.async_get_entities_page(0, 2, "entity_id", "desc", {})
+
+        expected = sorted((e["entity_id"] for e in result["entities"]), reverse=True)[:2]
+        assert [e["entity_id"] for e in page["entities"]] == expected
+        assert page["total"] == len(result["entities"])
+
+        coordinator.async_handle_entity_registry_updated(MagicMock())
+
+        assert await coordinator.async_get_entities_page(0, 2, "entity_id", "desc", {}) is None
+
+
 class TestMessageHistogram:
     """Tests for message histogram generation."""
 
@@ -690,6 +1312,120 @@ class TestMessageHistogram:
         assert result["hourly_counts"][23] == 1
         assert result["total_messages"] == 5
 
+    @pytest.mark.asyncio
+    async def test_repeated_histogram_served_from_cache(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, sqlite_engine: Engine
+    ):
+        """Test a repeated hover reuses the cached closed hours and reports cache stats."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = sqlite_engine
+
+        self._insert_states(sqlite_engine, "sensor.hist", hours=24, hour_indexes=[0, 12])
+
+        first = await coordinator.async_get_message_histogram("sensor.hist", 24)
+        second = await coordinator.async_get_message_histogram("sensor.hist", 24)
+
+        assert second["hourly_counts"] == first["hourly_counts"]
+        assert second["total_messages"] == 2
+        assert second["cache_stats"]["hits"] == 1
+        assert second["cache_stats"]["series"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_get_message_histograms_batch(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, sqlite_engine: Engine
+    ):
+        """Test the batched histogram returns one series per requested entity."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = sqlite_engine
+
+        self._insert_states(sqlite_engine, "sensor.hist", hours=24, hour_indexes=[23], count_per_bucket=3)
+
+        result = await coordinator.async_get_message_histograms(["sensor.hist", "sensor.other"], 3600, 24)
+
+        assert result["histograms"]["sensor.hist"]["total_messages"] == 3
+        assert result["histograms"]["sensor.other"]["total_messages"] == 0
+        assert len(result["histograms"]["sensor.hist"]["counts"]) == 24
+
+
+class TestNoisyEntities:
+    """Tests for the noisy entity ranking."""
+
+    @pytest.mark.asyncio
+    async def test_async_get_noisy_entities(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test the ranking runs against the configured database."""
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = populated_sqlite_engine
+
+        result = await coordinator.async_get_noisy_entities("7d", 3, "writes")
+
+        assert result["window"] == "7d"
+        assert len(result["entities"]) <= 3
+        writes = [entity["writes"] for entity in result["entities"]]
+        assert writes == sorted(writes, reverse=True)
+
+
+class TestBulkDeleteSql:
+    """Tests for bulk DELETE generation."""
+
+    @pytest.mark.asyncio
+    async def test_async_generate_bulk_delete_sql(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test bulk generation runs against the configured database."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = populated_sqlite_engine
+
+        result = await coordinator.async_generate_bulk_delete_sql(["sensor.temperature", "sensor.humidity"])
+
+        assert result["states_metadata_ids"] == 2
+        assert result["statistics_metadata_ids"] == 2
+        assert "DELETE FROM states WHERE metadata_id IN (1, 2);" in result["sql"]
+
+    @pytest.mark.asyncio
+    async def test_generated_delete_sql_marks_snapshot_for_recount(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test the snapshot and histogram cache drop entities that delete SQL was generated for."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = populated_sqlite_engine
+        coordinator.histogram_cache.store(1, 3600, 100, [1, 2])
+        coordinator.histogram_cache.store(2, 3600, 100, [3])
+
+        await coordinator.async_generate_bulk_delete_sql(["sensor.temperature"])
+
+        assert coordinator.histogram_cache.get(1, 3600, 100) is None
+        assert coordinator.histogram_cache.get(2, 3600, 100) == [3]
+        assert coordinator.overview_snapshot.pending_recount("states") == [1]
+        assert coordinator.overview_snapshot.pending_recount("statistics") == [1]
+        assert coordinator.overview_snapshot.pending_recount("statistics_short_term") == [1]
+        mock_hass.add_job.assert_called_once_with(coordinator._async_save_invalidated_snapshot)
+
+    async def test_delete_sql_before_snapshot_load_keeps_persisted_snapshot(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, populated_sqlite_engine: Engine
+    ):
+        """Test marks set before the first overview are merged into the stored snapshot."""
+        mock_config_entry.data["db_url"] = "sqlite:///:memory:"
+        coordinator = StatisticsOrphanCoordinator(mock_hass, mock_config_entry, "2.0.0-test")
+        coordinator.db_service._engine = populated_sqlite_engine
+        persisted = {
+            "source": coordinator.overview_snapshot.source,
+            "tables": {"states": {"min_id": 1, "max_id": 4, "rows": {"1": [2, 100.0], "2": [1, 50.0]}}},
+        }
+        coordinator._snapshot_store = MagicMock(async_load=AsyncMock(return_value=persisted))
+
+        await coordinator.async_generate_bulk_delete_sql(["sensor.temperature"])
+        save_job = mock_hass.add_job.call_args.args[0]
+        await save_job()
+
+        saved = coordinator._snapshot_store.async_delay_save.call_args.args[0]()
+        assert saved["tables"]["states"]["rows"] == {"1": [2, 100.0], "2": [1, 50.0]}
+        assert list(saved["recount"]["states"]) == ["1"]
+        assert coordinator.overview_snapshot.pending_recount("states") == [1]
+
 
 class TestCoordinatorErrorHandling:
     """Tests for coordinator defensive error handling."""
@@ -774,7 +1510,7 @@ class TestCoordinatorErrorHandling:
 
         # Mock batch calculation to return storage for both entities
         with patch.object(coordinator, "_get_engine", return_value=mock_engine), patch.object(
-            coordinator.storage_calculator, "calculate_batch_storage",
+            coordinator.storage_calculator, "calculate_storage_from_counts",
             return_value={"sensor.fail": 0, "sensor.ok": 500}
         ) as mock_calc:
             result = await coordinator.async_execute_overview_step(7, session_id)
@@ -874,7 +1610,7 @@ class TestOriginDetermination:
 
         # Mock batch calculation
         with patch.object(coordinator, "_get_engine", return_value=mock_engine), patch.object(
-            coordinator.storage_calculator, "calculate_batch_storage",
+            coordinator.storage_calculator, "calculate_storage_from_counts",
             return_value={"sensor.both": 111}
         ) as mock_calc:
             result = await coordinator.async_execute_overview_step(7, session_id)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
 
 import pytest
@@ -52,7 +52,9 @@ class TestSetup:
                 mock_js_file.stat.return_value.st_mtime = 1234567890
                 mock_path.return_value.__truediv__.return_value = mock_js_file
 
-                with patch("custom_components.statistics_orphan_finder.frontend"):
+                with patch("custom_components.statistics_orphan_finder.frontend"), patch(
+                    "custom_components.statistics_orphan_finder.async_track_time_interval"
+                ) as mock_track:
                     result = await async_setup_entry(mock_hass, mock_config_entry)
 
         assert result is True
@@ -61,6 +63,15 @@ class TestSetup:
         assert "view" in mock_hass.data[DOMAIN][mock_config_entry.entry_id]
         mock_hass.http.register_view.assert_called_once()
 
+        # Cached overview is invalidated on entity registry updates
+        listened_events = [call.args[0] for call in mock_hass.bus.async_listen.call_args_list]
+        assert "entity_registry_updated" in listened_events
+
+        # Stale sessions are expired by a periodic timer
+        coordinator = mock_hass.data[DOMAIN][mock_config_entry.entry_id]["coordinator"]
+        mock_track.assert_called_once()
+        assert mock_track.call_args.args[1] == coordinator.async_cleanup_sessions
+
     @pytest.mark.asyncio
     async def test_async_unload_entry_calls_shutdown(
         self, mock_hass: MagicMock, mock_config_entry: MagicMock
@@ -151,7 +162,7 @@ class TestStatisticsOrphanView:
 
         assert isinstance(response, web.Response)
         assert response.status == 200
-        mock_coordinator.async_get_database_size.assert_called_once()
+        mock_coordinator.async_get_database_size.assert_called_once_with(exact=False)
 
     @pytest.mark.asyncio
     async def test_get_overview_step_0(self, mock_hass: MagicMock):
@@ -174,7 +185,64 @@ class TestStatisticsOrphanView:
         response = await view.get(mock_request)
 
         assert response.status == 200
-        mock_coordinator.async_execute_overview_step.assert_called_once_with(0, None)
+        mock_coordinator.async_execute_overview_step.assert_called_once_with(0, None, force_refresh=False)
+
+    @pytest.mark.asyncio
+    async def test_get_overview_step_0_force_refresh(self, mock_hass: MagicMock):
+        """Test force_refresh query parameter is passed to the coordinator."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_execute_overview_step = AsyncMock(
+            return_value={"status": "initialized", "session_id": "test-session", "cached": False}
+        )
+
+        mock_hass.data = {
+            DOMAIN: {"test_entry": {"coordinator": mock_coordinator}}
+        }
+
+        view = StatisticsOrphanView(mock_hass, "test_entry")
+
+        mock_request = MagicMock()
+        mock_request.query = {
+            "action": "entity_storage_overview_step",
+            "step": "0",
+            "force_refresh": "true",
+        }
+
+        response = await view.get(mock_request)
+
+        assert response.status == 200
+        mock_coordinator.async_execute_overview_step.assert_called_once_with(0, None, force_refresh=True)
+
+    @pytest.mark.asyncio
+    async def test_get_overview_step_1_parallel(self, mock_hass: MagicMock):
+        """Test parallel=true on step 1 runs steps 1-5 concurrently."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_execute_parallel_steps = AsyncMock(
+            return_value={"status": "complete", "completed_steps": [1, 2, 3, 4, 5]}
+        )
+        mock_coordinator.async_execute_overview_step = AsyncMock()
+
+        mock_hass.data = {
+            DOMAIN: {"test_entry": {"coordinator": mock_coordinator}}
+        }
+
+        view = StatisticsOrphanView(mock_hass, "test_entry")
+
+        mock_request = MagicMock()
+        mock_request.query = {
+            "action": "entity_storage_overview_step",
+            "step": "1",
+            "session_id": "test-session",
+            "parallel": "true",
+        }
+
+        response = await view.get(mock_request)
+
+        assert response.status == 200
+        mock_coordinator.async_execute_parallel_steps.assert_awaited_once_with("test-session")
+        mock_coordinator.async_execute_overview_step.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_overview_step_requires_session_id(self, mock_hass: MagicMock):
@@ -201,8 +269,9 @@ class TestStatisticsOrphanView:
         """Test GET request with generate_delete_sql action."""
         mock_coordinator = MagicMock()
         mock_coordinator._is_shutting_down = False
-        mock_coordinator.generate_delete_sql = Mock(return_value="DELETE FROM states WHERE...")
-        mock_coordinator._calculate_entity_storage = Mock(return_value=50000)
+        mock_coordinator.async_generate_delete_sql = AsyncMock(
+            return_value={"sql": "DELETE FROM states WHERE...", "storage_saved": 50000}
+        )
 
         mock_hass.data = {
             DOMAIN: {"test_entry": {"coordinator": mock_coordinator}}
@@ -222,8 +291,13 @@ class TestStatisticsOrphanView:
         response = await view.get(mock_request)
 
         assert response.status == 200
-        mock_coordinator.generate_delete_sql.assert_called_once()
-        mock_coordinator._calculate_entity_storage.assert_called_once()
+        mock_coordinator.async_generate_delete_sql.assert_awaited_once_with(
+            entity_id="sensor.test",
+            origin="States",
+            in_states_meta=True,
+            in_statistics_meta=False,
+            precise=False
+        )
 
     @pytest.mark.asyncio
     async def test_invalid_action_returns_400(self, mock_hass: MagicMock):
@@ -451,6 +525,124 @@ class TestMessageHistogramEndpoint:
 
         assert response.status == 500
 
+    @pytest.mark.asyncio
+    async def test_get_noisy_entities(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Noisy entity ranking should pass window, limit and rank key."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_get_noisy_entities = AsyncMock(return_value={"entities": []})
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
+
+        view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
+        mock_request = MagicMock()
+        mock_request.query = {"action": "noisy_entities", "window": "7d", "limit": "5", "rank_by": "bytes"}
+
+        response = await view.get(mock_request)
+
+        assert response.status == 200
+        mock_coordinator.async_get_noisy_entities.assert_awaited_once_with("7d", 5, "bytes")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "query",
+        [{"window": "2h"}, {"rank_by": "rows"}, {"limit": "x"}, {"limit": "0"}],
+    )
+    async def test_get_noisy_entities_invalid(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, query: dict
+    ):
+        """Invalid ranking parameters should return 400."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_get_noisy_entities = AsyncMock()
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
+
+        view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
+        mock_request = MagicMock()
+        mock_request.query = {"action": "noisy_entities", **query}
+
+        response = await view.get(mock_request)
+
+        assert response.status == 400
+        mock_coordinator.async_get_noisy_entities.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_get_entity_message_histograms_batch(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Batched request should pass every entity_id, the bucket and the range."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_get_message_histograms = AsyncMock(
+            return_value={"histograms": {}, "bucket_seconds": 300, "buckets": 24, "time_range_hours": 2}
+        )
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
+
+        view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
+        mock_request = MagicMock()
+        mock_request.query = {
+            "action": "entity_message_histograms",
+            "entity_ids": "sensor.a, sensor.b",
+            "bucket": "300",
+            "hours": "2",
+        }
+
+        response = await view.get(mock_request)
+
+        assert response.status == 200
+        mock_coordinator.async_get_message_histograms.assert_awaited_once_with(
+            ["sensor.a", "sensor.b"], 300, 2
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "query",
+        [
+            {"entity_ids": ""},
+            {"entity_ids": "sensor.a", "bucket": "60"},
+            {"entity_ids": "sensor.a", "hours": "abc"},
+            {"entity_ids": "sensor.a,invalid"},
+            {"entity_ids": "sensor.a", "hours": "241"},
+        ],
+    )
+    async def test_get_entity_message_histograms_invalid(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, query: dict
+    ):
+        """Invalid batched requests should return 400 without querying."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_get_message_histograms = AsyncMock()
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
+
+        view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
+        mock_request = MagicMock()
+        mock_request.query = {"action": "entity_message_histograms", **query}
+
+        response = await view.get(mock_request)
+
+        assert response.status == 400
+        mock_coordinator.async_get_message_histograms.assert_not_awaited()
+
+    async def test_get_entity_message_histograms_reports_max_hours(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """A range beyond the cap should report the longest supported range."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
+
+        view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
+        mock_request = MagicMock()
+        mock_request.query = {"action": "entity_message_histograms", "entity_ids": "sensor.a", "hours": "720"}
+
+        response = await view.get(mock_request)
+
+        assert response.status == 400
+        payload = json.loads(response.text or response.body.decode())
+        assert payload["max_hours"] == 240
+        assert "240" in payload["error"]
+
 
 class TestGenerateDeleteSQLEndpoint:
     """Tests for the generate_delete_sql HTTP endpoint."""
@@ -477,8 +669,9 @@ class TestGenerateDeleteSQLEndpoint:
         """All origin combinations return SQL and storage estimation."""
         mock_coordinator = MagicMock()
         mock_coordinator._is_shutting_down = False
-        mock_coordinator.generate_delete_sql = Mock(return_value="DELETE ...;")
-        mock_coordinator._calculate_entity_storage = Mock(return_value=1234)
+        mock_coordinator.async_generate_delete_sql = AsyncMock(
+            return_value={"sql": "DELETE ...;", "storage_saved": 1234}
+        )
 
         mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
         view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
@@ -498,8 +691,7 @@ class TestGenerateDeleteSQLEndpoint:
         payload = json.loads(response.text or response.body.decode())
         assert "sql" in payload
         assert payload["storage_saved"] == 1234
-        mock_coordinator.generate_delete_sql.assert_called_once()
-        mock_coordinator._calculate_entity_storage.assert_called_once()
+        mock_coordinator.async_generate_delete_sql.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_generate_delete_sql_missing_parameters(
@@ -525,8 +717,7 @@ class TestGenerateDeleteSQLEndpoint:
         """ValueError from generator returns 400."""
         mock_coordinator = MagicMock()
         mock_coordinator._is_shutting_down = False
-        mock_coordinator.generate_delete_sql = Mock(side_effect=ValueError("bad"))
-        mock_coordinator._calculate_entity_storage = Mock(return_value=0)
+        mock_coordinator.async_generate_delete_sql = AsyncMock(side_effect=ValueError("bad"))
 
         mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
         view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
@@ -549,8 +740,7 @@ class TestGenerateDeleteSQLEndpoint:
         """Unexpected errors should return 500."""
         mock_coordinator = MagicMock()
         mock_coordinator._is_shutting_down = False
-        mock_coordinator.generate_delete_sql = Mock(side_effect=RuntimeError("boom"))
-        mock_coordinator._calculate_entity_storage = Mock(return_value=0)
+        mock_coordinator.async_generate_delete_sql = AsyncMock(side_effect=RuntimeError("boom"))
 
         mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
         view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
@@ -567,6 +757,63 @@ class TestGenerateDeleteSQLEndpoint:
         assert response.status == 500
 
 
+class TestBulkDeleteSQLEndpoint:
+    """Tests for the generate_bulk_delete_sql POST endpoint."""
+
+    def _view(self, mock_hass: MagicMock, mock_config_entry: MagicMock, result: dict | None = None):
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_generate_bulk_delete_sql = AsyncMock(return_value=result or {})
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
+        return StatisticsOrphanView(mock_hass, mock_config_entry.entry_id), mock_coordinator
+
+    @pytest.mark.asyncio
+    async def test_generate_bulk_delete_sql(self, mock_hass: MagicMock, mock_config_entry: MagicMock):
+        """A JSON list of entity_ids is passed to the coordinator."""
+        view, mock_coordinator = self._view(
+            mock_hass, mock_config_entry, {"sql": "BEGIN;", "batches": 1, "missing": []}
+        )
+        mock_request = MagicMock()
+        mock_request.query = {"action": "generate_bulk_delete_sql"}
+        mock_request.json = AsyncMock(return_value={"entity_ids": ["sensor.a", "sensor.b"]})
+
+        response = await view.post(mock_request)
+
+        assert response.status == 200
+        assert json.loads(response.body)["batches"] == 1
+        mock_coordinator.async_generate_bulk_delete_sql.assert_awaited_once_with(["sensor.a", "sensor.b"])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "body",
+        [{}, {"entity_ids": []}, {"entity_ids": "sensor.a"}, {"entity_ids": [1]}, {"entity_ids": ["sensor"]}],
+    )
+    async def test_generate_bulk_delete_sql_invalid(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock, body: dict
+    ):
+        """Malformed entity_id lists return 400."""
+        view, mock_coordinator = self._view(mock_hass, mock_config_entry)
+        mock_request = MagicMock()
+        mock_request.query = {"action": "generate_bulk_delete_sql"}
+        mock_request.json = AsyncMock(return_value=body)
+
+        response = await view.post(mock_request)
+
+        assert response.status == 400
+        mock_coordinator.async_generate_bulk_delete_sql.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_post_unknown_action(self, mock_hass: MagicMock, mock_config_entry: MagicMock):
+        """Unknown POST actions return 400."""
+        view, _ = self._view(mock_hass, mock_config_entry)
+        mock_request = MagicMock()
+        mock_request.query = {"action": "database_size"}
+
+        response = await view.post(mock_request)
+
+        assert response.status == 400
+
+
 class TestOverviewStepsEndpoint:
     """Tests for the entity_storage_overview_step HTTP endpoint."""
 
@@ -594,9 +841,9 @@ class TestOverviewStepsEndpoint:
         payload = json.loads(response.text or response.body.decode())
         assert payload["step"] == step
         if step == 0:
-            mock_coordinator.async_execute_overview_step.assert_awaited_once_with(step, None)
+            mock_coordinator.async_execute_overview_step.assert_awaited_once_with(step, None, force_refresh=False)
         else:
-            mock_coordinator.async_execute_overview_step.assert_awaited_once_with(step, "session-123")
+            mock_coordinator.async_execute_overview_step.assert_awaited_once_with(step, "session-123", force_refresh=False)
 
     @pytest.mark.asyncio
     async def test_execute_overview_step_invalid_step(
@@ -633,6 +880,303 @@ class TestOverviewStepsEndpoint:
         assert response.status == 400
 
 
+    @pytest.mark.asyncio
+    async def test_execute_overview_step_ndjson_streams_entities(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """format=ndjson on the final step streams a header line plus one line per entity."""
+        entities = [{"entity_id": f"sensor.test_{i}", "states_count": i} for i in range(1203)]
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_execute_overview_step = AsyncMock(return_value={
+            "entities": entities,
+            "summary": {"total_entities": 1203},
+            "cached": False,
+            "cache_age_seconds": 0,
+        })
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
+        view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
+
+        mock_request = MagicMock()
+        mock_request.query = {
+            "action": "entity_storage_overview_step",
+            "step": "8",
+            "session_id": "session-123",
+            "format": "ndjson",
+        }
+
+        chunks = []
+
+        async def capture(self, data):
+            chunks.append(data)
+
+        with patch.object(web.StreamResponse, "prepare", AsyncMock()), \
+             patch.object(web.StreamResponse, "write", capture), \
+             patch.object(web.StreamResponse, "write_eof", AsyncMock()):
+            response = await view.get(mock_request)
+
+        assert isinstance(response, web.StreamResponse)
+        assert response.content_type == "application/x-ndjson"
+        # Header + 3 batches of at most 500 entities
+        assert len(chunks) == 4
+
+        lines = b"".join(chunks).decode().splitlines()
+        header = json.loads(lines[0])
+        assert header["total_entities"] == 1203
+        assert header["summary"] == {"total_entities": 1203}
+        assert "entities" not in header
+        assert [json.loads(line) for line in lines[1:]] == entities
+
+    @pytest.mark.asyncio
+    async def test_execute_overview_step_ndjson_non_final_step_returns_json(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Steps without an entity list ignore format=ndjson."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_execute_overview_step = AsyncMock(return_value={"status": "complete"})
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
+        view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
+
+        mock_request = MagicMock()
+        mock_request.query = {
+            "action": "entity_storage_overview_step",
+            "step": "3",
+            "session_id": "session-123",
+            "format": "ndjson",
+        }
+
+        response = await view.get(mock_request)
+
+        assert response.status == 200
+        assert response.content_type == "application/json"
+        assert json.loads(response.text) == {"status": "complete"}
+
+    @pytest.mark.asyncio
+    async def test_execute_overview_step_invalid_format(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Unknown response formats should return 400."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
+        view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
+
+        mock_request = MagicMock()
+        mock_request.query = {
+            "action": "entity_storage_overview_step",
+            "step": "8",
+            "session_id": "abc",
+            "format": "csv",
+        }
+
+        response = await view.get(mock_request)
+
+        assert response.status == 400
+        mock_coordinator.async_execute_overview_step.assert_not_called()
+
+
+class TestOverviewStreamEndpoint:
+    """Tests for the one-shot entity_storage_overview SSE endpoint."""
+
+    async def _stream(self, mock_hass, mock_config_entry, events, query=None, write_error=None):
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_stream_overview = MagicMock(return_value=events)
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": mock_coordinator}}}
+        view = StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
+
+        mock_request = MagicMock()
+        mock_request.query = {"action": "entity_storage_overview", **(query or {})}
+
+        chunks = []
+
+        async def capture(self, data):
+            if write_error is not None:
+                raise write_error
+            chunks.append(data)
+
+        with patch.object(web.StreamResponse, "prepare", AsyncMock()), \
+             patch.object(web.StreamResponse, "write", capture), \
+             patch.object(web.StreamResponse, "write_eof", AsyncMock()):
+            response = await view.get(mock_request)
+
+        return mock_coordinator, response, b"".join(chunks).decode()
+
+    @staticmethod
+    def _parse(body: str) -> list[tuple[str, dict]]:
+        events = []
+        for block in body.strip().split("\n\n"):
+            name_line, data_line = block.split("\n")
+            events.append((name_line[len("event: "):], json.loads(data_line[len("data: "):])))
+        return events
+
+    @pytest.mark.asyncio
+    async def test_overview_stream_emits_progress_and_result(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Progress events and the final result should be written as SSE."""
+        async def events():
+            yield "progress", {"step": 1, "elapsed_ms": 5}
+            yield "result", {"entities": [], "summary": {}, "cached": False}
+
+        coordinator, response, body = await self._stream(
+            mock_hass, mock_config_entry, events(), {"force_refresh": "true"}
+        )
+
+        assert response.content_type == "text/event-stream"
+        assert self._parse(body) == [
+            ("progress", {"step": 1, "elapsed_ms": 5}),
+            ("result", {"entities": [], "summary": {}, "cached": False}),
+        ]
+        coordinator.async_stream_overview.assert_called_once_with(force_refresh=True)
+
+    @pytest.mark.asyncio
+    async def test_overview_stream_reports_errors_as_event(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Pipeline errors should end the stream with an error event."""
+        async def events():
+            yield "progress", {"step": 1}
+            raise RuntimeError("boom")
+
+        _, _, body = await self._stream(mock_hass, mock_config_entry, events())
+
+        parsed = self._parse(body)
+        assert parsed[0] == ("progress", {"step": 1})
+        assert parsed[1][0] == "error"
+        assert "error_category" in parsed[1][1]
+
+
+    @pytest.mark.asyncio
+    async def test_overview_stream_client_disconnect(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """A disconnected client should end the stream quietly and close the events."""
+        closed = []
+
+        async def events():
+            try:
+                yield "progress", {"step": 1}
+                yield "progress", {"step": 2}
+            finally:
+                closed.append(True)
+
+        with patch("custom_components.statistics_orphan_finder._LOGGER") as mock_logger:
+            _, _, body = await self._stream(
+                mock_hass, mock_config_entry, events(),
+                write_error=ConnectionResetError("Cannot write to closing transport"),
+            )
+
+        assert body == ""
+        assert closed == [True]
+        mock_logger.error.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_overview_stream_closes_events_when_done(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """The events generator should be closed once the stream ends."""
+        closed = []
+
+        async def events():
+            try:
+                yield "result", {"entities": []}
+            finally:
+                closed.append(True)
+
+        await self._stream(mock_hass, mock_config_entry, events())
+
+        assert closed == [True]
+
+class TestEntitiesPageEndpoint:
+    """Tests for the entities_page HTTP endpoint."""
+
+    def _view(self, mock_hass: MagicMock, mock_config_entry: MagicMock, coordinator: MagicMock):
+        mock_hass.data = {DOMAIN: {mock_config_entry.entry_id: {"coordinator": coordinator}}}
+        return StatisticsOrphanView(mock_hass, mock_config_entry.entry_id)
+
+    @pytest.mark.asyncio
+    async def test_entities_page_passes_parameters(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Paging, sort and filter parameters should be forwarded to the coordinator."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_get_entities_page = AsyncMock(
+            return_value={"entities": [{"entity_id": "sensor.a"}], "total": 1}
+        )
+        view = self._view(mock_hass, mock_config_entry, mock_coordinator)
+
+        mock_request = MagicMock()
+        mock_request.query = {
+            "action": "entities_page",
+            "offset": "100",
+            "limit": "50",
+            "sort": "registry",
+            "direction": "desc",
+            "registry_status": "Disabled",
+            "domain": "sensor",
+            "origin": "",
+            "search": "temp",
+        }
+
+        response = await view.get(mock_request)
+
+        assert response.status == 200
+        assert json.loads(response.text)["total"] == 1
+        mock_coordinator.async_get_entities_page.assert_awaited_once_with(
+            100, 50, "registry_status", "desc",
+            {"registry_status": "Disabled", "domain": "sensor"}, "temp"
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "query",
+        [
+            {"offset": "abc"},
+            {"offset": "-1"},
+            {"limit": "0"},
+            {"limit": "100000"},
+            {"direction": "sideways"},
+            {"sort": "not_a_column"},
+        ],
+    )
+    async def test_entities_page_invalid_parameters(
+        self, query: dict, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Invalid paging or sort parameters should return 400."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_get_entities_page = AsyncMock()
+        view = self._view(mock_hass, mock_config_entry, mock_coordinator)
+
+        mock_request = MagicMock()
+        mock_request.query = {"action": "entities_page", **query}
+
+        response = await view.get(mock_request)
+
+        assert response.status == 400
+        mock_coordinator.async_get_entities_page.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_entities_page_without_overview_returns_404(
+        self, mock_hass: MagicMock, mock_config_entry: MagicMock
+    ):
+        """Requesting a page before any overview finished should return 404."""
+        mock_coordinator = MagicMock()
+        mock_coordinator._is_shutting_down = False
+        mock_coordinator.async_get_entities_page = AsyncMock(return_value=None)
+        view = self._view(mock_hass, mock_config_entry, mock_coordinator)
+
+        mock_request = MagicMock()
+        mock_request.query = {"action": "entities_page"}
+
+        response = await view.get(mock_request)
+
+        assert response.status == 404
+
+
 class TestSetupCopyAndUnload:
     """Tests for frontend copy and unload cleanup paths."""
 
@@ -655,7 +1199,9 @@ class TestSetupCopyAndUnload:
         mock_integration = AsyncMock()
         mock_integration.version = "1.0.0"
 
-        with patch("homeassistant.loader.async_get_integration", return_value=mock_integration):
+        with patch("homeassistant.loader.async_get_integration", return_value=mock_integration), patch(
+            "custom_components.statistics_orphan_finder.async_track_time_interval"
+        ):
             await async_setup_entry(hass, mock_config_entry)
 
         target_dir = tmp_path / "www/community/statistics_orphan_finder"